@@ -1,11 +1,11 @@
 from datetime import datetime
 
-from fastapi.security import SecurityScopes
 from src.application.auth.commands import LoginCommand
+from src.application.auth.exceptions import NotEnoughPermissionsException
 from src.application.auth.usecases.login import LoginWithSessionUseCase
 from src.domain.users.entities import UserRole
+from src.infrastructure.authentication.identity_provider import SessionIdentityProvider
 from src.infrastructure.di.container import get_container
-from src.presentation.dependencies.auth import get_current_user_data
 from starlette.requests import Request
 from starlette.responses import Response
 from starlette_admin.auth import AdminConfig, AdminUser, AuthProvider
@@ -64,11 +64,13 @@ class UsernameAndPasswordProvider(AuthProvider):
             return False
 
         try:
-            user_data = await get_current_user_data(
-                security_scopes=SecurityScopes(scopes=[UserRole.ADMIN.value]),
-                authorization=session_id,
-                container=get_container(),
-            )
+            async with get_container()() as container:
+                identity_provider = await container.get(SessionIdentityProvider)
+                user_data = await identity_provider.get_current_user(authorization=session_id)
+
+            if UserRole.ADMIN.value not in user_data.scopes:
+                raise NotEnoughPermissionsException
+
             request.state.user = {
                 "id": user_data.user_id,
                 "first_name": user_data.first_name,
@@ -1,8 +1,9 @@
+from admin.views.mixins import ProductCacheInvalidationMixin
 from starlette_admin import BooleanField, StringField
 from starlette_admin.contrib.sqla import ModelView
 
 
-class CategoryView(ModelView):
+class CategoryView(ProductCacheInvalidationMixin, ModelView):
     fields = [
         StringField("name", label="Название"),
         BooleanField("is_available", label="доступно"),
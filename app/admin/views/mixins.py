@@ -0,0 +1,69 @@
+from typing import Any
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.application.auth.interface import SessionCacheInterface
+from src.application.common.interfaces.invalidation import (
+    InvalidationBusInterface,
+    InvalidationTopic,
+)
+from src.application.products.interface import ProductCacheInterface
+from src.infrastructure.di.container import get_container
+from src.infrastructure.persistence.postgresql.repositories.product import (
+    bump_catalog_version,
+)
+
+
+class ProductCacheInvalidationMixin:
+    """
+    Сбрасывает кэш каталога после изменений, сделанных через админ-панель.
+    Админ-панель пишет в базу в обход репозиториев, поэтому версия каталога увеличивается отдельной транзакцией,
+    а событие для остальных процессов публикуется отдельно
+    """
+
+    async def _invalidate_product_cache(self) -> None:
+        container = get_container()
+        # Версия увеличивается до сброса кэша, иначе кэш может снова запомнить старую версию
+        async with container() as request_container:
+            session = await request_container.get(AsyncSession)
+            await bump_catalog_version(session)
+            await session.commit()
+
+        product_cache = await container.get(ProductCacheInterface)
+        product_cache.invalidate()
+        invalidation_bus = await container.get(InvalidationBusInterface)
+        await invalidation_bus.publish(InvalidationTopic.PRODUCT)
+
+    async def after_create(self, request: Request, obj: Any) -> None:
+        await self._invalidate_product_cache()
+
+    async def after_edit(self, request: Request, obj: Any) -> None:
+        await self._invalidate_product_cache()
+
+    async def after_delete(self, request: Request, obj: Any) -> None:
+        await self._invalidate_product_cache()
+
+
+class SessionCacheInvalidationMixin:
+    """
+    Сбрасывает закэшированные сессии после изменения пользователя (например, смены роли) или сессии.
+    `invalidation_topic` определяет, чей идентификатор содержится в `obj.id`
+    """
+
+    invalidation_topic: InvalidationTopic = InvalidationTopic.USER
+
+    async def _invalidate_session_cache(self, obj: Any) -> None:
+        container = get_container()
+        session_cache = await container.get(SessionCacheInterface)
+        if self.invalidation_topic == InvalidationTopic.USER:
+            session_cache.invalidate_user(obj.id)
+        else:
+            session_cache.invalidate(obj.id)
+        invalidation_bus = await container.get(InvalidationBusInterface)
+        await invalidation_bus.publish(self.invalidation_topic, str(obj.id))
+
+    async def after_edit(self, request: Request, obj: Any) -> None:
+        await self._invalidate_session_cache(obj)
+
+    async def after_delete(self, request: Request, obj: Any) -> None:
+        await self._invalidate_session_cache(obj)
@@ -1,6 +1,7 @@
 from typing import Any, Dict
 from uuid import uuid4
 
+from admin.views.mixins import ProductCacheInvalidationMixin
 from fastapi import Request, UploadFile
 from src.domain.products.entities import ProductStatus, UnitsOfMesaurement
 from src.infrastructure.di.container import get_container
@@ -15,7 +16,7 @@ from starlette_admin import (
 from starlette_admin.contrib.sqla import ModelView
 
 
-class ProductView(ModelView):
+class ProductView(ProductCacheInvalidationMixin, ModelView):
     fields = [
         StringField("id", label="ID"),
         StringField("name", label="Наименование", required=True),
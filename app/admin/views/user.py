@@ -1,13 +1,15 @@
 from typing import Any, Dict
 from uuid import uuid4
 
+from admin.views.mixins import SessionCacheInvalidationMixin
 from fastapi import Request, UploadFile
+from src.application.common.interfaces.invalidation import InvalidationTopic
 from src.infrastructure.di.container import get_container
 from src.infrastructure.utils.common import StorageBackend
 from starlette_admin.contrib.sqla import ModelView
 
 
-class UserView(ModelView):
+class UserView(SessionCacheInvalidationMixin, ModelView):
     fields = [
         "id",
         "email",
@@ -43,7 +45,8 @@ class UserView(ModelView):
         obj.image = image_path
 
 
-class UserSessionsView(ModelView):
+class UserSessionsView(SessionCacheInvalidationMixin, ModelView):
     label = "Сессии пользователей"
+    invalidation_topic = InvalidationTopic.USER_SESSION
 
     searchable_fields = ["user"]
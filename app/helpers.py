@@ -5,7 +5,7 @@ from typing import Any, TypeVar
 _TRUE_VALUES = ('true', '1', 'yes')
 _FALSE_VALUES = ('false', '0', 'no')
 _BOOL_VALUES = _TRUE_VALUES + _FALSE_VALUES
-_DEFAULT_VALUE = '_DEFAULT'  # для возможности указать None в качестве значения по умолчанию
+_DEFAULT_VALUE: Any = '_DEFAULT'  # для возможности указать None в качестве значения по умолчанию
 T = TypeVar('T', bound=Any)
 
 
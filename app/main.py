@@ -1,14 +1,24 @@
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+from admin.main import init_admin
 from dishka.integrations.fastapi import setup_dishka
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from src.application.chats.interface import (
+    ChatMessageQueueInterface,
+    WebsocketBrokerInterface,
+    WebsocketManagerInterface,
+)
+from src.application.common.email.utils import preload_templates
+from src.application.common.interfaces.invalidation import InvalidationBusInterface
+from src.application.common.interfaces.outbox import OutboxDispatcherInterface
+from src.application.common.interfaces.smtp import SMTPServerInterface
+from src.application.orders.interface import OrderPaymentQueueInterface
 from src.infrastructure.di.container import get_container, init_logger
 from src.infrastructure.persistence.postgresql.database import get_async_engine
 from src.presentation.api.v1.exc_handlers import init_exc_handlers
 from src.presentation.api.v1.router import api_router as api_router_v1
-from admin.main import init_admin
 
 
 def init_di(app: FastAPI) -> None:
@@ -21,7 +31,31 @@ def init_di(app: FastAPI) -> None:
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     engine = get_async_engine()
     init_admin(app=app, engine=engine)
+    preload_templates()
+    container = get_container()
+    invalidation_bus = await container.get(InvalidationBusInterface)
+    await invalidation_bus.start()
+    smtp_server = await container.get(SMTPServerInterface)
+    await smtp_server.start()
+    outbox_dispatcher = await container.get(OutboxDispatcherInterface)
+    await outbox_dispatcher.start()
+    order_payment_queue = await container.get(OrderPaymentQueueInterface)
+    await order_payment_queue.start()
+    websocket_broker = await container.get(WebsocketBrokerInterface)
+    await websocket_broker.start()
+    websocket_manager = await container.get(WebsocketManagerInterface)
+    await websocket_manager.start()
+    chat_message_queue = await container.get(ChatMessageQueueInterface)
+    await chat_message_queue.start()
     yield
+    await chat_message_queue.stop()
+    await websocket_manager.stop()
+    await websocket_broker.stop()
+    await order_payment_queue.stop()
+    await outbox_dispatcher.stop()
+    await smtp_server.stop()
+    await invalidation_bus.stop()
+    await container.close()
     await engine.dispose()
 
 
@@ -13,3 +13,11 @@ class IncorrectAcqioringWebhookTypeException(ApplicationException):
 class IncorrectAmountException(ApplicationException):
     status_code: int = 400
     message: str = "Amount can't be less than 0"
+
+
+@dataclass
+class PaymentOutcomeUnknownException(ApplicationException):
+    """Запрос на создание платежа мог быть принят банком, но ответ не получен, поэтому повторять его нельзя"""
+
+    status_code: int = 504
+    message: str = 'Payment provider did not respond, payment status is unknown'
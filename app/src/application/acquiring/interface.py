@@ -16,3 +16,6 @@ class AcquiringGatewayInterface(ABC):
         save_card: bool = True,
         consumer_id: str | None = None,
     ) -> dict[str, Any]: ...
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]: ...
@@ -23,6 +23,7 @@ class LoginCommand:
 @dataclass
 class LogoutWithJWTCommand:
     refresh_token: str
+    access_token: str | None = None
 
 
 @dataclass
@@ -57,3 +57,10 @@ class UserTokenData:
     user_id: UUID
     email: str
     scopes: str
+    jti: str
+    expires_at: datetime
+    role: UserRole
+    mobile_phone: str | None = None
+    first_name: str | None = None
+    last_name: str | None = None
+    is_verified: bool = False
@@ -44,3 +44,9 @@ class WrongTokenTypeException(AuthException):
 class NotEnoughPermissionsException(AuthException):
     status_code: int = 403
     message: str = 'Not enough permissions'
+
+
+@dataclass
+class AuthServiceOverloadedException(AuthException):
+    status_code: int = 503
+    message: str = 'Too many authentication requests, try again later'
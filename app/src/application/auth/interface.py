@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from src.application.auth.dto import UserData
+
+
+class SessionCacheInterface(ABC):
+    @abstractmethod
+    def get(self, session_id: UUID) -> UserData | None: ...
+
+    @abstractmethod
+    def set(self, session_id: UUID, user_data: UserData, expires_at: datetime) -> None:
+        """Запись не переживет `expires_at` сессии"""
+        ...
+
+    @abstractmethod
+    def invalidate(self, session_id: UUID) -> None: ...
+
+    @abstractmethod
+    def invalidate_user(self, user_id: UUID) -> None:
+        """Удаляет все закэшированные сессии пользователя"""
+        ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]: ...
+
+
+class TokenDenyListInterface(ABC):
+    """Отозванные access токены, хранятся только до истечения срока действия токена"""
+
+    @abstractmethod
+    async def revoke(self, jti: str, expires_at: datetime) -> None: ...
+
+    @abstractmethod
+    def is_revoked(self, jti: str) -> bool: ...
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]: ...
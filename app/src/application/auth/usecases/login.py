@@ -8,6 +8,8 @@ from src.application.auth.commands import (
     LogoutWithSessionCommand,
 )
 from src.application.auth.dto import RefreshSession, Token
+from src.application.auth.exceptions import AuthException
+from src.application.auth.interface import SessionCacheInterface, TokenDenyListInterface
 from src.application.common.interfaces.jwt_processor import JWTProcessorInterface
 from src.application.common.interfaces.password_hasher import PasswordHasherInterface
 from src.application.common.interfaces.refresh import RefreshTokenRepositoryInterface
@@ -37,10 +39,10 @@ class LoginWithJWTUseCase:
         if not user:
             raise UserInvalidCredentialsException
 
-        if not self.password_hasher.verify(password=command.password, hash=user.hashed_password):
+        if not await self.password_hasher.verify(password=command.password, hash=user.hashed_password):
             raise UserInvalidCredentialsException
 
-        access_token = self.jwt_processor.create_access_token(user_id=user.id, user_role=user.role, email=user.email)
+        access_token = self.jwt_processor.create_access_token(user=user)
         current_session = await self.refresh_token_repository.get_by_user_id_and_user_agent(
             user_id=user.id,
             user_agent=command.user_agent,
@@ -99,7 +101,7 @@ class LoginWithSessionUseCase:
         if not user:
             raise UserInvalidCredentialsException
 
-        if not self.password_hasher.verify(password=command.password, hash=user.hashed_password):
+        if not await self.password_hasher.verify(password=command.password, hash=user.hashed_password):
             raise UserInvalidCredentialsException
 
         current_session = await self.user_session_repository.get_by_user_id_and_user_agent(
@@ -130,22 +132,34 @@ class LoginWithSessionUseCase:
 @dataclass
 class LogoutWithJWTUseCase:
     refresh_token_repository: RefreshTokenRepositoryInterface
+    jwt_processor: JWTProcessorInterface
+    deny_list: TokenDenyListInterface
     commiter: ICommiter
 
     async def execute(self, command: LogoutWithJWTCommand) -> None:
         await self.refresh_token_repository.delete_by_token(refresh_token=command.refresh_token)
         await self.commiter.commit()
 
+        if command.access_token:
+            try:
+                token_data = self.jwt_processor.validate_access_token(token=command.access_token)
+            except AuthException:
+                # Просроченный или невалидный токен и так не будет принят
+                return None
+            await self.deny_list.revoke(jti=token_data.jti, expires_at=token_data.expires_at)
+
         return None
 
 
 @dataclass
 class LogoutWithSessionUseCase:
     user_session_repository: UserSessionRepositoryInterface
+    session_cache: SessionCacheInterface
     commiter: ICommiter
 
     async def execute(self, command: LogoutWithSessionCommand) -> None:
         await self.user_session_repository.delete(session_id=command.session_id)
         await self.commiter.commit()
+        self.session_cache.invalidate(session_id=command.session_id)
 
         return None
@@ -7,7 +7,7 @@ from src.application.common.email.utils import get_reset_password_template
 from src.application.common.interfaces.jwt_processor import JWTProcessorInterface
 from src.application.common.interfaces.password_hasher import PasswordHasherInterface
 from src.application.common.interfaces.refresh import RefreshTokenRepositoryInterface
-from src.application.common.interfaces.smtp import SyncSMTPServerInterface
+from src.application.common.interfaces.smtp import SMTPServerInterface
 from src.application.common.interfaces.transaction import ICommiter
 from src.domain.users.exceptions import UserNotFoundException
 from src.domain.users.repository import UserRepositoryInterface
@@ -19,7 +19,7 @@ logger = logging.getLogger()
 class PasswordRecoveryUseCase:
     user_repository: UserRepositoryInterface
     jwt_processor: JWTProcessorInterface
-    smtp_server: SyncSMTPServerInterface
+    smtp_server: SMTPServerInterface
     sender_name: SenderName
 
     async def execute(self, email: str) -> None:
@@ -31,7 +31,7 @@ class PasswordRecoveryUseCase:
 
         reset_token = self.jwt_processor.create_reset_password_token(email=email)
         reset_link = f'{frontend_url}/{reset_token}'
-        email_content = get_reset_password_template(reset_link=reset_link)
+        email_content = await get_reset_password_template(reset_link=reset_link)
 
         message = self.smtp_server.create_message(
             content=email_content,
@@ -62,7 +62,7 @@ class ResetPasswordUseCase:
         if not user:
             raise UserNotFoundException
 
-        hashed_password = self.password_hasher.hash(password=command.new_password)
+        hashed_password = await self.password_hasher.hash(password=command.new_password)
         user.hashed_password = hashed_password
 
         await self.user_repository.update(user=user)
@@ -39,7 +39,7 @@ class RefreshTokenUseCase:
         if not user:
             raise UserNotFoundException
 
-        access_token = self.jwt_processor.create_access_token(user_id=user.id, user_role=user.role, email=user.email)
+        access_token = self.jwt_processor.create_access_token(user=user)
         new_refresh_token = self.jwt_processor.create_refresh_token(user_id=user.id)
         new_refresh_session = RefreshSession.create(
             refresh_token=new_refresh_token,
@@ -26,7 +26,7 @@ class RegisterUseCase:
         if user_exist:
             raise UserAlreadyExistsException
 
-        hashed_password = self.password_hasher.hash(command.password)
+        hashed_password = await self.password_hasher.hash(command.password)
         user = User.create(
             email=command.email,
             hashed_password=hashed_password,
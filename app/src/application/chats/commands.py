@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from uuid import UUID
 
 from src.application.common.pagination import PaginationQuery
 
@@ -17,3 +18,11 @@ class CreateChatCommand:
 class GetChatsListCommand:
     pagination: PaginationQuery
     search: str | None = None
+
+
+@dataclass
+class GetChatMessagesCommand:
+    chat_id: UUID
+    limit: int = 50
+    before: str | None = None
+    """Курсор последнего сообщения предыдущей страницы"""
@@ -2,6 +2,9 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from uuid import UUID
 
+from fastapi import WebSocket
+from src.domain.chats.entities import Message
+
 
 @dataclass
 class ChatOut:
@@ -21,3 +24,27 @@ class MessageOut:
     content: str
     created_at: datetime
     updated_at: datetime
+
+
+@dataclass
+class ChatMessagesOut:
+    items: list[MessageOut]
+    """Сообщения от новых к старым"""
+    next_cursor: str | None = None
+
+
+@dataclass
+class ChatMessageJob:
+    """Сообщение, полученное через websocket и ожидающее сохранения"""
+
+    message: Message
+    websocket: WebSocket
+    client_id: str
+
+    @staticmethod
+    def create(websocket: WebSocket, client_id: str, chat_id: UUID, user_id: UUID, content: str) -> 'ChatMessageJob':
+        return ChatMessageJob(
+            message=Message.create(user_id=user_id, chat_id=chat_id, content=content),
+            websocket=websocket,
+            client_id=client_id,
+        )
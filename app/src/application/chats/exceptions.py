@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+from src.domain.common.exceptions.base import ApplicationException
+
+
+@dataclass
+class ChatMessageQueueOverloadedException(ApplicationException):
+    status_code: int = 503
+    message: str = 'Too many messages are waiting to be saved, try again later'
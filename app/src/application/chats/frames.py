@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Annotated, Any, Literal
+from uuid import UUID
+
+from pydantic import Field, TypeAdapter
+from src.domain.chats.entities import Message
+
+
+class ChatFrameType(str, Enum):
+    SEND = 'send'
+    """Клиент отправляет сообщение"""
+    ACK = 'ack'
+    """Сообщение клиента сохранено"""
+    MESSAGE = 'message'
+    """Новое сообщение в чате"""
+    TYPING = 'typing'
+    READ = 'read'
+    ERROR = 'error'
+    PING = 'ping'
+    """Сервер проверяет, что соединение живо"""
+    PONG = 'pong'
+
+
+@dataclass
+class SendFrame:
+    type: Literal[ChatFrameType.SEND]
+    id: Annotated[str, Field(min_length=1, max_length=64)]
+    """Идентификатор сообщения на клиенте, возвращается в `ack`"""
+    message: str
+
+
+@dataclass
+class TypingFrame:
+    type: Literal[ChatFrameType.TYPING]
+
+
+@dataclass
+class ReadFrame:
+    type: Literal[ChatFrameType.READ]
+    message_id: UUID
+
+
+@dataclass
+class PongFrame:
+    type: Literal[ChatFrameType.PONG]
+
+
+InboundChatFrame = Annotated[SendFrame | TypingFrame | ReadFrame | PongFrame, Field(discriminator='type')]
+
+_inbound_frame_adapter: TypeAdapter[InboundChatFrame] = TypeAdapter(InboundChatFrame)
+
+
+def parse_chat_frame(data: str | bytes) -> SendFrame | TypingFrame | ReadFrame | PongFrame:
+    """Разбирает входящий кадр, при неверном формате выбрасывает `pydantic.ValidationError`"""
+    return _inbound_frame_adapter.validate_json(data)
+
+
+def make_message_frame(message: Message) -> dict[str, Any]:
+    return {
+        'type': ChatFrameType.MESSAGE.value,
+        'id': str(message.id),
+        'user_id': str(message.user_id),
+        'message': message.content,
+        'created_at': message.created_at.isoformat(),
+    }
+
+
+def make_ack_frame(client_id: str, message: Message) -> dict[str, Any]:
+    return {'type': ChatFrameType.ACK.value, 'id': client_id, 'message_id': str(message.id)}
+
+
+def make_typing_frame(user_id: UUID) -> dict[str, Any]:
+    return {'type': ChatFrameType.TYPING.value, 'user_id': str(user_id)}
+
+
+def make_read_frame(user_id: UUID, message_id: UUID) -> dict[str, Any]:
+    return {'type': ChatFrameType.READ.value, 'user_id': str(user_id), 'message_id': str(message_id)}
+
+
+def make_error_frame(message: str, client_id: str | None = None) -> dict[str, Any]:
+    return {'type': ChatFrameType.ERROR.value, 'id': client_id, 'message': message}
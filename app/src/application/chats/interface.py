@@ -1,21 +1,81 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable
 from uuid import UUID
 
 from fastapi import WebSocket
+from src.application.chats.dto import ChatMessageJob
 
 
 class WebsocketManagerInterface(ABC):
-    connections_map: dict[UUID, set[WebSocket]] = {}
-
     @abstractmethod
-    async def accept_connection(self, websocket: WebSocket, key: UUID) -> None: ...
+    async def accept_connection(self, websocket: WebSocket, key: UUID, reap_idle: bool = True) -> None:
+        """`reap_idle=False` для соединений, клиенты которых только слушают и не обязаны отвечать на ping"""
+        ...
 
     @abstractmethod
     async def remove_connection(self, websocket: WebSocket, key: UUID) -> None: ...
 
+    @abstractmethod
+    def touch(self, websocket: WebSocket, key: UUID) -> None:
+        """Отмечает входящее сообщение от клиента, при включенном `idle_timeout` неактивные соединения закрываются"""
+        ...
+
+    @abstractmethod
+    async def send(self, websocket: WebSocket, key: UUID, data: dict[str, Any]) -> None:
+        """Отправляет сообщение одному соединению в общем порядке с рассылками"""
+        ...
+
     @abstractmethod
     async def send_all(self, key: UUID, data: dict[str, Any]) -> None: ...
 
     @abstractmethod
     async def disconnect_all(self, key: UUID) -> None: ...
+
+    @abstractmethod
+    async def start(self) -> None: ...
+
+    @abstractmethod
+    async def stop(self) -> None: ...
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]: ...
+
+
+WebsocketMessageHandler = Callable[[UUID, str], None]
+"""Получает ключ и уже сериализованное сообщение"""
+
+
+class WebsocketBrokerInterface(ABC):
+    """Рассылает сообщения websocket соединениям всех процессов приложения"""
+
+    @abstractmethod
+    def subscribe(self, handler: WebsocketMessageHandler) -> None: ...
+
+    @abstractmethod
+    async def publish(self, key: UUID, message: str) -> None:
+        """Доставляет сообщение подписчикам всех процессов, включая текущий"""
+        ...
+
+    @abstractmethod
+    async def start(self) -> None: ...
+
+    @abstractmethod
+    async def stop(self) -> None: ...
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]: ...
+
+
+class ChatMessageQueueInterface(ABC):
+    @abstractmethod
+    def submit(self, job: ChatMessageJob) -> None:
+        """Ставит сообщение в очередь на сохранение, при переполнении очереди выбрасывает исключение"""
+
+    @abstractmethod
+    async def start(self) -> None: ...
+
+    @abstractmethod
+    async def stop(self) -> None: ...
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]: ...
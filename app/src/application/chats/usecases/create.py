@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from uuid import UUID
 
 from src.application.chats.commands import CreateChatCommand, CreateMessageCommand
+from src.application.chats.frames import make_message_frame
 from src.application.chats.interface import WebsocketManagerInterface
 from src.application.common.interfaces.transaction import ICommiter
 from src.domain.chats.entities import Chat, Message
@@ -33,9 +34,21 @@ class CreateMessageUseCase:
     async def execute(self, command: CreateMessageCommand, chat_id: UUID, user_id: UUID) -> None:
         message = Message.create(user_id=user_id, chat_id=chat_id, content=command.message)
         await self.message_repository.create(message=message)
-
-        data = {'user_id': str(user_id), 'message': command.message}
-        await self.websocket_manager.send_all(key=chat_id, data=data)
+        # Сообщение рассылается после коммита, чтобы подписчики не получили сообщение, которое будет откачено
         await self.commiter.commit()
 
+        await self.websocket_manager.send_all(key=chat_id, data=make_message_frame(message))
+
         return None
+
+
+@dataclass
+class CreateMessagesUseCase:
+    """Сохраняет пачку сообщений одной вставкой в одной транзакции"""
+
+    message_repository: MessageRepositoryInterface
+    commiter: ICommiter
+
+    async def execute(self, messages: list[Message]) -> None:
+        await self.message_repository.create_many(messages)
+        await self.commiter.commit()
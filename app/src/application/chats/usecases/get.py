@@ -1,11 +1,19 @@
 from dataclasses import dataclass
 from uuid import UUID
 
-from src.application.chats.commands import GetChatsListCommand
-from src.application.chats.dto import ChatOut, MessageOut
-from src.application.common.pagination import ListPaginatedResponse, PaginationOutSchema
+from src.application.chats.commands import GetChatMessagesCommand, GetChatsListCommand
+from src.application.chats.dto import ChatMessagesOut, ChatOut, MessageOut
+from src.application.common.pagination import (
+    ListPaginatedResponse,
+    PaginationOutSchema,
+    decode_cursor,
+    next_cursor,
+)
 from src.domain.chats.exceptions import ChatNotFoundException
-from src.domain.chats.repository import ChatRepositoryInterface
+from src.domain.chats.repository import (
+    ChatRepositoryInterface,
+    MessageRepositoryInterface,
+)
 
 
 @dataclass
@@ -77,6 +85,7 @@ class GetChatsListUseCase:
             search=command.search,
             limit=command.pagination.limit,
             offset=command.pagination.offset,
+            after=command.pagination.after,
         )
         count = await self.chat_repository.count(search=command.search)
 
@@ -101,5 +110,38 @@ class GetChatsListUseCase:
                 )
                 for chat in chats
             ],
-            pagination=PaginationOutSchema(limit=command.pagination.limit, page=command.pagination.page, total=count),
+            pagination=PaginationOutSchema(
+                limit=command.pagination.limit,
+                page=command.pagination.page,
+                total=count,
+                next_cursor=next_cursor(chats, command.pagination.limit, key=lambda chat: chat.created_at.isoformat()),
+            ),
+        )
+
+
+@dataclass
+class GetChatMessagesUseCase:
+    """История чата страницами от новых сообщений к старым, следующая страница запрашивается по курсору"""
+
+    message_repository: MessageRepositoryInterface
+
+    async def execute(self, command: GetChatMessagesCommand) -> ChatMessagesOut:
+        messages = await self.message_repository.get_by_chat_id(
+            chat_id=command.chat_id,
+            limit=command.limit,
+            before=decode_cursor(command.before) if command.before else None,
+        )
+
+        return ChatMessagesOut(
+            items=[
+                MessageOut(
+                    id=message.id,
+                    user_id=message.user_id,
+                    content=message.content,
+                    created_at=message.created_at,
+                    updated_at=message.updated_at,
+                )
+                for message in messages
+            ],
+            next_cursor=next_cursor(messages, command.limit, key=lambda message: message.created_at.isoformat()),
         )
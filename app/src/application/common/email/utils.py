@@ -1,16 +1,27 @@
 from pathlib import Path
 
-from jinja2 import Template
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from src.domain.orders.entities import Order
 
+TEMPLATES_PATH = Path(__file__).parent / 'templates'
 
-def get_reset_password_template(reset_link: str) -> str:
-    source = open(Path(__file__).parent / 'templates' / 'password_recovery.html', 'rb').read().decode()
-    content = Template(source).render(reset_link=reset_link)
-    return content
+# Шаблоны компилируются один раз и хранятся в памяти, байткод переиспользуется между процессами и перезапусками
+environment = Environment(
+    loader=FileSystemLoader(TEMPLATES_PATH),
+    bytecode_cache=FileSystemBytecodeCache(),
+    auto_reload=False,
+    enable_async=True,
+)
 
 
-def get_new_order_template(order: Order) -> str:
-    source = open(Path(__file__).parent / 'templates' / 'new_order.html', 'rb').read().decode()
-    content = Template(source).render(order=order)
-    return content
+def preload_templates() -> None:
+    for name in environment.list_templates(extensions=['html']):
+        environment.get_template(name)
+
+
+async def get_reset_password_template(reset_link: str) -> str:
+    return await environment.get_template('password_recovery.html').render_async(reset_link=reset_link)
+
+
+async def get_new_order_template(order: Order) -> str:
+    return await environment.get_template('new_order.html').render_async(order=order)
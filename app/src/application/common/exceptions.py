@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+from src.domain.common.exceptions.base import ApplicationException
+
+
+@dataclass
+class InvalidCursorException(ApplicationException):
+    status_code: int = 400
+    message: str = 'Invalid pagination cursor'
+
+
+@dataclass
+class SearchCursorNotSupportedException(ApplicationException):
+    status_code: int = 400
+    message: str = 'Search results are paginated by page number, cursor is not supported'
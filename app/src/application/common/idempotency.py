@@ -0,0 +1,23 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+
+@dataclass
+class IdempotencyRecord:
+    """Ответ на запрос с заголовком `Idempotency-Key`. Пока запрос выполняется, `response` пустой"""
+
+    key: str
+    request_hash: str
+    response: dict[str, Any] | None
+    created_at: datetime
+
+
+UNKNOWN_OUTCOME_RESPONSE: dict[str, Any] = {'outcome': 'unknown'}
+"""Сохраняется вместо ответа, если результат запроса неизвестен, ключ с ним не освобождается до конца TTL"""
+
+
+def hash_request(data: dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(data, default=str, sort_keys=True).encode()).hexdigest()
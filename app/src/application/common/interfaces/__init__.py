@@ -1,16 +1,29 @@
+from .idempotency import IdempotencyRepositoryInterface, InFlightRequestsInterface
 from .identity_provider import IdentityProviderInterface
+from .invalidation import InvalidationBusInterface, InvalidationTopic
 from .jwt_processor import JWTProcessorInterface
+from .outbox import (
+    OutboxDispatcherInterface,
+    OutboxHandlerInterface,
+    OutboxRepositoryInterface,
+)
 from .password_hasher import PasswordHasherInterface
 from .refresh import RefreshTokenRepositoryInterface
-from .smtp import SMTPServerInterface, SyncSMTPServerInterface
+from .smtp import SMTPServerInterface
 from .transaction import ICommiter
 
 __all__ = [
+    'IdempotencyRepositoryInterface',
+    'InFlightRequestsInterface',
     'IdentityProviderInterface',
+    'InvalidationBusInterface',
+    'InvalidationTopic',
     'JWTProcessorInterface',
+    'OutboxDispatcherInterface',
+    'OutboxHandlerInterface',
+    'OutboxRepositoryInterface',
     'PasswordHasherInterface',
     'RefreshTokenRepositoryInterface',
     'SMTPServerInterface',
-    'SyncSMTPServerInterface',
     'ICommiter',
 ]
@@ -0,0 +1,43 @@
+import asyncio
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any
+
+from src.application.common.idempotency import IdempotencyRecord
+
+
+class IdempotencyRepositoryInterface(ABC):
+    @abstractmethod
+    async def reserve(
+        self,
+        key: str,
+        request_hash: str,
+        expired_before: datetime,
+        in_progress_expired_before: datetime,
+    ) -> IdempotencyRecord | None:
+        """
+        Резервирует ключ за текущим запросом и возвращает None.
+        Если ключ уже занят, возвращает существующую запись. Записи старше `expired_before` перезаписываются,
+        незавершенные записи без ответа перезаписываются, если они старше `in_progress_expired_before`
+        """
+
+    @abstractmethod
+    async def complete(self, key: str, response: dict[str, Any]) -> None: ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+
+class InFlightRequestsInterface(ABC):
+    @abstractmethod
+    def get(self, key: str) -> asyncio.Future[Any] | None: ...
+
+    @abstractmethod
+    def register(self, key: str) -> asyncio.Future[Any] | None:
+        """Регистрирует выполняемый запрос. Возвращает None, если реестр заполнен"""
+
+    @abstractmethod
+    def resolve(self, key: str, result: Any = None, exc: BaseException | None = None) -> None: ...
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]: ...
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Callable
+
+
+class InvalidationTopic(str, Enum):
+    PRODUCT = 'product'
+    CATEGORY = 'category'
+    USER = 'user'
+    USER_SESSION = 'user_session'
+    ACCESS_TOKEN = 'access_token'
+
+
+InvalidationHandler = Callable[[str | None], None]
+"""Получает ключ измененной записи или `None`, если нужно сбросить все записи темы"""
+
+
+class InvalidationBusInterface(ABC):
+    @abstractmethod
+    def subscribe(self, topic: InvalidationTopic, handler: InvalidationHandler) -> None: ...
+
+    @abstractmethod
+    async def publish(self, topic: InvalidationTopic, key: str | None = None) -> None:
+        """Рассылает событие всем процессам приложения, включая текущий"""
+        ...
+
+    @abstractmethod
+    async def start(self) -> None: ...
+
+    @abstractmethod
+    async def stop(self) -> None: ...
@@ -4,7 +4,7 @@ from typing import Any
 from uuid import UUID
 
 from src.application.auth.dto import UserTokenData
-from src.domain.users.entities import UserRole
+from src.domain.users.entities import User
 
 
 class TokenType(Enum):
@@ -15,7 +15,9 @@ class TokenType(Enum):
 
 class JWTProcessorInterface(ABC):
     @abstractmethod
-    def create_access_token(self, user_id: UUID, user_role: UserRole, email: str) -> str: ...
+    def create_access_token(self, user: User) -> str:
+        """Токен содержит идентификатор `jti` и данные профиля, достаточные для проверки без обращения к базе"""
+        ...
 
     @abstractmethod
     def create_refresh_token(self, user_id: UUID) -> str: ...
@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from typing import Any
+
+from src.application.common.outbox import OutboxMessage
+
+
+class OutboxRepositoryInterface(ABC):
+    @abstractmethod
+    async def add(self, message: OutboxMessage) -> None: ...
+
+    @abstractmethod
+    async def claim(self, limit: int, lease: timedelta) -> list[OutboxMessage]:
+        """
+        Возвращает готовые к обработке сообщения и арендует их на `lease`.
+        До конца аренды сообщения не выдаются другим обработчикам, даже после коммита транзакции
+        """
+
+    @abstractmethod
+    async def update(self, message: OutboxMessage) -> None:
+        """Сохраняет результат обработки и снимает аренду"""
+
+
+class OutboxHandlerInterface(ABC):
+    @abstractmethod
+    async def execute(self, payload: dict[str, Any]) -> None: ...
+
+
+class OutboxDispatcherInterface(ABC):
+    @abstractmethod
+    async def start(self) -> None: ...
+
+    @abstractmethod
+    async def stop(self) -> None: ...
+
+    @abstractmethod
+    async def dispatch_batch(self) -> int:
+        """Обрабатывает одну пачку сообщений и возвращает ее размер"""
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]: ...
@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
+from typing import Any
 
 
 class PasswordHasherInterface(ABC):
     @abstractmethod
-    def hash(self, password: str) -> str: ...
+    async def hash(self, password: str) -> str: ...
 
     @abstractmethod
-    def verify(self, password: str, hash: str) -> bool: ...
+    async def verify(self, password: str, hash: str) -> bool: ...
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]: ...
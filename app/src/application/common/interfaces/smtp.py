@@ -1,33 +1,26 @@
-import logging
 from abc import ABC, abstractmethod
 from email.mime.multipart import MIMEMultipart
-
-logger = logging.getLogger()
+from typing import Any
 
 
 class SMTPServerInterface(ABC):
     @abstractmethod
-    async def start(self) -> None: ...
-
-    @abstractmethod
-    def create_message(self, content: str, to_address: str) -> MIMEMultipart: ...
-
-    @abstractmethod
-    async def send_email(self, message: MIMEMultipart) -> None: ...
+    def create_message(self, content: str, sender_name: str, to_address: str, subject: str) -> MIMEMultipart: ...
 
     @abstractmethod
-    async def stop(self) -> None: ...
+    async def send_email(self, message: MIMEMultipart) -> None:
+        """Ставит письмо в очередь на отправку и сразу возвращает управление"""
 
     @abstractmethod
-    async def check_connection(self) -> None: ...
-
+    async def deliver(self, message: MIMEMultipart) -> None:
+        """Ставит письмо в очередь и ждет его отправки, при неудаче выбрасывает исключение"""
 
-class SyncSMTPServerInterface(ABC):
     @abstractmethod
-    def create_message(self, content: str, sender_name: str, to_address: str, subject: str) -> MIMEMultipart: ...
+    async def start(self) -> None: ...
 
     @abstractmethod
-    def _send(self, message: MIMEMultipart) -> None: ...
+    async def stop(self) -> None:
+        """Дожидается отправки писем из очереди и закрывает соединения"""
 
     @abstractmethod
-    async def send_email(self, message: MIMEMultipart) -> None: ...
+    def stats(self) -> dict[str, Any]: ...
@@ -0,0 +1,55 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any
+from uuid import UUID, uuid4
+
+
+class OutboxMessageType(str, Enum):
+    NEW_ORDER_EMAIL = 'new_order_email'
+
+
+class OutboxMessageStatus(str, Enum):
+    PENDING = 'pending'
+    PROCESSED = 'processed'
+    FAILED = 'failed'
+
+
+@dataclass
+class OutboxMessage:
+    """Побочный эффект, который записывается в той же транзакции, что и изменение данных, и выполняется позже"""
+
+    id: UUID
+    type: OutboxMessageType
+    payload: dict[str, Any]
+    status: OutboxMessageStatus
+    created_at: datetime
+    available_at: datetime
+    attempts: int = 0
+    processed_at: datetime | None = None
+    last_error: str | None = field(default=None, repr=False)
+
+    @staticmethod
+    def create(type: OutboxMessageType, payload: dict[str, Any]) -> 'OutboxMessage':
+        now = datetime.now()
+        return OutboxMessage(
+            id=uuid4(),
+            type=type,
+            payload=payload,
+            status=OutboxMessageStatus.PENDING,
+            created_at=now,
+            available_at=now,
+        )
+
+    def mark_processed(self) -> None:
+        self.status = OutboxMessageStatus.PROCESSED
+        self.processed_at = datetime.now()
+
+    def mark_failed(self, error: str, max_attempts: int, backoff: timedelta) -> None:
+        """Откладывает повторную попытку с экспоненциальной задержкой или окончательно помечает сообщение неудачным"""
+        self.attempts += 1
+        self.last_error = error
+        if self.attempts >= max_attempts:
+            self.status = OutboxMessageStatus.FAILED
+            return None
+        self.available_at = datetime.now() + backoff * 2 ** (self.attempts - 1)
@@ -1,7 +1,13 @@
+import base64
+import binascii
+import json
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from datetime import datetime
+from typing import Any, Callable, Generic, Sequence, TypeVar
+from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, ValidationError
+from src.application.common.exceptions import InvalidCursorException
 
 TListItem = TypeVar('TListItem')
 
@@ -10,15 +16,57 @@ class PaginationOutSchema(BaseModel):
     limit: int
     page: int
     total: int
+    next_cursor: str | None = None
+
+
+class PageCursor(BaseModel):
+    """Позиция в выборке, отсортированной по паре (key, id)"""
+
+    model_config = ConfigDict(frozen=True)
+
+    key: str
+    id: UUID
+
+    @property
+    def datetime_key(self) -> datetime:
+        try:
+            return datetime.fromisoformat(self.key)
+        except ValueError:
+            raise InvalidCursorException
+
+
+def encode_cursor(cursor: PageCursor) -> str:
+    return base64.urlsafe_b64encode(cursor.model_dump_json().encode()).decode().rstrip('=')
+
+
+def decode_cursor(value: str) -> PageCursor:
+    try:
+        raw = base64.urlsafe_b64decode(value + '=' * (-len(value) % 4))
+        return PageCursor.model_validate(json.loads(raw))
+    except (binascii.Error, UnicodeDecodeError, ValueError, ValidationError):
+        raise InvalidCursorException
+
+
+def next_cursor(items: Sequence[Any], limit: int, key: Callable[[Any], str]) -> str | None:
+    """Курсор следующей страницы по последнему элементу, если страница заполнена целиком"""
+    if not items or len(items) < limit:
+        return None
+
+    return encode_cursor(PageCursor(key=key(items[-1]), id=items[-1].id))
 
 
 class PaginationQuery(BaseModel):
     page: int
     limit: int
+    cursor: str | None = None
 
     @property
     def offset(self) -> int:
-        return self.page * self.limit
+        return 0 if self.cursor else self.page * self.limit
+
+    @property
+    def after(self) -> PageCursor | None:
+        return decode_cursor(self.cursor) if self.cursor else None
 
 
 @dataclass
@@ -23,6 +23,13 @@ class CreateOrderCommand:
     payment_method: PaymentMethod = PaymentMethod.FULL_PREPAYMENT
 
 
+@dataclass
+class QuoteOrderCommand:
+    is_self_pickup: bool
+    items: list[ProductInOrder]
+    payment_method: PaymentMethod = PaymentMethod.FULL_PREPAYMENT
+
+
 @dataclass
 class UpdateOrderCommand:
     shipping_address: str | None = None
@@ -3,7 +3,8 @@ from datetime import datetime
 from uuid import UUID
 
 from src.application.common.utils import convert_price
-from src.domain.orders.entities import OrderStatus
+from src.application.products.dto import ProductInPaymentDTO
+from src.domain.orders.entities import Order, OrderStatus
 from src.domain.orders.exceptions import OrderItemIncorrectQuantityException
 from src.domain.products.entities import ProductStatus, UnitsOfMesaurement
 from src.domain.products.value_objects import ProductPrice
@@ -26,7 +27,7 @@ class OrderOut:
     created_at: datetime
     updated_at: datetime
     shipping_address: str
-    operation_id: UUID
+    operation_id: UUID | None
     tracking_number: str | None
     total_price: float
     is_self_pickup: bool
@@ -40,7 +41,7 @@ class OrderOut:
         created_at: datetime,
         updated_at: datetime,
         shipping_address: str,
-        operation_id: UUID,
+        operation_id: UUID | None,
         tracking_number: str | None,
         total_price: int,
         is_self_pickup: bool,
@@ -125,8 +126,41 @@ class CreateOrderOut:
     id: UUID
     customer_email: str
     created_at: datetime
-    payment_link: str
+    payment_link: str | None
     shipping_address: str
-    operation_id: UUID
+    operation_id: UUID | None
     total_price: float
     status: OrderStatus
+
+
+@dataclass
+class OrderPaymentOut:
+    id: UUID
+    status: OrderStatus
+    operation_id: UUID | None
+    payment_link: str | None
+
+
+@dataclass
+class OrderPaymentJob:
+    """Данные для создания платежа по заказу, который уже сохранен в статусе PENDING"""
+
+    order: Order
+    items: tuple[ProductInPaymentDTO, ...]
+    total_price: float
+
+
+@dataclass
+class OrderQuoteItemOut:
+    product_id: UUID
+    name: str
+    quantity: int
+    price: float
+    total_price: float
+
+
+@dataclass
+class OrderQuoteOut:
+    items: list[OrderQuoteItemOut]
+    total_price: float
+    catalog_version: str
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+
+from src.domain.common.exceptions.base import ApplicationException
+
+
+@dataclass
+class OrderPaymentQueueOverloadedException(ApplicationException):
+    status_code: int = 503
+    message: str = 'Too many orders are waiting for payment, try again later'
+
+
+@dataclass
+class IdempotencyKeyReusedException(ApplicationException):
+    status_code: int = 422
+    message: str = 'Idempotency key is already used for another request'
+
+
+@dataclass
+class IdempotentRequestInProgressException(ApplicationException):
+    status_code: int = 409
+    message: str = 'Request with this idempotency key is still in progress'
+
+
+@dataclass
+class IdempotentRequestOutcomeUnknownException(ApplicationException):
+    status_code: int = 409
+    message: str = 'Result of the request with this idempotency key is unknown, check the order status before retrying'
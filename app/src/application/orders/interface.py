@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import Any, Hashable
+
+from src.application.orders.dto import OrderPaymentJob, OrderQuoteOut
+
+
+class OrderPaymentQueueInterface(ABC):
+    @abstractmethod
+    def submit(self, job: OrderPaymentJob) -> None:
+        """Ставит заказ в очередь на создание платежа, при переполнении очереди выбрасывает исключение"""
+
+    @abstractmethod
+    async def start(self) -> None: ...
+
+    @abstractmethod
+    async def stop(self) -> None: ...
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]: ...
+
+
+class OrderQuoteCacheInterface(ABC):
+    """Рассчитанные стоимости корзин, сбрасываются при изменении каталога"""
+
+    @abstractmethod
+    def get(self, key: Hashable) -> OrderQuoteOut | None: ...
+
+    @abstractmethod
+    def set(self, key: Hashable, quote: OrderQuoteOut) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]: ...
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable, Sequence
+
+from src.application.products.dto import PaymentMethod
+from src.domain.products.entities import Product
+
+NO_PRICE = 0
+"""Отсутствующая цена. Цены товаров всегда больше нуля, поэтому 0 не пересекается с реальными ценами"""
+
+WHOLESALE_ORDER_WEIGHT = 20000
+
+
+@dataclass(slots=True)
+class PriceTable:
+    """
+    Цены и веса товаров в компактных массивах, товар определяется индексом в таблице.
+    Цены в копейках, отсутствующая цена или вес хранится как 0
+    """
+
+    retail: array[int]
+    wholesale: array[int]
+    d1_delivery: array[int]
+    d1_self_pickup: array[int]
+    weight: array[int]
+    _resolved: dict[tuple[str, ...], array[int]] = field(default_factory=dict, repr=False)
+
+    @staticmethod
+    def from_products(products: Iterable[Product]) -> 'PriceTable':
+        table = PriceTable(
+            retail=array('q'),
+            wholesale=array('q'),
+            d1_delivery=array('q'),
+            d1_self_pickup=array('q'),
+            weight=array('q'),
+        )
+        for product in products:
+            table.retail.append(product.retail_price.value)
+            table.wholesale.append(product.wholesale_price.value if product.wholesale_price else NO_PRICE)
+            table.d1_delivery.append(product.d1_delivery_price.value if product.d1_delivery_price else NO_PRICE)
+            table.d1_self_pickup.append(
+                product.d1_self_pickup_price.value if product.d1_self_pickup_price else NO_PRICE,
+            )
+            table.weight.append(product.weight or 0)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.retail)
+
+    def resolve(self, columns: tuple[str, ...]) -> array[int]:
+        """
+        Возвращает колонку цен, в которой для каждого товара взята первая существующая цена из `columns`,
+        а если ни одной нет, то рыночная. Колонка считается один раз для всех корзин с тем же правилом
+        """
+        resolved = self._resolved.get(columns)
+        if resolved is not None:
+            return resolved
+
+        resolved = array('q', self.retail)
+        for column in reversed(columns):
+            prices = getattr(self, column)
+            resolved = array('q', map(_first_price, prices, resolved))
+        self._resolved[columns] = resolved
+        return resolved
+
+
+@dataclass(slots=True)
+class Cart:
+    """Позиции заказа: индексы товаров в `PriceTable` и количества"""
+
+    products: array[int]
+    quantities: array[int]
+    is_self_pickup: bool
+    payment_method: PaymentMethod
+
+    @staticmethod
+    def create(
+        products: Sequence[int],
+        quantities: Sequence[int],
+        is_self_pickup: bool,
+        payment_method: PaymentMethod = PaymentMethod.FULL_PREPAYMENT,
+    ) -> 'Cart':
+        return Cart(
+            products=array('q', products),
+            quantities=array('q', quantities),
+            is_self_pickup=is_self_pickup,
+            payment_method=payment_method,
+        )
+
+
+@dataclass(slots=True)
+class CartPrices:
+    amounts: array[int]
+    weight: int
+    total_price: int
+
+
+def _first_price(price: int, fallback: int) -> int:
+    return price or fallback
+
+
+def select_price_columns(
+    payment_method: PaymentMethod,
+    is_self_pickup: bool,
+    order_weight: int,
+    products_count: int,
+) -> tuple[str, ...]:
+    """
+    Правила `calculate_order_product_price`, выбранные один раз для всей корзины.
+    Возвращает колонки цен в порядке приоритета, рыночная цена используется, если ни одной из них нет
+    """
+    # вес заказа меньше 20 тонн
+    if order_weight and order_weight <= WHOLESALE_ORDER_WEIGHT:
+        return ()
+
+    columns: tuple[str, ...] = ()
+    # в заказе один товар и вес заказа больше 20 тонн
+    if products_count == 1:
+        columns += ('wholesale',)
+
+    # предоплата и вес заказа больше 20 тонн
+    if payment_method == PaymentMethod.FULL_PREPAYMENT:
+        if is_self_pickup:
+            columns += ('d1_self_pickup',)
+        columns += ('d1_delivery',)
+
+    return columns
+
+
+def price_cart(table: PriceTable, cart: Cart) -> CartPrices:
+    weights = table.weight
+    weight = sum(map(int.__mul__, map(weights.__getitem__, cart.products), cart.quantities))
+
+    columns = select_price_columns(
+        payment_method=cart.payment_method,
+        is_self_pickup=cart.is_self_pickup,
+        order_weight=weight,
+        products_count=len(cart.products),
+    )
+    amounts = array('q', map(table.resolve(columns).__getitem__, cart.products))
+    total_price = sum(map(int.__mul__, amounts, cart.quantities))
+
+    return CartPrices(amounts=amounts, weight=weight, total_price=total_price)
+
+
+def price_carts(table: PriceTable, carts: Iterable[Cart]) -> list[CartPrices]:
+    return [price_cart(table, cart) for cart in carts]
@@ -1,11 +1,31 @@
-from .create import CreateOrderUseCase
-from .get import GetManyOrdersUseCase, GetOrderUseCase
-from .update import UpdateOrderByWebhookUseCase, UpdateOrderUseCase
+from .create import (
+    CreateOrderPaymentUseCase,
+    CreateOrderUseCase,
+    EnqueueOrderUseCase,
+    FailStalePendingOrdersUseCase,
+    IdempotentCreateOrderUseCase,
+    PlaceOrderUseCase,
+)
+from .get import GetManyOrdersUseCase, GetOrderPaymentUseCase, GetOrderUseCase
+from .quote import QuoteOrderUseCase
+from .update import (
+    SendNewOrderEmailUseCase,
+    UpdateOrderByWebhookUseCase,
+    UpdateOrderUseCase,
+)
 
 __all__ = [
     'CreateOrderUseCase',
+    'CreateOrderPaymentUseCase',
+    'EnqueueOrderUseCase',
+    'FailStalePendingOrdersUseCase',
+    'IdempotentCreateOrderUseCase',
+    'PlaceOrderUseCase',
+    'QuoteOrderUseCase',
+    'GetOrderPaymentUseCase',
     'GetManyOrdersUseCase',
     'GetOrderUseCase',
     'UpdateOrderUseCase',
     'UpdateOrderByWebhookUseCase',
+    'SendNewOrderEmailUseCase',
 ]
@@ -1,68 +1,106 @@
+import asyncio
 import logging
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable
+from uuid import UUID
 
+from src.application.acquiring.exceptions import PaymentOutcomeUnknownException
 from src.application.acquiring.interface import AcquiringGatewayInterface
+from src.application.common.idempotency import UNKNOWN_OUTCOME_RESPONSE, hash_request
+from src.application.common.interfaces.idempotency import (
+    IdempotencyRepositoryInterface,
+    InFlightRequestsInterface,
+)
 from src.application.common.interfaces.transaction import ICommiter
-from src.application.orders.calculation import calculate_order_total_price, calculate_order_total_weight
+from src.application.orders.calculation import calculate_order_total_price
 from src.application.orders.commands import CreateOrderCommand
-from src.application.orders.dto import CreateOrderOut
-from src.application.orders.utils import create_product_in_payment_list
-from src.domain.orders.entities import Order, OrderItem
-from src.domain.orders.exceptions import DuplicateOrderPositionsException
+from src.application.orders.dto import CreateOrderOut, OrderPaymentJob
+from src.application.orders.exceptions import (
+    IdempotencyKeyReusedException,
+    IdempotentRequestInProgressException,
+    IdempotentRequestOutcomeUnknownException,
+    OrderPaymentQueueOverloadedException,
+)
+from src.application.orders.interface import OrderPaymentQueueInterface
+from src.application.orders.utils import get_order_products, price_order_products
+from src.domain.orders.entities import Order, OrderItem, OrderStatus
 from src.domain.orders.repository import (
     OrderItemRepositoryInterface,
     OrderRepositoryInterface,
 )
-from src.domain.products.exceptions import ManyProductsNotFoundException
 from src.domain.products.repository import ProductRepositoryInterface
 from src.domain.products.value_objects import ProductPrice
+from src.infrastructure.settings import settings
 
 logger = logging.getLogger()
 
 
+def map_to_create_order_out(order: Order) -> CreateOrderOut:
+    return CreateOrderOut(
+        id=order.id,
+        customer_email=order.customer_email,
+        created_at=order.created_at,
+        payment_link=order.payment_link,
+        shipping_address=order.shipping_address,
+        operation_id=order.operation_id,
+        total_price=ProductPrice(order.total_price).in_rubles(),
+        status=order.status,
+    )
+
+
+def dump_create_order_out(order: CreateOrderOut) -> dict[str, Any]:
+    return {
+        'id': str(order.id),
+        'customer_email': order.customer_email,
+        'created_at': order.created_at.isoformat(),
+        'payment_link': order.payment_link,
+        'shipping_address': order.shipping_address,
+        'operation_id': str(order.operation_id) if order.operation_id else None,
+        'total_price': order.total_price,
+        'status': order.status.value,
+    }
+
+
+def load_create_order_out(data: dict[str, Any]) -> CreateOrderOut:
+    return CreateOrderOut(
+        id=UUID(data['id']),
+        customer_email=data['customer_email'],
+        created_at=datetime.fromisoformat(data['created_at']),
+        payment_link=data['payment_link'],
+        shipping_address=data['shipping_address'],
+        operation_id=UUID(data['operation_id']) if data['operation_id'] else None,
+        total_price=data['total_price'],
+        status=OrderStatus(data['status']),
+    )
+
+
 @dataclass
-class CreateOrderUseCase:
+class PlaceOrderUseCase:
+    """Проверяет позиции заказа, считает цены и сохраняет заказ в статусе PENDING"""
+
     order_repository: OrderRepositoryInterface
     order_item_repository: OrderItemRepositoryInterface
     product_repository: ProductRepositoryInterface
-    acquiring_gateway: AcquiringGatewayInterface
     commiter: ICommiter
 
-    async def execute(self, command: CreateOrderCommand) -> CreateOrderOut:
-        products_ids = set()
-        for product_item in command.items:
-            if product_item.id in products_ids:
-                raise DuplicateOrderPositionsException(product_item.id)
-            products_ids.add(product_item.id)
-
-        products, missing_products = await self.product_repository.get_many_by_ids(product_ids=products_ids)
-        if missing_products:
-            raise ManyProductsNotFoundException(missing_products)
-
-        products_count = len(products)
-        order_weight = calculate_order_total_weight(products=products, order_products=command.items)
-        products_in_payment = create_product_in_payment_list(
+    async def execute(self, command: CreateOrderCommand) -> OrderPaymentJob:
+        products = await get_order_products(self.product_repository, command.items)
+        products_in_payment = price_order_products(
             products=products,
             order_products=command.items,
-            products_count=products_count,
-            order_weight=order_weight,
             is_self_pickup=command.is_self_pickup,
             payment_method=command.payment_method,
         )
         total_price = calculate_order_total_price(products_in_payment)
 
-        payment_data = await self.acquiring_gateway.create_payment_operation_with_receipt(
-            client_email=command.customer_email,
-            items=products_in_payment,
-            total_price=total_price.in_rubles(),
-        )
-
         order = Order.create(
             customer_email=command.customer_email,
-            operation_id=payment_data['operationId'],
+            operation_id=None,
             shipping_address=command.shipping_address,
             is_self_pickup=command.is_self_pickup,
             total_price=total_price.value,
+            status=OrderStatus.PENDING,
         )
         order_items = [
             OrderItem.create(
@@ -74,19 +112,174 @@ class CreateOrderUseCase:
             for item, product_in_payment in zip(command.items, products_in_payment)
         ]
 
+        # Заказ сохраняется до запроса в банк, чтобы соединение с БД не удерживалось на время запроса
         await self.order_repository.create(order=order)
         await self.order_item_repository.create_many(order_items)
         await self.commiter.commit()
 
-        logger.info('CreateOrderUseCase', extra={'order_id': order.id, 'customer_email': command.customer_email})
-
-        return CreateOrderOut(
-            id=order.id,
-            customer_email=order.customer_email,
-            created_at=order.created_at,
-            payment_link=payment_data['paymentLink'],
-            shipping_address=order.shipping_address,
-            operation_id=order.operation_id,
-            total_price=ProductPrice(order.total_price).in_rubles(),
-            status=order.status,
+        logger.info('PlaceOrderUseCase', extra={'order_id': order.id, 'customer_email': command.customer_email})
+
+        return OrderPaymentJob(order=order, items=products_in_payment, total_price=total_price.in_rubles())
+
+
+@dataclass
+class CreateOrderPaymentUseCase:
+    """Создает платеж в банке для сохраненного заказа и записывает ссылку на оплату"""
+
+    order_repository: OrderRepositoryInterface
+    acquiring_gateway: AcquiringGatewayInterface
+    commiter: ICommiter
+
+    async def execute(self, job: OrderPaymentJob) -> Order:
+        order = job.order
+        try:
+            payment_data = await self.acquiring_gateway.create_payment_operation_with_receipt(
+                client_email=order.customer_email,
+                items=job.items,
+                total_price=job.total_price,
+            )
+        except Exception:
+            order.fail()
+            await self.order_repository.update(order)
+            await self.commiter.commit()
+            logger.warning('CreateOrderPaymentUseCase: payment is not created', extra={'order_id': order.id})
+            raise
+
+        order.attach_payment(operation_id=payment_data['operationId'], payment_link=payment_data['paymentLink'])
+        await self.order_repository.update(order)
+        await self.commiter.commit()
+
+        logger.info('CreateOrderPaymentUseCase', extra={'order_id': order.id})
+        return order
+
+
+@dataclass
+class CreateOrderUseCase:
+    place_order: PlaceOrderUseCase
+    create_order_payment: CreateOrderPaymentUseCase
+
+    async def execute(self, command: CreateOrderCommand) -> CreateOrderOut:
+        job = await self.place_order.execute(command)
+        order = await self.create_order_payment.execute(job)
+        return map_to_create_order_out(order)
+
+
+@dataclass
+class EnqueueOrderUseCase:
+    """Сохраняет заказ и ставит создание платежа в очередь, не дожидаясь ответа банка"""
+
+    place_order: PlaceOrderUseCase
+    payment_queue: OrderPaymentQueueInterface
+    order_repository: OrderRepositoryInterface
+    commiter: ICommiter
+
+    async def execute(self, command: CreateOrderCommand) -> CreateOrderOut:
+        job = await self.place_order.execute(command)
+        try:
+            self.payment_queue.submit(job)
+        except OrderPaymentQueueOverloadedException:
+            job.order.fail()
+            await self.order_repository.update(job.order)
+            await self.commiter.commit()
+            raise
+
+        return map_to_create_order_out(job.order)
+
+
+@dataclass
+class FailStalePendingOrdersUseCase:
+    """Заказы, которые не получили ссылку на оплату, например из-за перезапуска процесса, помечаются как FAILED"""
+
+    order_repository: OrderRepositoryInterface
+    commiter: ICommiter
+
+    async def execute(self, timeout: timedelta) -> int:
+        failed = await self.order_repository.fail_pending(created_before=datetime.now() - timeout)
+        await self.commiter.commit()
+
+        if failed:
+            logger.warning('Stale pending orders are failed', extra={'count': failed})
+        return failed
+
+
+@dataclass
+class IdempotentCreateOrderUseCase:
+    """
+    Повтор запроса с тем же `Idempotency-Key` возвращает сохраненный ответ, не создавая заказ и платеж заново.
+    Одновременные повторы в этом процессе дожидаются результата первого запроса, не обращаясь к базе
+    """
+
+    idempotency_repository: IdempotencyRepositoryInterface
+    in_flight_requests: InFlightRequestsInterface
+    commiter: ICommiter
+
+    async def execute(
+        self,
+        key: str,
+        command: CreateOrderCommand,
+        create_order: Callable[[CreateOrderCommand], Awaitable[CreateOrderOut]],
+    ) -> CreateOrderOut:
+        request_hash = hash_request(asdict(command))
+        # Запрос с тем же ключом, но другим телом не должен получить чужой ответ
+        in_flight_key = f'{key}:{request_hash}'
+        in_flight = self.in_flight_requests.get(in_flight_key)
+        if in_flight is not None:
+            result: CreateOrderOut = await asyncio.shield(in_flight)
+            return result
+
+        registered = self.in_flight_requests.register(in_flight_key) is not None
+        try:
+            result = await self._execute(key, request_hash, command, create_order)
+        except BaseException as exc:
+            if registered:
+                self.in_flight_requests.resolve(in_flight_key, exc=exc)
+            raise
+
+        if registered:
+            self.in_flight_requests.resolve(in_flight_key, result=result)
+        return result
+
+    async def _execute(
+        self,
+        key: str,
+        request_hash: str,
+        command: CreateOrderCommand,
+        create_order: Callable[[CreateOrderCommand], Awaitable[CreateOrderOut]],
+    ) -> CreateOrderOut:
+        record = await self.idempotency_repository.reserve(
+            key=key,
+            request_hash=request_hash,
+            expired_before=datetime.now() - timedelta(seconds=settings.orders.IDEMPOTENCY_KEY_TTL_SECONDS),
+            # Запрос без ответа дольше времени ожидания оплаты считается прерванным, ключ можно занять снова
+            in_progress_expired_before=datetime.now() - timedelta(seconds=settings.orders.PENDING_TIMEOUT_SECONDS),
         )
+        await self.commiter.commit()
+
+        if record is not None:
+            if record.request_hash != request_hash:
+                raise IdempotencyKeyReusedException
+            if record.response is None:
+                raise IdempotentRequestInProgressException
+            if record.response == UNKNOWN_OUTCOME_RESPONSE:
+                raise IdempotentRequestOutcomeUnknownException
+            logger.info('Order is returned by idempotency key', extra={'order_id': record.response['id']})
+            return load_create_order_out(record.response)
+
+        try:
+            result = await create_order(command)
+        except PaymentOutcomeUnknownException:
+            # Банк мог создать платеж, поэтому ключ не освобождается: повтор не должен создать второй платеж
+            await self.commiter.rollback()
+            await self.idempotency_repository.complete(key=key, response=UNKNOWN_OUTCOME_RESPONSE)
+            await self.commiter.commit()
+            raise
+        except Exception:
+            # Ключ освобождается, чтобы клиент мог повторить запрос после ошибки
+            await self.commiter.rollback()
+            await self.idempotency_repository.delete(key)
+            await self.commiter.commit()
+            raise
+
+        await self.idempotency_repository.complete(key=key, response=dump_create_order_out(result))
+        await self.commiter.commit()
+        return result
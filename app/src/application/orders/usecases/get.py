@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from uuid import UUID
 
 from src.application.orders.commands import GetManyOrdersCommand
-from src.application.orders.dto import OrderItemOut, OrderOut
+from src.application.orders.dto import OrderItemOut, OrderOut, OrderPaymentOut
 from src.domain.orders.exceptions import OrderNotFoundException
 from src.domain.orders.repository import OrderRepositoryInterface
 
@@ -104,3 +104,20 @@ class GetOrderUseCase:
             status=order.status,
             items=order_items,
         )
+
+
+@dataclass
+class GetOrderPaymentUseCase:
+    order_repository: OrderRepositoryInterface
+
+    async def execute(self, order_id: UUID) -> OrderPaymentOut:
+        order = await self.order_repository.get_by_id(order_id)
+        if not order:
+            raise OrderNotFoundException
+
+        return OrderPaymentOut(
+            id=order.id,
+            status=order.status,
+            operation_id=order.operation_id,
+            payment_link=order.payment_link,
+        )
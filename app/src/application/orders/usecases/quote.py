@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+
+from src.application.orders.calculation import calculate_order_total_price
+from src.application.orders.commands import QuoteOrderCommand
+from src.application.orders.dto import OrderQuoteItemOut, OrderQuoteOut
+from src.application.orders.interface import OrderQuoteCacheInterface
+from src.application.orders.utils import get_order_products, price_order_products
+from src.application.products.interface import ProductCacheInterface
+from src.domain.products.repository import ProductRepositoryInterface
+from src.domain.products.value_objects import ProductPrice
+
+
+@dataclass
+class QuoteOrderUseCase:
+    """
+    Считает стоимость корзины по тем же правилам, что и создание заказа, без обращения в банк.
+    Результат запоминается для корзины, способа получения, способа оплаты и версии каталога
+    """
+
+    product_repository: ProductRepositoryInterface
+    product_cache: ProductCacheInterface
+    quote_cache: OrderQuoteCacheInterface
+
+    async def execute(self, command: QuoteOrderCommand) -> OrderQuoteOut:
+        # Версия берется до чтения товаров, чтобы расчет по старым ценам не попал под новую версию
+        catalog_version = self.product_cache.version
+        key = (
+            catalog_version,
+            command.is_self_pickup,
+            command.payment_method,
+            tuple((item.id, item.quantity) for item in command.items),
+        )
+        quote = self.quote_cache.get(key)
+        if quote is not None:
+            return quote
+
+        products = await get_order_products(self.product_repository, command.items)
+        products_in_payment = price_order_products(
+            products=products,
+            order_products=command.items,
+            is_self_pickup=command.is_self_pickup,
+            payment_method=command.payment_method,
+        )
+
+        quote = OrderQuoteOut(
+            items=[
+                OrderQuoteItemOut(
+                    product_id=product.id,
+                    name=product.name,
+                    quantity=product_in_payment.quantity,
+                    price=ProductPrice(product_in_payment.amount).in_rubles(),
+                    total_price=ProductPrice(product_in_payment.amount * product_in_payment.quantity).in_rubles(),
+                )
+                for product, product_in_payment in zip(products, products_in_payment)
+            ],
+            total_price=calculate_order_total_price(products_in_payment).in_rubles(),
+            catalog_version=catalog_version,
+        )
+        self.quote_cache.set(key, quote)
+
+        return quote
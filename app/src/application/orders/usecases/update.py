@@ -1,16 +1,21 @@
 import logging
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from src.application.acquiring.enums import AcquiringWebhookType
 from src.application.acquiring.exceptions import IncorrectAcqioringWebhookTypeException
-from src.application.acquiring.interface import AcquiringGatewayInterface
 from src.application.common.email.types import SenderName
 from src.application.common.email.utils import get_new_order_template
 from src.application.common.interfaces.jwt_processor import JWTProcessorInterface
-from src.application.common.interfaces.smtp import SyncSMTPServerInterface
+from src.application.common.interfaces.outbox import (
+    OutboxHandlerInterface,
+    OutboxRepositoryInterface,
+)
+from src.application.common.interfaces.smtp import SMTPServerInterface
 from src.application.common.interfaces.transaction import ICommiter
+from src.application.common.outbox import OutboxMessage, OutboxMessageType
 from src.application.orders.commands import UpdateOrderCommand
 from src.domain.orders.entities import OrderStatus
 from src.domain.orders.exceptions import OrderNotFoundException
@@ -46,10 +51,8 @@ class UpdateOrderUseCase:
 @dataclass
 class UpdateOrderByWebhookUseCase:
     order_repository: OrderRepositoryInterface
-    acquiring_gateway: AcquiringGatewayInterface
-    smtp_server: SyncSMTPServerInterface
+    outbox_repository: OutboxRepositoryInterface
     jwt_processor: JWTProcessorInterface
-    sender_name: SenderName
     commiter: ICommiter
 
     async def execute(self, token: str) -> None:
@@ -64,16 +67,37 @@ class UpdateOrderByWebhookUseCase:
 
         order.status = OrderStatus.APPROVED
         await self.order_repository.update(order=order)
+        await self.outbox_repository.add(
+            OutboxMessage.create(type=OutboxMessageType.NEW_ORDER_EMAIL, payload={'order_id': str(order.id)}),
+        )
+        await self.commiter.commit()
+
+        logger.info('Order updated by webhook', extra={'order_id': order.id})
+        return None
+
+
+@dataclass
+class SendNewOrderEmailUseCase(OutboxHandlerInterface):
+    order_repository: OrderRepositoryInterface
+    smtp_server: SMTPServerInterface
+    sender_name: SenderName
+    commiter: ICommiter
 
-        email_content = get_new_order_template(order)
+    async def execute(self, payload: dict[str, Any]) -> None:
+        order = await self.order_repository.get_by_id(order_id=UUID(payload['order_id']))
+        if not order:
+            raise OrderNotFoundException
+        # Транзакция чтения завершается до отправки письма, чтобы соединение не простаивало на время SMTP
+        await self.commiter.commit()
+
+        email_content = await get_new_order_template(order)
         message = self.smtp_server.create_message(
             content=email_content,
             sender_name=self.sender_name,
             to_address=settings.smtp.ADMINISTRATOR_EMAIL,
             subject='Новый заказ',
         )
-        await self.smtp_server.send_email(message=message)
-        await self.commiter.commit()
+        await self.smtp_server.deliver(message=message)
 
-        logger.info('Order updated by webhook', extra={'order_id': order.id})
+        logger.info('New order email sent', extra={'order_id': order.id})
         return None
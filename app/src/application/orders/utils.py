@@ -1,7 +1,11 @@
 from src.application.orders.calculation import calculate_order_product_price
 from src.application.orders.dto import ProductInOrder
+from src.application.orders.pricing import Cart, PriceTable, price_cart
 from src.application.products.dto import PaymentMethod, ProductInPaymentDTO
+from src.domain.orders.exceptions import DuplicateOrderPositionsException
 from src.domain.products.entities import Product
+from src.domain.products.exceptions import ManyProductsNotFoundException
+from src.domain.products.repository import ProductRepositoryInterface
 
 
 def create_product_in_payment_list(
@@ -28,3 +32,51 @@ def create_product_in_payment_list(
         )
         for product, item in zip(products, order_products)
     )
+
+
+async def get_order_products(
+    product_repository: ProductRepositoryInterface,
+    order_products: list[ProductInOrder],
+) -> list[Product]:
+    """Возвращает товары позиций заказа в порядке позиций"""
+    products_ids = set()
+    for product_item in order_products:
+        if product_item.id in products_ids:
+            raise DuplicateOrderPositionsException(product_item.id)
+        products_ids.add(product_item.id)
+
+    products, missing_products = await product_repository.get_many_by_ids(product_ids=products_ids)
+    if missing_products:
+        raise ManyProductsNotFoundException(missing_products)
+
+    products_by_id = {product.id: product for product in products}
+    return [products_by_id[product_item.id] for product_item in order_products]
+
+
+def price_order_products(
+    products: list[Product],
+    order_products: list[ProductInOrder],
+    is_self_pickup: bool,
+    payment_method: PaymentMethod,
+) -> tuple[ProductInPaymentDTO, ...]:
+    """
+    Считает цены позиций заказа через `PriceTable`: правила цены выбираются один раз для всей корзины.
+    `products` должны идти в порядке позиций
+    """
+    cart = Cart.create(
+        products=range(len(products)),
+        quantities=[item.quantity for item in order_products],
+        is_self_pickup=is_self_pickup,
+        payment_method=payment_method,
+    )
+    prices = price_cart(PriceTable.from_products(products), cart)
+    return tuple(
+        ProductInPaymentDTO(
+            name=product.name,
+            amount=amount,
+            quantity=item.quantity,
+            payment_method=PaymentMethod.FULL_PAYMENT,
+            measure=product.units_of_measurement,
+        )
+        for product, item, amount in zip(products, order_products, prices.amounts)
+    )
@@ -34,6 +34,7 @@ class GetManyProductsCommand:
     units_of_measurement: UnitsOfMesaurement | None
 
     pagination: PaginationQuery
+    search: str | None = None
 
 
 @dataclass
@@ -3,8 +3,9 @@ from dataclasses import dataclass
 from src.domain.products.entities import ProductStatus, UnitsOfMesaurement
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProductFilters:
+    search: str | None = None
     name: str | None = None
     category: str | None = None
     description: str | None = None
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class ProductCacheInterface(ABC):
+    @property
+    @abstractmethod
+    def version(self) -> str:
+        """Версия записей кэша в этом процессе, меняется при каждой инвалидации"""
+        ...
+
+    @abstractmethod
+    def invalidate(self) -> None: ...
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]: ...
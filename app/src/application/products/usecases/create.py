@@ -6,6 +6,7 @@ from src.application.products.commands import (
     CreateCategoryCommand,
     CreateProductCommand,
 )
+from src.application.products.interface import ProductCacheInterface
 from src.domain.products.entities import Category, Product
 from src.domain.products.repository import (
     CategoryRepositoryInterface,
@@ -18,6 +19,7 @@ from src.domain.products.value_objects import ProductPrice
 class CreateProductUseCase:
     product_repository: ProductRepositoryInterface
     commiter: ICommiter
+    product_cache: ProductCacheInterface
 
     async def execute(self, command: CreateProductCommand) -> None:
         category_name = command.category.lower().replace(r'/', '-')
@@ -40,6 +42,7 @@ class CreateProductUseCase:
 
         await self.product_repository.create(product=product)
         await self.commiter.commit()
+        self.product_cache.invalidate()
 
         return None
 
@@ -48,6 +51,7 @@ class CreateProductUseCase:
 class CreateCategoryUseCase:
     category_repository: CategoryRepositoryInterface
     commiter: ICommiter
+    product_cache: ProductCacheInterface
 
     async def execute(self, command: CreateCategoryCommand) -> None:
         category_name = command.name.lower().replace(r'/', '-')
@@ -55,5 +59,6 @@ class CreateCategoryUseCase:
 
         await self.category_repository.create(category=category)
         await self.commiter.commit()
+        self.product_cache.invalidate()
 
         return None
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
 from src.application.common.interfaces.transaction import ICommiter
+from src.application.products.interface import ProductCacheInterface
 from src.domain.products.repository import CategoryRepositoryInterface
 
 
@@ -8,9 +9,11 @@ from src.domain.products.repository import CategoryRepositoryInterface
 class DeleteCategoryUseCase:
     category_repository: CategoryRepositoryInterface
     commiter: ICommiter
+    product_cache: ProductCacheInterface
 
     async def execute(self, category_name: str) -> None:
         await self.category_repository.delete(category_name=category_name)
         await self.commiter.commit()
+        self.product_cache.invalidate()
 
         return None
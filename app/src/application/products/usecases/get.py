@@ -1,11 +1,16 @@
 from dataclasses import dataclass
 from uuid import UUID
 
-from src.application.common.pagination import ListPaginatedResponse, PaginationOutSchema
+from src.application.common.exceptions import SearchCursorNotSupportedException
+from src.application.common.pagination import (
+    ListPaginatedResponse,
+    PaginationOutSchema,
+    next_cursor,
+)
 from src.application.products.commands import GetManyProductsCommand
 from src.application.products.dto import ProductOut
 from src.application.products.filters import ProductFilters
-from src.domain.products.entities import Category
+from src.domain.products.entities import CatalogVersion, Category
 from src.domain.products.exceptions import ProductNotFoundException
 from src.domain.products.repository import (
     CategoryRepositoryInterface,
@@ -13,6 +18,14 @@ from src.domain.products.repository import (
 )
 
 
+@dataclass
+class GetCatalogVersionUseCase:
+    product_repository: ProductRepositoryInterface
+
+    async def execute(self) -> CatalogVersion:
+        return await self.product_repository.get_catalog_version()
+
+
 @dataclass
 class GetProductUseCase:
     product_repository: ProductRepositoryInterface
@@ -51,6 +64,7 @@ class GetManyProductsUseCase:
         command: GetManyProductsCommand,
     ) -> ListPaginatedResponse[ProductOut]:
         filters = ProductFilters(
+            search=command.search,
             name=command.name,
             category=command.category,
             description=command.description,
@@ -59,13 +73,25 @@ class GetManyProductsUseCase:
             price_to=command.price_to * 100 if command.price_to else None,
         )
 
-        products = await self.product_repository.get_many(
-            filters=filters,
-            offset=command.pagination.offset,
-            limit=command.pagination.limit,
-        )
+        # Выдача, отсортированная по релевантности, не продолжается курсором
+        if command.search and command.pagination.cursor:
+            raise SearchCursorNotSupportedException
+
+        after = command.pagination.after
 
-        total = await self.product_repository.count(filters=filters)
+        if after:
+            products = await self.product_repository.get_many(
+                filters=filters,
+                limit=command.pagination.limit,
+                after=after,
+            )
+            total = await self.product_repository.count(filters=filters)
+        else:
+            products, total = await self.product_repository.get_many_with_count(
+                filters=filters,
+                offset=command.pagination.offset,
+                limit=command.pagination.limit,
+            )
 
         return ListPaginatedResponse(
             items=[
@@ -93,6 +119,11 @@ class GetManyProductsUseCase:
                 limit=command.pagination.limit,
                 page=command.pagination.page,
                 total=total,
+                next_cursor=(
+                    None
+                    if command.search
+                    else next_cursor(products, command.pagination.limit, key=lambda product: product.name)
+                ),
             ),
         )
 
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 
 from src.application.common.interfaces.transaction import ICommiter
 from src.application.products.commands import UpdateProductCommand
+from src.application.products.interface import ProductCacheInterface
 from src.domain.products.exceptions import ProductNotFoundException
 from src.domain.products.repository import ProductRepositoryInterface
 from src.domain.products.value_objects import ProductPrice
@@ -14,6 +15,7 @@ logger = logging.getLogger()
 class UpdateProductUseCase:
     product_repository: ProductRepositoryInterface
     commiter: ICommiter
+    product_cache: ProductCacheInterface
 
     async def execute(self, command: UpdateProductCommand) -> None:
         product = await self.product_repository.get_by_id(product_id=command.product_id)
@@ -29,5 +31,6 @@ class UpdateProductUseCase:
 
         await self.product_repository.update(product=product)
         await self.commiter.commit()
+        self.product_cache.invalidate()
 
         return None
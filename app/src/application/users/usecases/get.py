@@ -1,7 +1,11 @@
 from dataclasses import dataclass
 from uuid import UUID
 
-from src.application.common.pagination import ListPaginatedResponse, PaginationOutSchema
+from src.application.common.pagination import (
+    ListPaginatedResponse,
+    PaginationOutSchema,
+    next_cursor,
+)
 from src.application.orders.dto import OrderItemOut, OrderOut
 from src.application.users.commands import GetUsersListCommand
 from src.application.users.dto import UserOut
@@ -39,6 +43,7 @@ class GetUsersListUseCase:
             offset=command.pagiantion.offset,
             limit=command.pagiantion.limit,
             search=command.search,
+            after=command.pagiantion.after,
         )
         total = await self.user_repository.count(search=command.search)
 
@@ -55,7 +60,12 @@ class GetUsersListUseCase:
                 )
                 for user in users
             ],
-            pagination=PaginationOutSchema(limit=command.pagiantion.limit, page=command.pagiantion.page, total=total),
+            pagination=PaginationOutSchema(
+                limit=command.pagiantion.limit,
+                page=command.pagiantion.page,
+                total=total,
+                next_cursor=next_cursor(users, command.pagiantion.limit, key=lambda user: user.email),
+            ),
         )
 
 
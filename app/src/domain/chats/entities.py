@@ -2,6 +2,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from uuid import UUID, uuid4
 
+from src.domain.chats.exceptions import MessageTooLongException
+
+MESSAGE_MAX_LENGTH = 1000
+"""Сообщение с запасом помещается в Postgres NOTIFY (до 8000 байт) при рассылке в чат"""
+
 
 @dataclass
 class Chat:
@@ -36,6 +41,8 @@ class Message:
 
     @staticmethod
     def create(user_id: UUID, chat_id: UUID, content: str) -> 'Message':
+        if len(content) > MESSAGE_MAX_LENGTH:
+            raise MessageTooLongException
         current_date = datetime.now()
         return Message(
             id=uuid4(),
@@ -9,6 +9,12 @@ class ChatNotFoundException(ApplicationException):
     message: str = 'Chat not found'
 
 
+@dataclass
+class MessageTooLongException(ApplicationException):
+    status_code: int = 400
+    message: str = 'Message is too long'
+
+
 @dataclass
 class MessageNotFoundException(ApplicationException):
     status_code: int = 404
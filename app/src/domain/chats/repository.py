@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from uuid import UUID
 
+from src.application.common.pagination import PageCursor
 from src.domain.chats.entities import Chat, Message
 
 
@@ -39,6 +40,7 @@ class ChatRepositoryInterface(ABC):
         owner_id: UUID | None = None,
         offset: int = 0,
         limit: int = 100,
+        after: PageCursor | None = None,
     ) -> list[Chat]: ...
 
     @abstractmethod
@@ -49,6 +51,9 @@ class MessageRepositoryInterface(ABC):
     @abstractmethod
     async def create(self, message: Message) -> None: ...
 
+    @abstractmethod
+    async def create_many(self, messages: list[Message]) -> None: ...
+
     @abstractmethod
     async def update(self, message: Message) -> None: ...
 
@@ -62,7 +67,9 @@ class MessageRepositoryInterface(ABC):
     async def get_by_id(self, message_id: UUID) -> Message | None: ...
 
     @abstractmethod
-    async def get_by_chat_id(self, chat_id: UUID, offset: int = 0, limit: int = 10) -> list[Message]: ...
+    async def get_by_chat_id(self, chat_id: UUID, limit: int = 50, before: PageCursor | None = None) -> list[Message]:
+        """Сообщения чата от новых к старым, начиная с сообщения перед курсором `before`"""
+        ...
 
     @abstractmethod
     async def get_many(
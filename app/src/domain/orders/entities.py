@@ -10,6 +10,7 @@ from src.domain.products.value_objects import ProductPrice
 
 # fmt: off
 class OrderStatus(str, Enum):
+    PENDING = "PENDING"         # Заказ сохранен, платеж еще не создан
     CREATED = "CREATED"         # Заказ создан и ожидает оплаты
     APPROVED = "APPROVED"       # Заказ оплачен
     PROCESSING = "PROCESSING"   # Заказ в обработке
@@ -27,18 +28,19 @@ class Order:
     created_at: datetime
     updated_at: datetime
     shipping_address: str
-    operation_id: UUID
+    operation_id: UUID | None
     tracking_number: str | None
     total_price: int
     is_self_pickup: bool
     status: OrderStatus
+    payment_link: str | None = None
 
     items: list['OrderItem'] = field(default_factory=list)
 
     @staticmethod
     def create(
         customer_email: str,
-        operation_id: UUID,
+        operation_id: UUID | None,
         shipping_address: str,
         total_price: int,
         is_self_pickup: bool,
@@ -59,6 +61,16 @@ class Order:
             status=status,
         )
 
+    def attach_payment(self, operation_id: UUID, payment_link: str) -> None:
+        self.operation_id = operation_id
+        self.payment_link = payment_link
+        self.status = OrderStatus.CREATED
+        self.updated_at = datetime.now()
+
+    def fail(self) -> None:
+        self.status = OrderStatus.FAILED
+        self.updated_at = datetime.now()
+
 
 @dataclass
 class OrderItem:
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from datetime import date
+from datetime import date, datetime
 from enum import Enum
 from uuid import UUID
 
@@ -44,6 +44,10 @@ class OrderRepositoryInterface(ABC):
         status: OrderStatus | None = None,
     ) -> list[Order]: ...
 
+    @abstractmethod
+    async def fail_pending(self, created_before: datetime) -> int:
+        """Переводит в FAILED заказы, которые остались в PENDING дольше допустимого"""
+
     # @abstractmethod
     # async def count(
     #     self,
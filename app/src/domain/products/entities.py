@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
 from uuid import UUID, uuid4
 
@@ -97,3 +98,11 @@ class Product:
 
     def __hash__(self) -> int:
         return hash(self.id)
+
+
+@dataclass
+class CatalogVersion:
+    """Версия каталога в базе, общая для всех процессов. Меняется при каждом изменении товаров и категорий"""
+
+    version: int
+    updated_at: datetime
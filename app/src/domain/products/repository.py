@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
 
+from src.application.common.pagination import PageCursor
 from src.application.products.filters import ProductFilters
-from src.domain.products.entities import Category, Product
+from src.domain.products.entities import CatalogVersion, Category, Product
 
 
 class ProductRepositoryInterface(ABC):
@@ -27,11 +28,27 @@ class ProductRepositoryInterface(ABC):
         filters: ProductFilters | None = None,
         offset: int = 0,
         limit: int = 100,
-    ) -> list[Product]: ...
+        after: PageCursor | None = None,
+    ) -> list[Product]:
+        """`after` - cursor of the last seen product, rows are sorted by (name, id) when it is passed"""
+        ...
 
     @abstractmethod
     async def count(self, filters: ProductFilters | None = None) -> int: ...
 
+    @abstractmethod
+    async def get_many_with_count(
+        self,
+        filters: ProductFilters | None = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[Product], int]:
+        """
+        ### Returns:
+        `tuple[list[Product], int]` - a page of products and the total number of products matching the filters
+        """
+        ...
+
     @abstractmethod
     async def get_many_by_ids(self, product_ids: set[UUID]) -> tuple[list[Product], set[UUID]]:
         """
@@ -43,6 +60,9 @@ class ProductRepositoryInterface(ABC):
         """
         ...
 
+    @abstractmethod
+    async def get_catalog_version(self) -> CatalogVersion: ...
+
 
 class CategoryRepositoryInterface(ABC):
     @abstractmethod
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from uuid import UUID
 
+from src.application.common.pagination import PageCursor
 from src.domain.users.entities import User, UserSession
 
 
@@ -35,6 +36,7 @@ class UserRepositoryInterface(ABC):
         search: str | None = None,
         offset: int = 0,
         limit: int = 100,
+        after: PageCursor | None = None,
     ) -> list[User]: ...
 
     @abstractmethod
@@ -51,6 +53,9 @@ class UserSessionRepositoryInterface(ABC):
     @abstractmethod
     async def delete(self, session_id: UUID) -> None: ...
 
+    @abstractmethod
+    async def delete_by_user_id(self, user_id: UUID) -> None: ...
+
     @abstractmethod
     async def get_by_id(self, session_id: UUID) -> UserSession | None: ...
 
@@ -2,12 +2,12 @@ from uuid import UUID
 
 from src.application.auth.dto import UserData
 from src.application.auth.exceptions import NotAuthorizedException
+from src.application.auth.interface import SessionCacheInterface, TokenDenyListInterface
 from src.application.auth.roles import get_role_restrictions
 from src.application.common.interfaces.identity_provider import (
     IdentityProviderInterface,
 )
-
-# from src.application.common.interfaces.jwt_processor import JWTProcessorInterface
+from src.application.common.interfaces.jwt_processor import JWTProcessorInterface
 from src.domain.users.repository import (
     UserRepositoryInterface,
     UserSessionRepositoryInterface,
@@ -15,27 +15,38 @@ from src.domain.users.repository import (
 
 
 class SessionIdentityProvider(IdentityProviderInterface):
-    __slots__ = ('user_repository', 'session_repository')
+    __slots__ = ('user_repository', 'session_repository', 'session_cache')
 
     def __init__(
         self,
         user_repository: UserRepositoryInterface,
         session_repository: UserSessionRepositoryInterface,
+        session_cache: SessionCacheInterface,
     ) -> None:
         self.user_repository = user_repository
         self.session_repository = session_repository
+        self.session_cache = session_cache
 
     async def get_current_user(self, authorization: str | None) -> UserData:
         if not authorization:
             raise NotAuthorizedException
 
-        session = await self.session_repository.get_by_id(UUID(authorization))
+        try:
+            session_id = UUID(authorization)
+        except ValueError:
+            raise NotAuthorizedException
+
+        user_data = self.session_cache.get(session_id)
+        if user_data:
+            return user_data
+
+        session = await self.session_repository.get_by_id(session_id)
         if not session or not session.user:
             raise NotAuthorizedException
 
         role_scopes = get_role_restrictions(role=session.user.role)
 
-        return UserData(
+        user_data = UserData(
             user_id=session.user.id,
             email=session.user.email,
             mobile_phone=session.user.mobile_phone,
@@ -45,25 +56,39 @@ class SessionIdentityProvider(IdentityProviderInterface):
             role=session.user.role,
             scopes=role_scopes,
         )
+        self.session_cache.set(session_id, user_data, expires_at=session.expires_in)
 
+        return user_data
 
-# class TokenIdentityProvider(IdentityProviderInterface):
 
-#     __slots__ = ("jwt_processor",)
+class TokenIdentityProvider(IdentityProviderInterface):
+    """Проверяет подпись и срок действия access токена локально, без обращения к базе"""
 
-#     def __init__(
-#         self,
-#         jwt_processor: JWTProcessorInterface,
-#     ) -> None:
-#         self.jwt_processor = jwt_processor
+    __slots__ = ('jwt_processor', 'deny_list')
 
-#     async def get_current_user(
-#         self,
-#         authorization: str | None,
-#     ) -> UserData:
-#         if not authorization:
-#             raise NotAuthorizedException
+    def __init__(
+        self,
+        jwt_processor: JWTProcessorInterface,
+        deny_list: TokenDenyListInterface,
+    ) -> None:
+        self.jwt_processor = jwt_processor
+        self.deny_list = deny_list
 
-#         user_data = self.jwt_processor.validate_access_token(token=authorization)
+    async def get_current_user(self, authorization: str | None) -> UserData:
+        if not authorization:
+            raise NotAuthorizedException
 
-#         return user_data
+        token_data = self.jwt_processor.validate_access_token(token=authorization.removeprefix('Bearer '))
+        if self.deny_list.is_revoked(token_data.jti):
+            raise NotAuthorizedException
+
+        return UserData(
+            user_id=token_data.user_id,
+            email=token_data.email,
+            mobile_phone=token_data.mobile_phone,
+            first_name=token_data.first_name,
+            last_name=token_data.last_name,
+            is_verified=token_data.is_verified,
+            role=token_data.role,
+            scopes=token_data.scopes,
+        )
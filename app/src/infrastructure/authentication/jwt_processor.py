@@ -1,13 +1,16 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, cast
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import jwt
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey, RSAPublicKey
 from src.application.auth.dto import UserTokenData
 from src.application.auth.exceptions import (
+    NotAuthorizedException,
     TokenExpiredException,
     WrongTokenTypeException,
 )
@@ -17,7 +20,8 @@ from src.application.common.interfaces.jwt_processor import (
     TokenType,
 )
 from src.domain.common.exceptions.base import ApplicationException
-from src.domain.users.entities import UserRole
+from src.domain.users.entities import User, UserRole
+from src.infrastructure.cache.memory import MemoryCache
 from src.infrastructure.settings import settings
 
 
@@ -28,16 +32,41 @@ def load_rsa_private_key() -> RSAPrivateKey:
     return cast(RSAPrivateKey, rsa_key)
 
 
+def load_rsa_public_key() -> RSAPublicKey:
+    key = settings.jwt.PUBLIC_KEY
+    formatted_key = key.replace('\\n', '\n')
+    rsa_key = serialization.load_pem_public_key(data=formatted_key.encode(), backend=default_backend())
+    return cast(RSAPublicKey, rsa_key)
+
+
 class JWTProcessor(JWTProcessorInterface):
+    """
+    Ключи разбираются один раз при импорте модуля.
+    Проверенные access токены кэшируются до истечения `exp`.
+    Размер кэша задается `ACCESS_TOKEN_CACHE_MAX_SIZE`, 0 отключает кэш
+    """
+
     private_key: RSAPrivateKey = load_rsa_private_key()
+    public_key: RSAPublicKey = load_rsa_public_key()
     acquiring_key: jwt.PyJWK = jwt.PyJWK.from_json(settings.acquiring.PUBLIC_KEY)
 
-    def create_access_token(self, user_id: UUID, user_role: UserRole, email: str) -> str:
-        user_scopes = get_role_restrictions(role=user_role)
+    def __init__(self, token_cache_size: int = 0) -> None:
+        self.token_cache: MemoryCache[bytes, UserTokenData] | None = None
+        if token_cache_size > 0:
+            self.token_cache = MemoryCache(maxsize=token_cache_size)
+
+    def create_access_token(self, user: User) -> str:
+        user_scopes = get_role_restrictions(role=user.role)
         payload: dict[str, Any] = {
-            'sub': str(user_id),
+            'sub': str(user.id),
+            'jti': uuid4().hex,
             'scopes': user_scopes,
-            'email': str(email),
+            'role': user.role.value,
+            'email': str(user.email),
+            'mobile_phone': user.mobile_phone,
+            'first_name': user.first_name,
+            'last_name': user.last_name,
+            'is_verified': user.is_verified,
             'exp': datetime.now(timezone.utc) + timedelta(minutes=settings.jwt.ACCESS_TOKEN_EXPIRE_MINUTES),
         }
         return self._generate_token(token_type=TokenType.ACCESS, payload=payload)
@@ -60,26 +89,50 @@ class JWTProcessor(JWTProcessorInterface):
 
     def validate_access_token(self, token: str) -> UserTokenData:
         """Returns a user id from token."""
+        if self.token_cache is None:
+            return self._decode_access_token(token=token)
+
+        key = hashlib.sha256(token.encode()).digest()
+        token_data = self.token_cache.get(key)
+        if token_data is not None:
+            if token_data.expires_at.timestamp() > time.time():
+                return token_data
+            self.token_cache.delete(key)
+
+        token_data = self._decode_access_token(token=token)
+        self.token_cache.set(key, token_data, ttl=token_data.expires_at.timestamp() - time.time())
+
+        return token_data
+
+    def _decode_access_token(self, token: str) -> UserTokenData:
         try:
-            payload = jwt.decode(jwt=token, key=settings.jwt.PUBLIC_KEY, algorithms=[settings.jwt.ALGORITHM])
-            user_id: str = payload.get('sub')
-            user_scopes: str = payload.get('scopes')
-            user_email: str = payload.get('email')
-            token_type: str = payload.get('type')
+            payload = jwt.decode(jwt=token, key=self.public_key, algorithms=[settings.jwt.ALGORITHM])
+            token_type = payload.get('type')
 
-            if token_type == TokenType.REFRESH.value:
+            if token_type != TokenType.ACCESS.value:
                 raise WrongTokenTypeException
 
-            return UserTokenData(user_id=UUID(user_id), email=user_email, scopes=user_scopes)
+            return UserTokenData(
+                user_id=UUID(payload['sub']),
+                email=payload['email'],
+                scopes=payload['scopes'],
+                jti=payload['jti'],
+                expires_at=datetime.fromtimestamp(payload['exp'], tz=timezone.utc),
+                role=UserRole(payload['role']),
+                mobile_phone=payload.get('mobile_phone'),
+                first_name=payload.get('first_name'),
+                last_name=payload.get('last_name'),
+                is_verified=payload.get('is_verified', False),
+            )
         except jwt.ExpiredSignatureError:
             raise TokenExpiredException
-        except (jwt.DecodeError, ValueError, KeyError):
-            raise ApplicationException
+        except (jwt.InvalidTokenError, ValueError, KeyError, TypeError):
+            raise NotAuthorizedException
 
     def validate_refresh_token(self, token: str) -> UUID:
         """Returns a user id from token."""
         try:
-            payload = jwt.decode(jwt=token, key=settings.jwt.PUBLIC_KEY, algorithms=[settings.jwt.ALGORITHM])
+            payload = jwt.decode(jwt=token, key=self.public_key, algorithms=[settings.jwt.ALGORITHM])
             user_id = payload.get('sub')
             token_type = payload.get('type')
             if token_type == TokenType.ACCESS.value:
@@ -93,14 +146,14 @@ class JWTProcessor(JWTProcessorInterface):
 
     def validate_reset_password_token(self, token: str) -> dict[str, Any]:
         try:
-            payload = jwt.decode(jwt=token, key=settings.jwt.PUBLIC_KEY, algorithms=[settings.jwt.ALGORITHM])
-            return cast(dict[str, Any], payload)
+            payload = jwt.decode(jwt=token, key=self.public_key, algorithms=[settings.jwt.ALGORITHM])
+            return payload
         except (jwt.DecodeError, ValueError, KeyError):
             raise ApplicationException
 
     def validate_acquiring_token(self, token: str) -> dict[str, Any]:
         try:
             payload = jwt.decode(jwt=token, key=self.acquiring_key, algorithms=[settings.acquiring.ALGORITHM])
-            return cast(dict[str, Any], payload)
+            return payload
         except (jwt.DecodeError, ValueError, KeyError):
             raise ApplicationException
@@ -1,15 +1,63 @@
-from typing import cast
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar, cast
 
 from passlib.context import CryptContext
+from src.application.auth.exceptions import AuthServiceOverloadedException
 from src.application.common.interfaces.password_hasher import PasswordHasherInterface
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+TResult = TypeVar("TResult")
+
 
 class PasswordHasher(PasswordHasherInterface):
+    """
+    Выполняет bcrypt в отдельном пуле потоков, чтобы не блокировать event loop.
+    Если в очереди больше `max_queue_size` задач, новые запросы сразу отклоняются
+    """
+
+    __slots__ = ("max_workers", "max_queue_size", "_executor", "_pending", "_completed", "_rejected", "_total_seconds")
+
+    def __init__(self, max_workers: int = 1, max_queue_size: int = 64) -> None:
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password_hasher")
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_seconds = 0.0
+
+    async def hash(self, password: str) -> str:
+        return cast(str, await self._run(pwd_context.hash, password))
+
+    async def verify(self, password: str, hash: str) -> bool:
+        return cast(bool, await self._run(pwd_context.verify, password, hash))
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "max_queue_size": self.max_queue_size,
+            "pending": self._pending,
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "avg_seconds": self._total_seconds / self._completed if self._completed else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
 
-    def hash(self, password: str) -> str:
-        return cast(str, pwd_context.hash(password))
+    async def _run(self, func: Callable[..., TResult], *args: Any) -> TResult:
+        if self._pending >= self.max_workers + self.max_queue_size:
+            self._rejected += 1
+            raise AuthServiceOverloadedException
 
-    def verify(self, password: str, hash: str) -> bool:
-        return cast(bool, pwd_context.verify(password, hash))
+        self._pending += 1
+        started_at = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+            self._completed += 1
+            self._total_seconds += time.perf_counter() - started_at
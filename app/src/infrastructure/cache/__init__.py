@@ -0,0 +1,3 @@
+from .memory import CacheStats, MemoryCache
+
+__all__ = ['CacheStats', 'MemoryCache']
@@ -0,0 +1,67 @@
+import json
+import logging
+from collections import defaultdict
+from typing import Any
+
+from src.application.common.interfaces.invalidation import (
+    InvalidationBusInterface,
+    InvalidationHandler,
+    InvalidationTopic,
+)
+from src.infrastructure.persistence.postgresql.listener import PostgresListener
+from src.infrastructure.persistence.postgresql.notify import (
+    INVALIDATION_CHANNEL,
+    make_invalidation_payload,
+)
+
+logger = logging.getLogger()
+
+
+class PostgresInvalidationBus(PostgresListener, InvalidationBusInterface):
+    """
+    Держит одно LISTEN соединение на процесс и передает полученные события подписчикам.
+    Пока соединение потеряно, события могут быть пропущены, поэтому после переподключения
+    подписчики всех тем получают `None` и сбрасывают свои кэши целиком
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str = INVALIDATION_CHANNEL,
+        min_backoff: float = 0.5,
+        max_backoff: float = 30,
+    ) -> None:
+        super().__init__(dsn=dsn, channel=channel, min_backoff=min_backoff, max_backoff=max_backoff)
+        self._handlers: defaultdict[InvalidationTopic, list[InvalidationHandler]] = defaultdict(list)
+
+    def subscribe(self, topic: InvalidationTopic, handler: InvalidationHandler) -> None:
+        self._handlers[topic].append(handler)
+
+    async def publish(self, topic: InvalidationTopic, key: str | None = None) -> None:
+        if not await self._notify(make_invalidation_payload(topic, key)):
+            logger.warning('Invalidation bus is not connected, event is dispatched locally', extra={'topic': topic})
+            self._dispatch(topic, key)
+
+    def _on_connected(self) -> None:
+        self._dispatch_all()
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            event = json.loads(payload)
+            topic = InvalidationTopic(event['topic'])
+        except (ValueError, KeyError, TypeError):
+            logger.warning('Invalid invalidation event', extra={'payload': payload})
+            return None
+
+        self._dispatch(topic, event.get('key'))
+
+    def _dispatch(self, topic: InvalidationTopic, key: str | None) -> None:
+        for handler in self._handlers.get(topic, []):
+            try:
+                handler(key)
+            except Exception as exc:
+                logger.error('Invalidation handler failed', exc_info=exc)
+
+    def _dispatch_all(self) -> None:
+        for topic in list(self._handlers):
+            self._dispatch(topic, None)
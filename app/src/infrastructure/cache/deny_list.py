@@ -0,0 +1,56 @@
+import time
+from datetime import datetime
+from typing import Any
+
+from src.application.auth.interface import TokenDenyListInterface
+from src.application.common.interfaces.invalidation import (
+    InvalidationBusInterface,
+    InvalidationTopic,
+)
+
+
+class MemoryTokenDenyList(TokenDenyListInterface):
+    """
+    Список `jti` отозванных токенов в памяти процесса.
+    Отзыв рассылается остальным процессам через шину инвалидации, записи удаляются после истечения токена
+    """
+
+    __slots__ = ('invalidation_bus', '_revoked', '_next_purge_at')
+
+    PURGE_INTERVAL_SECONDS = 60
+
+    def __init__(self, invalidation_bus: InvalidationBusInterface) -> None:
+        self.invalidation_bus = invalidation_bus
+        self._revoked: dict[str, float] = {}
+        self._next_purge_at = 0.0
+        invalidation_bus.subscribe(InvalidationTopic.ACCESS_TOKEN, self._on_revoked)
+
+    async def revoke(self, jti: str, expires_at: datetime) -> None:
+        self._add(jti, expires_at.timestamp())
+        await self.invalidation_bus.publish(InvalidationTopic.ACCESS_TOKEN, f'{jti}:{int(expires_at.timestamp())}')
+
+    def is_revoked(self, jti: str) -> bool:
+        now = time.time()
+        self._purge(now)
+        expires_at = self._revoked.get(jti)
+        return expires_at is not None and expires_at > now
+
+    def stats(self) -> dict[str, Any]:
+        return {'size': len(self._revoked)}
+
+    def _add(self, jti: str, expires_at: float) -> None:
+        if expires_at > time.time():
+            self._revoked[jti] = expires_at
+
+    def _on_revoked(self, key: str | None) -> None:
+        # Событие без ключа означает переподключение шины, отозванные токены при этом не сбрасываются
+        if not key:
+            return None
+        jti, _, expires_at = key.partition(':')
+        self._add(jti, float(expires_at))
+
+    def _purge(self, now: float) -> None:
+        if now < self._next_purge_at:
+            return None
+        self._next_purge_at = now + self.PURGE_INTERVAL_SECONDS
+        self._revoked = {jti: expires_at for jti, expires_at in self._revoked.items() if expires_at > now}
@@ -0,0 +1,48 @@
+import asyncio
+from typing import Any
+
+from src.application.common.interfaces.idempotency import InFlightRequestsInterface
+
+
+class MemoryInFlightRequests(InFlightRequestsInterface):
+    """
+    Ограниченный реестр выполняемых в этом процессе запросов.
+    Повтор запроса ждет future первого запроса. Если реестр заполнен, повторы идут через базу
+    """
+
+    __slots__ = ('maxsize', '_futures', '_joined', '_rejected')
+
+    def __init__(self, maxsize: int = 10000) -> None:
+        self.maxsize = maxsize
+        self._futures: dict[str, asyncio.Future[Any]] = {}
+        self._joined = 0
+        self._rejected = 0
+
+    def get(self, key: str) -> asyncio.Future[Any] | None:
+        future = self._futures.get(key)
+        if future is not None:
+            self._joined += 1
+        return future
+
+    def register(self, key: str) -> asyncio.Future[Any] | None:
+        if len(self._futures) >= self.maxsize:
+            self._rejected += 1
+            return None
+        future = self._futures[key] = asyncio.get_running_loop().create_future()
+        return future
+
+    def resolve(self, key: str, result: Any = None, exc: BaseException | None = None) -> None:
+        future = self._futures.pop(key, None)
+        if future is None or future.done():
+            return None
+        if isinstance(exc, asyncio.CancelledError):
+            future.cancel()
+        elif exc is not None:
+            future.set_exception(exc)
+            # Ошибку получат только ожидающие повторы, без них asyncio не должен писать предупреждение
+            future.exception()
+        else:
+            future.set_result(result)
+
+    def stats(self) -> dict[str, Any]:
+        return {'size': len(self._futures), 'joined': self._joined, 'rejected': self._rejected}
@@ -0,0 +1,77 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, TypeVar
+
+TKey = TypeVar('TKey', bound=Hashable)
+TValue = TypeVar('TValue')
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+
+class MemoryCache(Generic[TKey, TValue]):
+    """
+    Ограниченный по размеру LRU кэш с временем жизни записей.
+    Не потокобезопасен, рассчитан на использование внутри одного event loop
+    """
+
+    __slots__ = ('maxsize', 'ttl', 'stats', '_data')
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._data: OrderedDict[TKey, tuple[float, TValue]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: TKey) -> TValue | None:
+        item = self._data.get(key)
+
+        if item is None:
+            self.stats.misses += 1
+            return None
+
+        expires_at, value = item
+
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.stats.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.stats.hits += 1
+
+        return value
+
+    def set(self, key: TKey, value: TValue, ttl: float | None = None) -> None:
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.stats.evictions += 1
+
+    def delete(self, key: TKey) -> None:
+        self._data.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[TKey, TValue], bool]) -> int:
+        """Удаляет все записи, подходящие под условие. Выполняется за O(n)"""
+        keys = [key for key, (_, value) in self._data.items() if predicate(key, value)]
+
+        for key in keys:
+            del self._data[key]
+
+        return len(keys)
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -0,0 +1,172 @@
+import copy
+import secrets
+from typing import Any, Hashable
+from uuid import UUID
+
+from src.application.common.pagination import PageCursor
+from src.application.products.filters import ProductFilters
+from src.application.products.interface import ProductCacheInterface
+from src.domain.products.entities import CatalogVersion, Product
+from src.domain.products.repository import ProductRepositoryInterface
+from src.infrastructure.cache.memory import MemoryCache
+
+
+class ProductCache(ProductCacheInterface):
+    """
+    Кэш товаров и страниц каталога.
+    Ключи записей включают версию каталога, поэтому после инвалидации старые записи недостижимы
+    """
+
+    def __init__(self, maxsize: int = 10_000, pages_maxsize: int = 1_000, ttl: float = 300) -> None:
+        self.products: MemoryCache[tuple[str, UUID], Product] = MemoryCache(maxsize=maxsize, ttl=ttl)
+        self.pages: MemoryCache[tuple[str, Hashable], Any] = MemoryCache(maxsize=pages_maxsize, ttl=ttl)
+        self._epoch = secrets.token_hex(4)
+        self._counter = 0
+
+    @property
+    def version(self) -> str:
+        return f'{self._epoch}.{self._counter}'
+
+    def invalidate(self) -> None:
+        self._counter += 1
+        self.products.clear()
+        self.pages.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            'version': self.version,
+            'products': {'size': len(self.products), **self.products.stats.as_dict()},
+            'pages': {'size': len(self.pages), **self.pages.stats.as_dict()},
+        }
+
+
+class CachedProductRepository(ProductRepositoryInterface):
+    """
+    Читает товары через `ProductCache`, запись делегирует репозиторию.
+    После записи в рамках текущей сессии кэш не используется, чтобы не сохранить в нем незакоммиченные данные
+    """
+
+    __slots__ = ('repository', 'cache', '_dirty')
+
+    def __init__(self, repository: ProductRepositoryInterface, cache: ProductCache) -> None:
+        self.repository = repository
+        self.cache = cache
+        self._dirty = False
+
+    async def create(self, product: Product) -> None:
+        self._dirty = True
+        await self.repository.create(product=product)
+
+    async def update(self, product: Product) -> None:
+        self._dirty = True
+        await self.repository.update(product=product)
+
+    async def delete(self, product_id: UUID) -> None:
+        self._dirty = True
+        await self.repository.delete(product_id=product_id)
+
+    async def get_by_id(self, product_id: UUID) -> Product | None:
+        if self._dirty:
+            return await self.repository.get_by_id(product_id=product_id)
+
+        key = (self.cache.version, product_id)
+        product = self.cache.products.get(key)
+
+        if product is None:
+            product = await self.repository.get_by_id(product_id=product_id)
+            if product is None:
+                return None
+            self.cache.products.set(key, product)
+
+        return copy.copy(product)
+
+    async def get_many_by_ids(self, product_ids: set[UUID]) -> tuple[list[Product], set[UUID]]:
+        if self._dirty:
+            return await self.repository.get_many_by_ids(product_ids=product_ids)
+
+        version = self.cache.version
+        products: list[Product] = []
+        missing: set[UUID] = set()
+
+        for product_id in product_ids:
+            product = self.cache.products.get((version, product_id))
+            if product is None:
+                missing.add(product_id)
+            else:
+                products.append(copy.copy(product))
+
+        if not missing:
+            return products, set()
+
+        fetched, not_found = await self.repository.get_many_by_ids(product_ids=missing)
+
+        for product in fetched:
+            self.cache.products.set((version, product.id), product)
+            products.append(copy.copy(product))
+
+        return products, not_found
+
+    async def get_many(
+        self,
+        filters: ProductFilters | None = None,
+        offset: int = 0,
+        limit: int = 100,
+        after: PageCursor | None = None,
+    ) -> list[Product]:
+        if self._dirty:
+            return await self.repository.get_many(filters=filters, offset=offset, limit=limit, after=after)
+
+        key = (self.cache.version, ('get_many', filters, offset, limit, after))
+        products: list[Product] | None = self.cache.pages.get(key)
+
+        if products is None:
+            products = await self.repository.get_many(filters=filters, offset=offset, limit=limit, after=after)
+            self.cache.pages.set(key, products)
+
+        return [copy.copy(product) for product in products]
+
+    async def count(self, filters: ProductFilters | None = None) -> int:
+        if self._dirty:
+            return await self.repository.count(filters=filters)
+
+        key = (self.cache.version, ('count', filters))
+        count: int | None = self.cache.pages.get(key)
+
+        if count is None:
+            count = await self.repository.count(filters=filters)
+            self.cache.pages.set(key, count)
+
+        return count
+
+    async def get_many_with_count(
+        self,
+        filters: ProductFilters | None = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[Product], int]:
+        if self._dirty:
+            return await self.repository.get_many_with_count(filters=filters, offset=offset, limit=limit)
+
+        key = (self.cache.version, ('get_many_with_count', filters, offset, limit))
+        page: tuple[list[Product], int] | None = self.cache.pages.get(key)
+
+        if page is None:
+            page = await self.repository.get_many_with_count(filters=filters, offset=offset, limit=limit)
+            self.cache.pages.set(key, page)
+
+        products, total = page
+
+        return [copy.copy(product) for product in products], total
+
+    async def get_catalog_version(self) -> CatalogVersion:
+        if self._dirty:
+            return await self.repository.get_catalog_version()
+
+        key = (self.cache.version, ('catalog_version',))
+        catalog_version: CatalogVersion | None = self.cache.pages.get(key)
+
+        if catalog_version is None:
+            catalog_version = await self.repository.get_catalog_version()
+            self.cache.pages.set(key, catalog_version)
+
+        return catalog_version
@@ -0,0 +1,24 @@
+from typing import Any, Hashable
+
+from src.application.orders.dto import OrderQuoteOut
+from src.application.orders.interface import OrderQuoteCacheInterface
+from src.infrastructure.cache.memory import MemoryCache
+
+
+class OrderQuoteCache(OrderQuoteCacheInterface):
+    __slots__ = ('quotes',)
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 300) -> None:
+        self.quotes: MemoryCache[Hashable, OrderQuoteOut] = MemoryCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, key: Hashable) -> OrderQuoteOut | None:
+        return self.quotes.get(key)
+
+    def set(self, key: Hashable, quote: OrderQuoteOut) -> None:
+        self.quotes.set(key, quote)
+
+    def clear(self) -> None:
+        self.quotes.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {'size': len(self.quotes), **self.quotes.stats.as_dict()}
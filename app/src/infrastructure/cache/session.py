@@ -0,0 +1,38 @@
+import copy
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from src.application.auth.dto import UserData
+from src.application.auth.interface import SessionCacheInterface
+from src.infrastructure.cache.memory import MemoryCache
+
+
+class SessionCache(SessionCacheInterface):
+    __slots__ = ('sessions',)
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 60) -> None:
+        self.sessions: MemoryCache[UUID, UserData] = MemoryCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, session_id: UUID) -> UserData | None:
+        user_data = self.sessions.get(session_id)
+        return copy.copy(user_data) if user_data else None
+
+    def set(self, session_id: UUID, user_data: UserData, expires_at: datetime) -> None:
+        remaining = (expires_at - datetime.now(tz=expires_at.tzinfo)).total_seconds()
+        if remaining <= 0:
+            return None
+
+        self.sessions.set(session_id, copy.copy(user_data), ttl=min(self.sessions.ttl, remaining))
+
+    def invalidate(self, session_id: UUID) -> None:
+        self.sessions.delete(session_id)
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        self.sessions.delete_where(lambda _, user_data: user_data.user_id == user_id)
+
+    def clear(self) -> None:
+        self.sessions.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {'size': len(self.sessions), **self.sessions.stats.as_dict()}
@@ -0,0 +1,3 @@
+from .messages import ChatMessageBatcher
+
+__all__ = ['ChatMessageBatcher']
@@ -0,0 +1,141 @@
+import asyncio
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from dishka import AsyncContainer
+from src.application.chats.dto import ChatMessageJob
+from src.application.chats.exceptions import ChatMessageQueueOverloadedException
+from src.application.chats.frames import (
+    make_ack_frame,
+    make_error_frame,
+    make_message_frame,
+)
+from src.application.chats.interface import (
+    ChatMessageQueueInterface,
+    WebsocketManagerInterface,
+)
+from src.application.chats.usecases.create import CreateMessagesUseCase
+from src.domain.chats.entities import Message
+
+logger = logging.getLogger()
+
+
+@dataclass
+class ChatMessageStats:
+    saved: int = 0
+    failed: int = 0
+    rejected: int = 0
+    batches: int = 0
+
+
+class ChatMessageBatcher(ChatMessageQueueInterface):
+    """
+    Сохраняет сообщения, полученные через websocket, пачками: одна вставка и один коммит на пачку.
+    После коммита отправитель получает `ack`, а сообщение рассылается в чат.
+    Если пачка не сохранилась, сообщения сохраняются по одному, чтобы ошибка одного не отменила остальные
+    """
+
+    def __init__(
+        self,
+        container: AsyncContainer,
+        websocket_manager: WebsocketManagerInterface,
+        batch_size: int = 100,
+        flush_interval: float = 0.02,
+        queue_size: int = 1000,
+        drain_timeout: float = 10,
+    ) -> None:
+        self.container = container
+        self.websocket_manager = websocket_manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.drain_timeout = drain_timeout
+        self._queue: asyncio.Queue[ChatMessageJob] = asyncio.Queue(maxsize=queue_size)
+        self._task: asyncio.Task[None] | None = None
+        self._stats = ChatMessageStats()
+
+    def submit(self, job: ChatMessageJob) -> None:
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self._stats.rejected += 1
+            logger.error('Chat message queue is full', extra={'chat_id': job.message.chat_id})
+            raise ChatMessageQueueOverloadedException
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return None
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=self.drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning('Chat message queue is not drained before shutdown', extra={'queued': self._queue.qsize()})
+
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    def stats(self) -> dict[str, Any]:
+        return {'queued': self._queue.qsize(), **asdict(self._stats)}
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            # Короткое ожидание собирает сообщения, пришедшие почти одновременно, в одну вставку
+            if self._queue.qsize() < self.batch_size - 1:
+                await asyncio.sleep(self.flush_interval)
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, batch: list[ChatMessageJob]) -> None:
+        self._stats.batches += 1
+        try:
+            await self._save([job.message for job in batch])
+            saved = batch
+        except Exception as exc:
+            logger.warning(f'Chat messages batch is not saved: {exc!r}', extra={'size': len(batch)})
+            saved = await self._save_one_by_one(batch) if len(batch) > 1 else []
+
+        saved_jobs = {id(job) for job in saved}
+        failed = [job for job in batch if id(job) not in saved_jobs]
+        self._stats.saved += len(saved)
+        self._stats.failed += len(failed)
+
+        for job in saved:
+            await self._send(job, make_ack_frame(job.client_id, job.message), broadcast=make_message_frame(job.message))
+        for job in failed:
+            await self._send(job, make_error_frame('Message is not saved', job.client_id))
+
+    async def _save_one_by_one(self, batch: list[ChatMessageJob]) -> list[ChatMessageJob]:
+        saved = []
+        for job in batch:
+            try:
+                await self._save([job.message])
+            except Exception as exc:
+                logger.error(f'Chat message is not saved: {exc!r}', extra={'chat_id': job.message.chat_id})
+                continue
+            saved.append(job)
+        return saved
+
+    async def _save(self, messages: list[Message]) -> None:
+        async with self.container() as container:
+            usecase = await container.get(CreateMessagesUseCase)
+            await usecase.execute(messages)
+
+    async def _send(self, job: ChatMessageJob, frame: dict[str, Any], broadcast: dict[str, Any] | None = None) -> None:
+        chat_id = job.message.chat_id
+        try:
+            await self.websocket_manager.send(websocket=job.websocket, key=chat_id, data=frame)
+            if broadcast is not None:
+                await self.websocket_manager.send_all(key=chat_id, data=broadcast)
+        except Exception as exc:
+            logger.warning(f'Chat message notification failed: {exc!r}', extra={'chat_id': chat_id})
@@ -0,0 +1,80 @@
+from uuid import UUID
+
+from dishka import Provider, Scope, provide
+from src.application.auth.interface import SessionCacheInterface, TokenDenyListInterface
+from src.application.common.interfaces.idempotency import InFlightRequestsInterface
+from src.application.common.interfaces.invalidation import (
+    InvalidationBusInterface,
+    InvalidationTopic,
+)
+from src.application.orders.interface import OrderQuoteCacheInterface
+from src.application.products.interface import ProductCacheInterface
+from src.infrastructure.cache.bus import PostgresInvalidationBus
+from src.infrastructure.cache.deny_list import MemoryTokenDenyList
+from src.infrastructure.cache.in_flight import MemoryInFlightRequests
+from src.infrastructure.cache.product import ProductCache
+from src.infrastructure.cache.quote import OrderQuoteCache
+from src.infrastructure.cache.session import SessionCache
+from src.infrastructure.settings import settings
+
+
+class CacheProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    def invalidation_bus(self) -> InvalidationBusInterface:
+        return PostgresInvalidationBus(dsn=settings.db.DSN)
+
+    token_deny_list = provide(MemoryTokenDenyList, provides=TokenDenyListInterface)
+
+    @provide
+    def in_flight_requests(self) -> InFlightRequestsInterface:
+        return MemoryInFlightRequests(maxsize=settings.orders.IDEMPOTENCY_IN_FLIGHT_MAX_SIZE)
+
+    @provide
+    def product_cache(self, invalidation_bus: InvalidationBusInterface) -> ProductCache:
+        cache = ProductCache(
+            maxsize=settings.cache.PRODUCT_CACHE_MAX_SIZE,
+            pages_maxsize=settings.cache.PRODUCT_PAGES_CACHE_MAX_SIZE,
+            ttl=settings.cache.PRODUCT_CACHE_TTL_SECONDS,
+        )
+        invalidation_bus.subscribe(InvalidationTopic.PRODUCT, lambda _: cache.invalidate())
+        invalidation_bus.subscribe(InvalidationTopic.CATEGORY, lambda _: cache.invalidate())
+        return cache
+
+    @provide
+    def product_cache_interface(self, cache: ProductCache) -> ProductCacheInterface:
+        return cache
+
+    @provide
+    def order_quote_cache(self, invalidation_bus: InvalidationBusInterface) -> OrderQuoteCacheInterface:
+        cache = OrderQuoteCache(
+            maxsize=settings.cache.ORDER_QUOTE_CACHE_MAX_SIZE,
+            ttl=settings.cache.PRODUCT_CACHE_TTL_SECONDS,
+        )
+        invalidation_bus.subscribe(InvalidationTopic.PRODUCT, lambda _: cache.clear())
+        invalidation_bus.subscribe(InvalidationTopic.CATEGORY, lambda _: cache.clear())
+        return cache
+
+    @provide
+    def session_cache(self, invalidation_bus: InvalidationBusInterface) -> SessionCacheInterface:
+        cache = SessionCache(
+            maxsize=settings.cache.SESSION_CACHE_MAX_SIZE,
+            ttl=settings.cache.SESSION_CACHE_TTL_SECONDS,
+        )
+
+        def on_session_changed(key: str | None) -> None:
+            if key:
+                cache.invalidate(UUID(key))
+            else:
+                cache.clear()
+
+        def on_user_changed(key: str | None) -> None:
+            if key:
+                cache.invalidate_user(UUID(key))
+            else:
+                cache.clear()
+
+        invalidation_bus.subscribe(InvalidationTopic.USER_SESSION, on_session_changed)
+        invalidation_bus.subscribe(InvalidationTopic.USER, on_user_changed)
+        return cache
@@ -7,6 +7,7 @@ import logging_loki
 from dishka import AsyncContainer, make_async_container
 from src.infrastructure.logging_config import logger_config_dict_prod
 
+from .cache import CacheProvider
 from .database import DatabaseAdaptersProvider, DatabaseConfigurationProvider
 from .gateways import GatewayProvider
 from .security import SecurityProvider
@@ -39,4 +40,5 @@ def get_container() -> AsyncContainer:
         DatabaseAdaptersProvider(),
         UseCasesProvider(),
         GatewayProvider(),
+        CacheProvider(),
     )
@@ -2,6 +2,8 @@ from typing import AsyncGenerator
 
 from dishka import Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.application.common.interfaces.idempotency import IdempotencyRepositoryInterface
+from src.application.common.interfaces.outbox import OutboxRepositoryInterface
 from src.application.common.interfaces.refresh import RefreshTokenRepositoryInterface
 from src.application.common.interfaces.transaction import ICommiter
 from src.domain.chats.repository import (
@@ -20,11 +22,14 @@ from src.domain.users.repository import (
     UserRepositoryInterface,
     UserSessionRepositoryInterface,
 )
+from src.infrastructure.cache.product import CachedProductRepository, ProductCache
 from src.infrastructure.persistence.postgresql.repositories import (
     SqlalchemyChatRepository,
+    SqlalchemyIdempotencyRepository,
     SqlalchemyMessageRepository,
     SqlalchemyOrderItemRepository,
     SqlalchemyOrderRepository,
+    SqlalchemyOutboxRepository,
     SqlalchemyProductRepository,
     SqlalchemyRefreshTokenRepository,
     SqlalchemyUserRepository,
@@ -56,8 +61,13 @@ class DatabaseAdaptersProvider(Provider):
     user_session_repository = provide(SqlalchemyUserSessionRepository, provides=UserSessionRepositoryInterface)
     order_repositoty = provide(SqlalchemyOrderRepository, provides=OrderRepositoryInterface)
     order_item_repositoty = provide(SqlalchemyOrderItemRepository, provides=OrderItemRepositoryInterface)
-    product_repository = provide(SqlalchemyProductRepository, provides=ProductRepositoryInterface)
     refresh_session_repository = provide(SqlalchemyRefreshTokenRepository, provides=RefreshTokenRepositoryInterface)
     chat_repository = provide(SqlalchemyChatRepository, provides=ChatRepositoryInterface)
     message_repository = provide(SqlalchemyMessageRepository, provides=MessageRepositoryInterface)
     categories_repository = provide(SqlalchemyCategoryRepository, provides=CategoryRepositoryInterface)
+    outbox_repository = provide(SqlalchemyOutboxRepository, provides=OutboxRepositoryInterface)
+    idempotency_repository = provide(SqlalchemyIdempotencyRepository, provides=IdempotencyRepositoryInterface)
+
+    @provide
+    def product_repository(self, session: AsyncSession, cache: ProductCache) -> ProductRepositoryInterface:
+        return CachedProductRepository(repository=SqlalchemyProductRepository(session), cache=cache)
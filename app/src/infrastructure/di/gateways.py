@@ -1,9 +1,28 @@
 from dishka import Provider, Scope, provide
 from src.application.acquiring.interface import AcquiringGatewayInterface
 from src.infrastructure.integrations.acquiring.gateway import TochkaAcquiringGateway
+from src.infrastructure.integrations.acquiring.resilience import (
+    CircuitBreaker,
+    ResilientAcquiringGateway,
+)
+from src.infrastructure.settings import settings
 
 
 class GatewayProvider(Provider):
     scope = Scope.APP
 
-    acquiring_gateway = provide(TochkaAcquiringGateway, provides=AcquiringGatewayInterface)
+    tochka_acquiring_gateway = provide(TochkaAcquiringGateway)
+
+    @provide
+    def acquiring_gateway(self, gateway: TochkaAcquiringGateway) -> AcquiringGatewayInterface:
+        return ResilientAcquiringGateway(
+            gateway=gateway,
+            breaker=CircuitBreaker(
+                failure_threshold=settings.acquiring.BREAKER_FAILURE_THRESHOLD,
+                recovery_timeout=settings.acquiring.BREAKER_RECOVERY_SECONDS,
+            ),
+            max_concurrency=settings.acquiring.MAX_CONCURRENCY,
+            acquire_timeout=settings.acquiring.ACQUIRE_TIMEOUT_SECONDS,
+            max_attempts=settings.acquiring.RETRY_ATTEMPTS,
+            retry_backoff=settings.acquiring.RETRY_BACKOFF_SECONDS,
+        )
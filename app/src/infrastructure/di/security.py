@@ -1,3 +1,5 @@
+from typing import Iterable
+
 from dishka import Provider, Scope, provide
 from src.application.common.interfaces import (
     JWTProcessorInterface,
@@ -6,17 +8,35 @@ from src.application.common.interfaces import (
 from src.application.common.interfaces.identity_provider import (
     IdentityProviderInterface,
 )
-from src.infrastructure.authentication.identity_provider import SessionIdentityProvider
+from src.infrastructure.authentication.identity_provider import (
+    SessionIdentityProvider,
+    TokenIdentityProvider,
+)
 from src.infrastructure.authentication.jwt_processor import JWTProcessor
 from src.infrastructure.authentication.password_hasher import PasswordHasher
+from src.infrastructure.settings import AuthMode, settings
 
 
 class SecurityProvider(Provider):
-    password_hasher = provide(PasswordHasher, provides=PasswordHasherInterface, scope=Scope.APP)
-    jwt_processor = provide(JWTProcessor, provides=JWTProcessorInterface, scope=Scope.APP)
-    # identity_provider = provide(
-    #     TokenIdentityProvider,
-    #     provides=IdentityProviderInterface,
-    #     scope=Scope.APP,
-    # )
-    identity_provider = provide(SessionIdentityProvider, provides=IdentityProviderInterface, scope=Scope.REQUEST)
+    # Админ панель всегда использует сессии, независимо от AUTH_MODE
+    session_identity_provider = provide(SessionIdentityProvider, scope=Scope.REQUEST)
+
+    @provide(scope=Scope.APP)
+    def password_hasher(self) -> Iterable[PasswordHasherInterface]:
+        password_hasher = PasswordHasher(
+            max_workers=settings.password_hasher.MAX_WORKERS,
+            max_queue_size=settings.password_hasher.MAX_QUEUE_SIZE,
+        )
+        yield password_hasher
+        password_hasher.shutdown()
+
+    @provide(scope=Scope.APP)
+    def jwt_processor(self) -> JWTProcessorInterface:
+        return JWTProcessor(token_cache_size=settings.cache.ACCESS_TOKEN_CACHE_MAX_SIZE)
+
+    def __init__(self, auth_mode: AuthMode = settings.AUTH_MODE) -> None:
+        super().__init__()
+        if auth_mode == AuthMode.TOKEN:
+            self.provide(TokenIdentityProvider, provides=IdentityProviderInterface, scope=Scope.APP)
+        else:
+            self.alias(source=SessionIdentityProvider, provides=IdentityProviderInterface)
@@ -1,16 +1,40 @@
+from datetime import timedelta
+from typing import AsyncIterable
+
 import aiohttp
-from dishka import Provider, Scope, provide
+from dishka import AsyncContainer, Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
-from src.application.chats.interface import WebsocketManagerInterface
+from src.application.chats.interface import (
+    ChatMessageQueueInterface,
+    WebsocketBrokerInterface,
+    WebsocketManagerInterface,
+)
 from src.application.common.email.types import SenderName
-from src.application.common.interfaces import SyncSMTPServerInterface
-from src.infrastructure.integrations.smtp.server import SyncSMTPServer
+from src.application.common.interfaces import (
+    OutboxDispatcherInterface,
+    SMTPServerInterface,
+)
+from src.application.common.outbox import OutboxMessageType
+from src.application.orders.interface import OrderPaymentQueueInterface
+from src.application.orders.usecases import SendNewOrderEmailUseCase
+from src.infrastructure.chats import ChatMessageBatcher
+from src.infrastructure.integrations.http import (
+    HttpClientMetrics,
+    create_client_session,
+)
+from src.infrastructure.integrations.smtp.server import PooledSMTPServer
+from src.infrastructure.orders import OrderPaymentWorkerPool
+from src.infrastructure.outbox import OutboxDispatcher
 from src.infrastructure.persistence.postgresql.database import (
     get_async_engine,
     get_async_sessionmaker,
 )
-from src.infrastructure.settings import settings
+from src.infrastructure.settings import WebsocketBroker, settings
 from src.infrastructure.utils.common import StorageBackend
+from src.infrastructure.websockets.broker import (
+    LocalWebsocketBroker,
+    PostgresWebsocketBroker,
+)
 from src.infrastructure.websockets.manager import WebsocketManager
 
 
@@ -24,17 +48,100 @@ class SettingsProvider(Provider):
         return get_async_sessionmaker(engine)
 
     @provide(scope=Scope.APP)
-    def acquiring_session(self) -> aiohttp.ClientSession:
-        headers = {'Authorization': f'Bearer {settings.acquiring.TOKEN}'}
-        return aiohttp.ClientSession(headers=headers)
+    def http_client_metrics(self) -> HttpClientMetrics:
+        return HttpClientMetrics()
+
+    @provide(scope=Scope.APP)
+    async def acquiring_session(self, metrics: HttpClientMetrics) -> AsyncIterable[aiohttp.ClientSession]:
+        session = create_client_session(
+            metrics=metrics,
+            headers={'Authorization': f'Bearer {settings.acquiring.TOKEN}'},
+            limit=settings.acquiring.HTTP_LIMIT,
+            limit_per_host=settings.acquiring.HTTP_LIMIT_PER_HOST,
+            keepalive_timeout=settings.acquiring.HTTP_KEEPALIVE_SECONDS,
+            dns_cache_ttl=settings.acquiring.HTTP_DNS_CACHE_SECONDS,
+            connect_timeout=settings.acquiring.HTTP_CONNECT_TIMEOUT_SECONDS,
+            timeout=settings.acquiring.HTTP_TIMEOUT_SECONDS,
+        )
+        yield session
+        await session.close()
+
+    @provide(scope=Scope.APP)
+    def smtp_server(self) -> SMTPServerInterface:
+        return PooledSMTPServer(
+            host=settings.smtp.HOST,
+            port=settings.smtp.PORT,
+            username=settings.smtp.USER,
+            password=settings.smtp.PASSWORD,
+            from_address=settings.smtp.FROM_EMAIL,
+            pool_size=settings.smtp.POOL_SIZE,
+            queue_size=settings.smtp.QUEUE_SIZE,
+            batch_size=settings.smtp.BATCH_SIZE,
+            max_attempts=settings.smtp.MAX_ATTEMPTS,
+            connect_attempts=settings.smtp.CONNECT_ATTEMPTS,
+            timeout=settings.smtp.TIMEOUT_SECONDS,
+            deliver_timeout=settings.smtp.DELIVER_TIMEOUT_SECONDS,
+            idle_timeout=settings.smtp.IDLE_TIMEOUT_SECONDS,
+        )
+
+    @provide(scope=Scope.APP)
+    def outbox_dispatcher(self, container: AsyncContainer) -> OutboxDispatcherInterface:
+        return OutboxDispatcher(
+            container=container,
+            handlers={OutboxMessageType.NEW_ORDER_EMAIL: SendNewOrderEmailUseCase},
+            batch_size=settings.outbox.BATCH_SIZE,
+            poll_interval=settings.outbox.POLL_INTERVAL_SECONDS,
+            max_attempts=settings.outbox.MAX_ATTEMPTS,
+            retry_backoff=timedelta(seconds=settings.outbox.RETRY_BACKOFF_SECONDS),
+            handler_timeout=settings.outbox.HANDLER_TIMEOUT_SECONDS,
+            lease=timedelta(seconds=settings.outbox.LEASE_SECONDS),
+        )
+
+    @provide(scope=Scope.APP)
+    def order_payment_queue(
+        self,
+        container: AsyncContainer,
+        websocket_manager: WebsocketManagerInterface,
+    ) -> OrderPaymentQueueInterface:
+        return OrderPaymentWorkerPool(
+            container=container,
+            websocket_manager=websocket_manager,
+            workers=settings.orders.PAYMENT_WORKERS,
+            queue_size=settings.orders.PAYMENT_QUEUE_SIZE,
+            pending_timeout=timedelta(seconds=settings.orders.PENDING_TIMEOUT_SECONDS),
+            sweep_interval=settings.orders.PENDING_SWEEP_INTERVAL_SECONDS,
+        )
+
+    @provide(scope=Scope.APP)
+    def chat_message_queue(
+        self,
+        container: AsyncContainer,
+        websocket_manager: WebsocketManagerInterface,
+    ) -> ChatMessageQueueInterface:
+        return ChatMessageBatcher(
+            container=container,
+            websocket_manager=websocket_manager,
+            batch_size=settings.websockets.MESSAGE_BATCH_SIZE,
+            flush_interval=settings.websockets.MESSAGE_FLUSH_INTERVAL_SECONDS,
+            queue_size=settings.websockets.MESSAGE_QUEUE_SIZE,
+        )
 
     @provide(scope=Scope.APP)
-    def smtp_server(self) -> SyncSMTPServerInterface:
-        return SyncSMTPServer(from_address=settings.smtp.FROM_EMAIL, password=settings.smtp.PASSWORD)
+    def websocket_broker(self) -> WebsocketBrokerInterface:
+        if settings.websockets.BROKER == WebsocketBroker.POSTGRES:
+            return PostgresWebsocketBroker(dsn=settings.db.DSN)
+        return LocalWebsocketBroker()
 
     @provide(scope=Scope.APP)
-    def websocker_manager(self) -> WebsocketManagerInterface:
-        return WebsocketManager()
+    def websocker_manager(self, websocket_broker: WebsocketBrokerInterface) -> WebsocketManagerInterface:
+        return WebsocketManager(
+            broker=websocket_broker,
+            send_queue_size=settings.websockets.SEND_QUEUE_SIZE,
+            send_buffer_size=settings.websockets.SEND_BUFFER_SIZE,
+            send_timeout=settings.websockets.SEND_TIMEOUT_SECONDS,
+            ping_interval=settings.websockets.PING_INTERVAL_SECONDS,
+            idle_timeout=settings.websockets.IDLE_TIMEOUT_SECONDS,
+        )
 
     @provide(scope=Scope.APP)
     def sender_name(self) -> SenderName:
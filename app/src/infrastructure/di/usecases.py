@@ -13,17 +13,27 @@ from src.application.auth.usecases.login import (
 )
 from src.application.chats.usecases.create import (
     CreateChatUseCase,
+    CreateMessagesUseCase,
     CreateMessageUseCase,
 )
 from src.application.chats.usecases.get import (
+    GetChatMessagesUseCase,
     GetChatsListUseCase,
     GetChatUseCase,
     GetUserChatsUseCase,
 )
 from src.application.orders.usecases import (
+    CreateOrderPaymentUseCase,
     CreateOrderUseCase,
+    EnqueueOrderUseCase,
+    FailStalePendingOrdersUseCase,
     GetManyOrdersUseCase,
+    GetOrderPaymentUseCase,
     GetOrderUseCase,
+    IdempotentCreateOrderUseCase,
+    PlaceOrderUseCase,
+    QuoteOrderUseCase,
+    SendNewOrderEmailUseCase,
     UpdateOrderByWebhookUseCase,
     UpdateOrderUseCase,
 )
@@ -34,7 +44,10 @@ from src.application.products.usecases import (
 )
 from src.application.products.usecases.create import CreateCategoryUseCase
 from src.application.products.usecases.delete import DeleteCategoryUseCase
-from src.application.products.usecases.get import GetCategoriesListUseCase
+from src.application.products.usecases.get import (
+    GetCatalogVersionUseCase,
+    GetCategoriesListUseCase,
+)
 from src.application.products.usecases.update import UpdateProductUseCase
 from src.application.users.usecases import (
     GetUserOrdersUseCase,
@@ -62,19 +75,30 @@ class UseCasesProvider(Provider):
 
     get_order = provide(GetOrderUseCase)
     create_order = provide(CreateOrderUseCase)
+    place_order = provide(PlaceOrderUseCase)
+    quote_order = provide(QuoteOrderUseCase)
+    create_order_payment = provide(CreateOrderPaymentUseCase)
+    enqueue_order = provide(EnqueueOrderUseCase)
+    idempotent_create_order = provide(IdempotentCreateOrderUseCase)
+    fail_stale_pending_orders = provide(FailStalePendingOrdersUseCase)
+    get_order_payment = provide(GetOrderPaymentUseCase)
     get_many_orders = provide(GetManyOrdersUseCase)
     update_order = provide(UpdateOrderUseCase)
     update_order_by_webhook = provide(UpdateOrderByWebhookUseCase)
+    send_new_order_email = provide(SendNewOrderEmailUseCase)
 
     get_product = provide(GetProductUseCase)
+    get_catalog_version = provide(GetCatalogVersionUseCase)
     create_product = provide(CreateProductUseCase)
     get_many_products = provide(GetManyProductsUseCase)
     update_product = provide(UpdateProductUseCase)
 
     create_message = provide(CreateMessageUseCase)
+    create_messages = provide(CreateMessagesUseCase)
     create_chat = provide(CreateChatUseCase)
     get_chat = provide(GetChatUseCase)
     get_chats_list = provide(GetChatsListUseCase)
+    get_chat_messages = provide(GetChatMessagesUseCase)
 
     create_category = provide(CreateCategoryUseCase)
     delete_category = provide(DeleteCategoryUseCase)
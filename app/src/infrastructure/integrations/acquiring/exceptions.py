@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from src.application.acquiring.exceptions import PaymentOutcomeUnknownException
 from src.domain.common.exceptions.base import ApplicationException
 
 
@@ -7,3 +8,23 @@ from src.domain.common.exceptions.base import ApplicationException
 class CreatePaymentOperationWithReceiptException(ApplicationException):
     status_code: int = 500
     message: str = 'Something went wrong while creating payment operation with receipt'
+
+
+@dataclass
+class AcquiringUnavailableException(CreatePaymentOperationWithReceiptException):
+    """
+    Банк не ответил или ответил ошибкой на своей стороне.
+    `retryable` выставляется, только если банк гарантированно не принял запрос
+    """
+
+    status_code: int = 503
+    message: str = 'Payment provider is temporarily unavailable'
+    retryable: bool = False
+
+
+@dataclass
+class AcquiringOutcomeUnknownException(AcquiringUnavailableException, PaymentOutcomeUnknownException):
+    """Запрос отправлен, но банк не ответил или ответил ошибкой на своей стороне"""
+
+    status_code: int = 504
+    message: str = 'Payment provider did not respond, payment status is unknown'
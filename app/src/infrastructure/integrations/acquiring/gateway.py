@@ -1,18 +1,31 @@
+import asyncio
+import logging
 from typing import Any, cast
 
 import aiohttp
 from src.application.acquiring.interface import AcquiringGatewayInterface
 from src.application.products.dto import ProductInPaymentDTO
 from src.infrastructure.integrations.acquiring.exceptions import (
+    AcquiringOutcomeUnknownException,
+    AcquiringUnavailableException,
     CreatePaymentOperationWithReceiptException,
 )
-from src.infrastructure.integrations.acquiring.mappers import map_product_in_payment_to_dict
+from src.infrastructure.integrations.acquiring.mappers import (
+    map_product_in_payment_to_dict,
+)
+from src.infrastructure.integrations.http import HttpClientMetrics
 from src.infrastructure.settings import settings
 
+logger = logging.getLogger()
+
+# Эти ответы означают, что банк отклонил запрос, не обработав его
+RETRYABLE_STATUSES = frozenset({429, 503})
+
 
 class TochkaAcquiringGateway(AcquiringGatewayInterface):
-    def __init__(self, session: aiohttp.ClientSession) -> None:
+    def __init__(self, session: aiohttp.ClientSession, metrics: HttpClientMetrics) -> None:
         self.session = session
+        self.metrics = metrics
         self.base_url = settings.acquiring.ACQUIRING_URL
         self.api_version = settings.acquiring.ACQUIRING_API_VERSION
         self.redirect_url = settings.DOMAIN_URL
@@ -46,12 +59,31 @@ class TochkaAcquiringGateway(AcquiringGatewayInterface):
         }
         if consumer_id:
             request_data['Data']['consumerId'] = consumer_id
-        response = await self.session.post(
-            f'{self.base_url}/acquiring/{self.api_version}/payments_with_receipt',
-            json=request_data,
-        )
-        if response.status == 200:
-            response_data = await response.json()
-            return cast(dict[str, Any], response_data['Data'])
-        else:
-            raise CreatePaymentOperationWithReceiptException
+        try:
+            async with self.session.post(
+                f'{self.base_url}/acquiring/{self.api_version}/payments_with_receipt',
+                json=request_data,
+            ) as response:
+                if response.status != 200:
+                    logger.error(
+                        'Acquiring payment operation failed',
+                        extra={'status': response.status, 'body': await response.text()},
+                    )
+                    if response.status in RETRYABLE_STATUSES:
+                        raise AcquiringUnavailableException(retryable=True)
+                    if response.status >= 500:
+                        raise AcquiringOutcomeUnknownException
+                    raise CreatePaymentOperationWithReceiptException
+                response_data = await response.json()
+        except aiohttp.ClientConnectorError as exc:
+            # Соединение не установлено, запрос до банка не дошел
+            logger.error(f'Acquiring connection failed: {exc!r}')
+            raise AcquiringUnavailableException(retryable=True)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            logger.error(f'Acquiring request failed: {exc!r}')
+            raise AcquiringOutcomeUnknownException
+
+        return cast(dict[str, Any], response_data['Data'])
+
+    def stats(self) -> dict[str, Any]:
+        return {'http': self.metrics.stats.as_dict()}
@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import random
+import time
+from dataclasses import asdict, dataclass
+from enum import Enum
+from typing import Any
+
+from src.application.acquiring.interface import AcquiringGatewayInterface
+from src.application.products.dto import ProductInPaymentDTO
+from src.infrastructure.integrations.acquiring.exceptions import (
+    AcquiringUnavailableException,
+)
+
+logger = logging.getLogger()
+
+
+class CircuitState(str, Enum):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """
+    Размыкается после `failure_threshold` ошибок подряд и сразу отклоняет вызовы.
+    Через `recovery_timeout` секунд пропускает один пробный вызов: успех замыкает цепь, ошибка снова размыкает
+    """
+
+    __slots__ = ('failure_threshold', 'recovery_timeout', 'state', 'opened', '_failures', '_opened_at', '_probing')
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CircuitState.CLOSED
+        self.opened = 0
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    def allow(self) -> bool:
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self.state = CircuitState.HALF_OPEN
+        if self.state == CircuitState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.state = CircuitState.CLOSED
+        self._failures = 0
+        self._probing = False
+
+    def abort_probe(self) -> None:
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self.state == CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self.state != CircuitState.OPEN:
+                self.opened += 1
+                logger.warning('Circuit breaker is open', extra={'failures': self._failures})
+            self.state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+            self._probing = False
+
+
+@dataclass
+class ResilienceStats:
+    calls: int = 0
+    retries: int = 0
+    rejected_by_breaker: int = 0
+    rejected_by_limiter: int = 0
+
+
+class ResilientAcquiringGateway(AcquiringGatewayInterface):
+    """
+    Оборачивает шлюз эквайринга: ограничивает число одновременных запросов к банку,
+    размыкает цепь при деградации банка и повторяет только те запросы, которые банк гарантированно не принял.
+    Создание платежа не идемпотентно, поэтому запросы не дублируются параллельно
+    """
+
+    def __init__(
+        self,
+        gateway: AcquiringGatewayInterface,
+        breaker: CircuitBreaker,
+        max_concurrency: int = 20,
+        acquire_timeout: float = 1,
+        max_attempts: int = 3,
+        retry_backoff: float = 0.2,
+    ) -> None:
+        self.gateway = gateway
+        self.breaker = breaker
+        self.acquire_timeout = acquire_timeout
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._stats = ResilienceStats()
+
+    async def create_payment_operation_with_receipt(
+        self,
+        client_email: str,
+        items: tuple[ProductInPaymentDTO, ...],
+        total_price: float,
+        purpose: str = 'Перевод за оказанные услуги',
+        payment_mode: list[str] = ['sbp', 'card'],
+        save_card: bool = True,
+        consumer_id: str | None = None,
+    ) -> dict[str, Any]:
+        self._stats.calls += 1
+        attempt = 1
+        while True:
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self.acquire_timeout)
+            except asyncio.TimeoutError:
+                self._stats.rejected_by_limiter += 1
+                raise AcquiringUnavailableException
+
+            try:
+                if not self.breaker.allow():
+                    self._stats.rejected_by_breaker += 1
+                    raise AcquiringUnavailableException
+
+                try:
+                    result = await self.gateway.create_payment_operation_with_receipt(
+                        client_email=client_email,
+                        items=items,
+                        total_price=total_price,
+                        purpose=purpose,
+                        payment_mode=payment_mode,
+                        save_card=save_card,
+                        consumer_id=consumer_id,
+                    )
+                except AcquiringUnavailableException as exc:
+                    self.breaker.record_failure()
+                    if not exc.retryable or attempt >= self.max_attempts:
+                        raise
+                except asyncio.CancelledError:
+                    self.breaker.abort_probe()
+                    raise
+                except Exception:
+                    # Банк ответил, значит он доступен, ошибка относится к самому запросу
+                    self.breaker.record_success()
+                    raise
+                else:
+                    self.breaker.record_success()
+                    return result
+            finally:
+                self._semaphore.release()
+
+            self._stats.retries += 1
+            # Полный джиттер, чтобы повторы разных запросов не совпадали по времени
+            await asyncio.sleep(random.uniform(0, self.retry_backoff * 2 ** (attempt - 1)))
+            attempt += 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self.gateway.stats(),
+            **asdict(self._stats),
+            'circuit_state': self.breaker.state.value,
+            'circuit_opened': self.breaker.opened,
+        }
@@ -0,0 +1,84 @@
+import time
+from dataclasses import asdict, dataclass
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+
+
+@dataclass
+class HttpClientStats:
+    requests: int = 0
+    errors: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    total_seconds: float = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data['avg_seconds'] = self.total_seconds / self.requests if self.requests else 0.0
+        return data
+
+
+class HttpClientMetrics:
+    """Собирает метрики исходящих запросов и переиспользования соединений через `aiohttp.TraceConfig`"""
+
+    __slots__ = ('stats', 'trace_config')
+
+    def __init__(self) -> None:
+        self.stats = HttpClientStats()
+        self.trace_config = aiohttp.TraceConfig()
+        self.trace_config.on_request_start.append(self._on_request_start)
+        self.trace_config.on_request_end.append(self._on_request_end)
+        self.trace_config.on_request_exception.append(self._on_request_exception)
+        self.trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        self.trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+
+    async def _on_request_start(self, session: aiohttp.ClientSession, context: SimpleNamespace, params: Any) -> None:
+        context.started_at = time.perf_counter()
+
+    async def _on_request_end(self, session: aiohttp.ClientSession, context: SimpleNamespace, params: Any) -> None:
+        self.stats.requests += 1
+        self.stats.total_seconds += time.perf_counter() - context.started_at
+
+    async def _on_request_exception(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: Any,
+    ) -> None:
+        self.stats.errors += 1
+
+    async def _on_connection_create_end(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: Any,
+    ) -> None:
+        self.stats.connections_created += 1
+
+    async def _on_connection_reuseconn(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: Any,
+    ) -> None:
+        self.stats.connections_reused += 1
+
+
+def create_client_session(
+    metrics: HttpClientMetrics,
+    headers: dict[str, str] | None = None,
+    limit: int = 100,
+    limit_per_host: int = 20,
+    keepalive_timeout: float = 30,
+    dns_cache_ttl: int = 300,
+    connect_timeout: float = 5,
+    timeout: float = 30,
+) -> aiohttp.ClientSession:
+    """Сессия должна создаваться один раз на процесс и закрываться при остановке приложения"""
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=keepalive_timeout,
+        ttl_dns_cache=dns_cache_ttl,
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(
+        headers=headers,
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=timeout, sock_connect=connect_timeout),
+        trace_configs=[metrics.trace_config],
+        raise_for_status=False,
+    )
@@ -1,69 +1,93 @@
 import asyncio
 import logging
+from dataclasses import asdict, dataclass
 from email.header import Header
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.utils import formataddr
-from smtplib import SMTP_SSL
+from typing import Any
 
 import aiosmtplib
-from src.application.common.interfaces.smtp import (
-    SMTPServerInterface,
-    SyncSMTPServerInterface,
-)
+from src.application.common.interfaces.smtp import SMTPServerInterface
 from src.domain.common.exceptions.base import ApplicationException
-from src.infrastructure.settings import settings
 
 logger = logging.getLogger()
 
 
-class AsyncSMTPServer(SMTPServerInterface):
-    def __init__(self, server: aiosmtplib.SMTP, from_address: str, password: str, subject: str) -> None:
-        self.server = server
-        self.from_address = from_address
-        self.password = password
-        self.subject = subject
-
-    async def start(self) -> None:
-        logger.info('Starting smtp server')
-        await self.server.connect()
+@dataclass
+class MailStats:
+    sent: int = 0
+    failed: int = 0
+    dropped: int = 0
+    retried: int = 0
+    batches: int = 0
+    connects: int = 0
+    connect_errors: int = 0
+    timed_out: int = 0
 
-    def create_message(self, content: str, to_address: str) -> MIMEMultipart:
-        message = MIMEMultipart()
-        message['Subject'] = self.subject
-        message['From'] = self.from_address
-        message['To'] = to_address
-        html = MIMEText(content, 'html')
-        message.attach(html)
-        return message
 
-    async def send_email(self, message: MIMEMultipart) -> None:
-        try:
-            await self.server.sendmail(self.from_address, message['To'], message.as_string())
-        except Exception as e:
-            logger.error(f'Error sending email: {e}')
-        return None
+@dataclass
+class OutgoingEmail:
+    message: MIMEMultipart
+    attempts: int = 0
+    delivered: asyncio.Future[None] | None = None
 
-    async def stop(self) -> None:
-        logger.info('Stopping smtp server')
-        await self.server.quit()
+    def resolve(self, exc: Exception | None = None) -> None:
+        if self.delivered is None or self.delivered.done():
+            return None
+        if exc is None:
+            self.delivered.set_result(None)
+        else:
+            self.delivered.set_exception(exc)
 
-    async def check_connection(self) -> None:
-        if not self.server.is_connected:
-            if self.server._connect_lock and self.server._connect_lock.locked():
-                self.server.close()
-            try:
-                logger.info('Connecting SMTP server.')
-                await self.server.connect()
-            except Exception as e:
-                logger.error(f'Error connecting to SMTP server: {e}')
-                raise ApplicationException
 
+class PooledSMTPServer(SMTPServerInterface):
+    """
+    Отправляет письма из ограниченной очереди через небольшой пул постоянных SMTP соединений.
+    Каждый обработчик забирает из очереди пачку писем и отправляет ее через одно соединение,
+    соединение переподключается с экспоненциальной задержкой и закрывается после простоя.
+    Если сервер недоступен после `connect_attempts` попыток, письма пачки и очереди завершаются ошибкой,
+    повторная отправка письма откладывается с экспоненциальной задержкой
+    """
 
-class SyncSMTPServer(SyncSMTPServerInterface):
-    def __init__(self, from_address: str, password: str) -> None:
-        self.from_address = from_address
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        from_address: str,
+        pool_size: int = 2,
+        queue_size: int = 1000,
+        batch_size: int = 20,
+        max_attempts: int = 3,
+        connect_attempts: int = 5,
+        timeout: float = 30,
+        deliver_timeout: float = 60,
+        idle_timeout: float = 60,
+        drain_timeout: float = 10,
+        min_backoff: float = 0.5,
+        max_backoff: float = 30,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.username = username
         self.password = password
+        self.from_address = from_address
+        self.pool_size = pool_size
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.connect_attempts = connect_attempts
+        self.timeout = timeout
+        self.deliver_timeout = deliver_timeout
+        self.idle_timeout = idle_timeout
+        self.drain_timeout = drain_timeout
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self._queue: asyncio.Queue[OutgoingEmail] = asyncio.Queue(maxsize=queue_size)
+        self._workers: list[asyncio.Task[None]] = []
+        self._retries: set[asyncio.Task[None]] = set()
+        self._stats = MailStats()
 
     def create_message(self, content: str, sender_name: str, to_address: str, subject: str) -> MIMEMultipart:
         message = MIMEMultipart()
@@ -73,15 +97,198 @@ class SyncSMTPServer(SyncSMTPServerInterface):
         message.attach(MIMEText(content, 'html'))
         return message
 
-    def _send(self, message: MIMEMultipart) -> None:
-        with SMTP_SSL(settings.smtp.HOST, settings.smtp.PORT) as server:
-            server.login(settings.smtp.FROM_EMAIL, settings.smtp.PASSWORD)
+    async def send_email(self, message: MIMEMultipart) -> None:
+        self._enqueue(OutgoingEmail(message=message))
+        return None
+
+    async def deliver(self, message: MIMEMultipart) -> None:
+        delivered: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        email = OutgoingEmail(message=message, delivered=delivered)
+        if not self._enqueue(email):
+            raise ApplicationException(503, 'Email queue is full')
+        try:
+            await asyncio.wait_for(asyncio.shield(delivered), timeout=self.deliver_timeout)
+        except asyncio.TimeoutError:
+            # Отмененное письмо обработчики пропускают, поэтому повтор вызывающей стороны не приведет к дублю
+            delivered.cancel()
+            self._stats.timed_out += 1
+            raise ApplicationException(504, 'Email delivery timed out')
+
+    async def start(self) -> None:
+        if self._workers:
+            return None
+        logger.info('Starting smtp workers', extra={'pool_size': self.pool_size})
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.pool_size)]
+
+    async def stop(self) -> None:
+        if not self._workers:
+            return None
+        try:
+            await asyncio.wait_for(self._drain(), timeout=self.drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning('Smtp queue is not drained before shutdown', extra={'queued': self._queue.qsize()})
+
+        for task in [*self._workers, *self._retries]:
+            task.cancel()
+        await asyncio.gather(*self._workers, *self._retries, return_exceptions=True)
+        self._workers = []
+
+        while not self._queue.empty():
+            self._queue.get_nowait().resolve(ApplicationException(503, 'Email delivery is cancelled'))
+            self._queue.task_done()
+        logger.info('Smtp workers stopped', extra=self.stats())
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            'queued': self._queue.qsize(),
+            'delayed': len(self._retries),
+            'workers': len(self._workers),
+            **asdict(self._stats),
+        }
+
+    async def _drain(self) -> None:
+        while True:
+            await self._queue.join()
+            if not self._retries:
+                return None
+            await asyncio.wait(self._retries)
+
+    def _enqueue(self, email: OutgoingEmail) -> bool:
+        try:
+            self._queue.put_nowait(email)
+            return True
+        except asyncio.QueueFull:
+            self._stats.dropped += 1
+            logger.error('Smtp queue is full, email is dropped', extra={'to': email.message['To']})
+            return False
+
+    async def _work(self) -> None:
+        client: aiosmtplib.SMTP | None = None
+        try:
+            while True:
+                try:
+                    email = await asyncio.wait_for(self._queue.get(), timeout=self.idle_timeout)
+                except asyncio.TimeoutError:
+                    await self._disconnect(client)
+                    client = None
+                    continue
+
+                batch = [email]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                try:
+                    client = await self._deliver(client, batch)
+                except asyncio.CancelledError:
+                    for email in batch:
+                        email.resolve(ApplicationException(503, 'Email delivery is cancelled'))
+                    raise
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+        finally:
+            await self._disconnect(client)
+
+    async def _deliver(self, client: aiosmtplib.SMTP | None, batch: list[OutgoingEmail]) -> aiosmtplib.SMTP | None:
+        self._stats.batches += 1
+        for index, email in enumerate(batch):
+            if email.delivered is not None and email.delivered.cancelled():
+                continue
+
+            if client is None or not client.is_connected:
+                try:
+                    client = await self._connect()
+                except (aiosmtplib.SMTPException, OSError) as exc:
+                    for pending in batch[index:]:
+                        self._fail(pending, exc)
+                    self._fail_queued(exc)
+                    return None
+
             try:
-                server.sendmail(settings.smtp.FROM_EMAIL, message['To'], message.as_string())
-            except Exception as e:
-                logger.error(f'Error while sending email: {e}')
-                raise ApplicationException
+                await client.send_message(email.message)
+                self._stats.sent += 1
+                email.resolve()
+            except aiosmtplib.SMTPRecipientsRefused as exc:
+                self._fail(email, exc)
+            except aiosmtplib.SMTPResponseException as exc:
+                if exc.code >= 500:
+                    self._fail(email, exc)
+                else:
+                    self._retry(email, exc)
+            except (aiosmtplib.SMTPException, OSError) as exc:
+                await self._disconnect(client)
+                client = None
+                self._retry(email, exc)
 
-    async def send_email(self, message: MIMEMultipart) -> None:
-        asyncio.get_event_loop().run_in_executor(None, self._send, message)
+        return client
+
+    def _retry(self, email: OutgoingEmail, exc: Exception) -> None:
+        email.attempts += 1
+        if email.attempts >= self.max_attempts:
+            self._fail(email, exc)
+            return None
+
+        delay = min(self.min_backoff * 2 ** (email.attempts - 1), self.max_backoff)
+        self._stats.retried += 1
+        logger.warning(f'Error while sending email: {exc}, retry in {delay}s', extra={'attempts': email.attempts})
+        task = asyncio.create_task(self._retry_later(email, delay, exc))
+        self._retries.add(task)
+        task.add_done_callback(self._retries.discard)
+
+    async def _retry_later(self, email: OutgoingEmail, delay: float, exc: Exception) -> None:
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            email.resolve(ApplicationException(503, 'Email delivery is cancelled'))
+            raise
+        if not self._enqueue(email):
+            self._fail(email, exc)
+
+    def _fail_queued(self, exc: Exception) -> None:
+        while not self._queue.empty():
+            self._fail(self._queue.get_nowait(), exc)
+            self._queue.task_done()
+
+    def _fail(self, email: OutgoingEmail, exc: Exception) -> None:
+        self._stats.failed += 1
+        logger.error(f'Error while sending email: {exc}', extra={'to': email.message['To']})
+        email.resolve(exc)
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        """Подключается не более `connect_attempts` раз, затем выбрасывает последнюю ошибку"""
+        backoff = self.min_backoff
+        for attempt in range(1, self.connect_attempts + 1):
+            client = aiosmtplib.SMTP(
+                hostname=self.host,
+                port=self.port,
+                use_tls=self.port == 465,
+                timeout=self.timeout,
+            )
+            try:
+                await client.connect()
+                await client.login(self.username, self.password)
+                self._stats.connects += 1
+                return client
+            except (aiosmtplib.SMTPException, OSError) as exc:
+                client.close()
+                self._stats.connect_errors += 1
+                if attempt == self.connect_attempts:
+                    logger.error(f'Smtp connection failed: {exc}', extra={'attempts': attempt})
+                    raise
+                logger.warning(f'Smtp connection failed: {exc}, retry in {backoff}s')
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+
+        raise aiosmtplib.SMTPConnectError('No connection attempts configured')
+
+    async def _disconnect(self, client: aiosmtplib.SMTP | None) -> None:
+        if client is None or not client.is_connected:
+            return None
+        try:
+            await client.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            client.close()
         return None
@@ -0,0 +1,3 @@
+from .payments import OrderPaymentWorkerPool
+
+__all__ = ['OrderPaymentWorkerPool']
@@ -0,0 +1,140 @@
+import asyncio
+import logging
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from typing import Any
+
+from dishka import AsyncContainer
+from src.application.chats.interface import WebsocketManagerInterface
+from src.application.orders.dto import OrderPaymentJob
+from src.application.orders.exceptions import OrderPaymentQueueOverloadedException
+from src.application.orders.interface import OrderPaymentQueueInterface
+from src.application.orders.usecases import (
+    CreateOrderPaymentUseCase,
+    FailStalePendingOrdersUseCase,
+)
+from src.domain.orders.entities import Order
+
+logger = logging.getLogger()
+
+
+@dataclass
+class OrderPaymentStats:
+    created: int = 0
+    failed: int = 0
+    rejected: int = 0
+    recovered: int = 0
+
+
+class OrderPaymentWorkerPool(OrderPaymentQueueInterface):
+    """
+    Создает платежи для принятых заказов фоновыми обработчиками, число одновременных запросов к банку
+    ограничено числом обработчиков. Результат отправляется подписчикам заказа через websocket.
+    Заказы, зависшие в PENDING дольше `pending_timeout` (например, из-за перезапуска процесса),
+    помечаются как FAILED при запуске и затем каждые `sweep_interval` секунд
+    """
+
+    def __init__(
+        self,
+        container: AsyncContainer,
+        websocket_manager: WebsocketManagerInterface,
+        workers: int = 4,
+        queue_size: int = 500,
+        pending_timeout: timedelta = timedelta(minutes=10),
+        drain_timeout: float = 10,
+        sweep_interval: float = 60,
+    ) -> None:
+        self.container = container
+        self.websocket_manager = websocket_manager
+        self.workers = workers
+        self.pending_timeout = pending_timeout
+        self.drain_timeout = drain_timeout
+        self.sweep_interval = sweep_interval
+        self._queue: asyncio.Queue[OrderPaymentJob] = asyncio.Queue(maxsize=queue_size)
+        self._workers: list[asyncio.Task[None]] = []
+        self._sweeper: asyncio.Task[None] | None = None
+        self._stats = OrderPaymentStats()
+
+    def submit(self, job: OrderPaymentJob) -> None:
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self._stats.rejected += 1
+            logger.error('Order payment queue is full', extra={'order_id': job.order.id})
+            raise OrderPaymentQueueOverloadedException
+
+    async def start(self) -> None:
+        if self._workers:
+            return None
+        await self._recover()
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+        self._sweeper = asyncio.create_task(self._sweep())
+
+    async def stop(self) -> None:
+        if not self._workers:
+            return None
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=self.drain_timeout)
+        except asyncio.TimeoutError:
+            # Оставшиеся заказы остаются в PENDING, их пометит как FAILED периодическая проверка
+            # любого процесса, когда они станут старше `pending_timeout`
+            logger.warning('Order payment queue is not drained before shutdown', extra={'queued': self._queue.qsize()})
+
+        tasks = [*self._workers, self._sweeper] if self._sweeper else self._workers
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._sweeper = None
+
+    def stats(self) -> dict[str, Any]:
+        return {'queued': self._queue.qsize(), 'workers': len(self._workers), **asdict(self._stats)}
+
+    async def _recover(self) -> None:
+        try:
+            async with self.container() as container:
+                usecase = await container.get(FailStalePendingOrdersUseCase)
+                self._stats.recovered += await usecase.execute(timeout=self.pending_timeout)
+        except Exception as exc:
+            logger.error(f'Stale pending orders are not recovered: {exc!r}')
+
+    async def _sweep(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            await self._recover()
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._create_payment(job)
+            finally:
+                self._queue.task_done()
+
+    async def _create_payment(self, job: OrderPaymentJob) -> None:
+        try:
+            async with self.container() as container:
+                usecase = await container.get(CreateOrderPaymentUseCase)
+                await usecase.execute(job)
+            self._stats.created += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            self._stats.failed += 1
+            logger.error(f'Order payment is not created: {exc!r}', extra={'order_id': job.order.id})
+
+        await self._notify(job.order)
+
+    async def _notify(self, order: Order) -> None:
+        try:
+            await self.websocket_manager.send_all(
+                key=order.id,
+                data={
+                    'id': str(order.id),
+                    'status': order.status.value,
+                    'operation_id': str(order.operation_id) if order.operation_id else None,
+                    'payment_link': order.payment_link,
+                },
+            )
+        except Exception as exc:
+            logger.warning(f'Order payment notification failed: {exc!r}', extra={'order_id': order.id})
@@ -0,0 +1,3 @@
+from .dispatcher import OutboxDispatcher
+
+__all__ = ['OutboxDispatcher']
@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from typing import Any, Mapping
+
+from dishka import AsyncContainer
+from src.application.common.interfaces.outbox import (
+    OutboxDispatcherInterface,
+    OutboxHandlerInterface,
+    OutboxRepositoryInterface,
+)
+from src.application.common.interfaces.transaction import ICommiter
+from src.application.common.outbox import (
+    OutboxMessage,
+    OutboxMessageStatus,
+    OutboxMessageType,
+)
+
+logger = logging.getLogger()
+
+
+@dataclass
+class OutboxStats:
+    processed: int = 0
+    retried: int = 0
+    failed: int = 0
+    expired: int = 0
+    batches: int = 0
+
+
+class OutboxDispatcher(OutboxDispatcherInterface):
+    """
+    Забирает сообщения из outbox пачками в короткой транзакции: строки выбираются через
+    `SELECT ... FOR UPDATE SKIP LOCKED`, получают аренду `locked_until` и транзакция сразу коммитится.
+    Обработчики выполняются вне транзакции с ограничением `handler_timeout`, результат каждого сообщения
+    сохраняется отдельной короткой транзакцией. Если процесс упал, сообщения снова станут доступны после аренды
+    """
+
+    def __init__(
+        self,
+        container: AsyncContainer,
+        handlers: Mapping[OutboxMessageType, type[OutboxHandlerInterface]],
+        batch_size: int = 50,
+        poll_interval: float = 1,
+        max_attempts: int = 5,
+        retry_backoff: timedelta = timedelta(seconds=10),
+        handler_timeout: float = 90,
+        lease: timedelta = timedelta(minutes=5),
+    ) -> None:
+        self.container = container
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.handler_timeout = handler_timeout
+        self.lease = lease
+        self._task: asyncio.Task[None] | None = None
+        self._stats = OutboxStats()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict[str, Any]:
+        return asdict(self._stats)
+
+    async def dispatch_batch(self) -> int:
+        claimed_at = time.monotonic()
+        messages = await self._claim()
+
+        for message in messages:
+            # Обработчик начинается, только если успеет завершиться до конца аренды,
+            # иначе сообщение дождется аренды и достанется следующей пачке
+            if time.monotonic() - claimed_at + self.handler_timeout > self.lease.total_seconds():
+                self._stats.expired += 1
+                continue
+            await self._handle(message)
+            await self._save(message)
+
+        if messages:
+            self._stats.batches += 1
+        return len(messages)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                dispatched = await self.dispatch_batch()
+            except Exception as exc:
+                logger.error(f'Outbox dispatch failed: {exc!r}')
+                dispatched = 0
+
+            if dispatched < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    async def _claim(self) -> list[OutboxMessage]:
+        async with self.container() as container:
+            outbox_repository = await container.get(OutboxRepositoryInterface)
+            commiter = await container.get(ICommiter)
+
+            messages: list[OutboxMessage] = await outbox_repository.claim(limit=self.batch_size, lease=self.lease)
+            await commiter.commit()
+
+        return messages
+
+    async def _save(self, message: OutboxMessage) -> None:
+        async with self.container() as container:
+            outbox_repository = await container.get(OutboxRepositoryInterface)
+            commiter = await container.get(ICommiter)
+
+            await outbox_repository.update(message)
+            await commiter.commit()
+
+    async def _handle(self, message: OutboxMessage) -> None:
+        try:
+            async with self.container() as container:
+                handler = await container.get(self.handlers[message.type])
+                await asyncio.wait_for(handler.execute(payload=message.payload), timeout=self.handler_timeout)
+        except Exception as exc:
+            message.mark_failed(error=repr(exc), max_attempts=self.max_attempts, backoff=self.retry_backoff)
+            if message.status == OutboxMessageStatus.FAILED:
+                self._stats.failed += 1
+                logger.error('Outbox message failed', extra={'message_id': message.id, 'type': message.type})
+            else:
+                self._stats.retried += 1
+                logger.warning(f'Outbox message will be retried: {exc!r}', extra={'message_id': message.id})
+            return None
+
+        message.mark_processed()
+        self._stats.processed += 1
@@ -0,0 +1,97 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Any
+
+import asyncpg
+
+logger = logging.getLogger()
+
+MAX_NOTIFY_PAYLOAD_BYTES = 7999
+"""Postgres принимает payload NOTIFY короче 8000 байт"""
+
+
+class PostgresListener(ABC):
+    """
+    Держит одно LISTEN соединение на канал и переподключается с экспоненциальной задержкой.
+    Наследники обрабатывают уведомления в `_on_notification` и могут отправлять NOTIFY через это же соединение
+    """
+
+    def __init__(self, dsn: str, channel: str, min_backoff: float = 0.5, max_backoff: float = 30) -> None:
+        self.dsn = dsn
+        self.channel = channel
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self._connection: asyncpg.Connection | None = None
+        self._publish_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connection is not None and not self._connection.is_closed()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _notify(self, payload: str) -> bool:
+        """Отправляет NOTIFY, возвращает False, если соединения нет или оно оборвалось во время отправки"""
+        connection = self._connection
+        if connection is None or connection.is_closed():
+            return False
+
+        try:
+            async with self._publish_lock:
+                await connection.execute('SELECT pg_notify($1, $2)', self.channel, payload)
+        except (asyncpg.PostgresError, asyncpg.InterfaceError, OSError) as exc:
+            logger.warning(f'Listener notify failed: {exc!r}', extra={'channel': self.channel})
+            return False
+        return True
+
+    async def _listen(self) -> None:
+        backoff = self.min_backoff
+        while True:
+            try:
+                connection = await asyncpg.connect(self.dsn)
+            except (OSError, asyncpg.PostgresError) as exc:
+                logger.warning(
+                    f'Listener connection failed: {exc}, retry in {backoff}s',
+                    extra={'channel': self.channel},
+                )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+                continue
+
+            disconnected = asyncio.Event()
+            try:
+                connection.add_termination_listener(lambda _: disconnected.set())
+                await connection.add_listener(self.channel, self._on_notification)
+                self._connection = connection
+                backoff = self.min_backoff
+                logger.info('Listener is listening', extra={'channel': self.channel})
+                self._on_connected()
+                await disconnected.wait()
+                logger.warning('Listener connection lost', extra={'channel': self.channel})
+            except (OSError, asyncpg.PostgresError) as exc:
+                logger.warning(f'Listener error: {exc}', extra={'channel': self.channel})
+            finally:
+                self._connection = None
+                if not connection.is_closed():
+                    await connection.close(timeout=5)
+
+            await asyncio.sleep(backoff)
+
+    def _on_connected(self) -> None:
+        """Вызывается после каждого подключения, пока соединения не было, уведомления могли быть пропущены"""
+
+    @abstractmethod
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None: ...
@@ -0,0 +1,54 @@
+"""product search
+
+Revision ID: 8c4e2f1a7b93
+Revises: 31d707d63fdd
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4e2f1a7b93'
+down_revision: Union[str, None] = '31d707d63fdd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.add_column('products', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('russian'::regconfig, coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('russian'::regconfig, coalesce(category, '')), 'B') || "
+            "setweight(to_tsvector('russian'::regconfig, coalesce(description, '')), 'C')",
+            persisted=True,
+        ),
+        nullable=False,
+    ))
+    op.create_index('ix_products_search_vector', 'products', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index(
+        'ix_products_name_trgm', 'products', ['name'], unique=False,
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_products_category_trgm', 'products', ['category'], unique=False,
+        postgresql_using='gin', postgresql_ops={'category': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_products_description_trgm', 'products', ['description'], unique=False,
+        postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_products_description_trgm', table_name='products')
+    op.drop_index('ix_products_category_trgm', table_name='products')
+    op.drop_index('ix_products_name_trgm', table_name='products')
+    op.drop_index('ix_products_search_vector', table_name='products')
+    op.drop_column('products', 'search_vector')
@@ -0,0 +1,28 @@
+"""keyset pagination indexes
+
+Revision ID: 4f6a9d2c1e57
+Revises: 8c4e2f1a7b93
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '4f6a9d2c1e57'
+down_revision: Union[str, None] = '8c4e2f1a7b93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_products_name_id', 'products', ['name', 'id'], unique=False)
+    op.create_index('ix_users_email_id', 'users', ['email', 'id'], unique=False)
+    op.create_index('ix_chats_created_at_id', 'chats', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_chats_created_at_id', table_name='chats')
+    op.drop_index('ix_users_email_id', table_name='users')
+    op.drop_index('ix_products_name_id', table_name='products')
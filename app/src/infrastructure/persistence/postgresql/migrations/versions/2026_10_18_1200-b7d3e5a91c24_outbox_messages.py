@@ -0,0 +1,45 @@
+"""outbox messages
+
+Revision ID: b7d3e5a91c24
+Revises: 4f6a9d2c1e57
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d3e5a91c24'
+down_revision: Union[str, None] = '4f6a9d2c1e57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'outbox_messages',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('type', sa.Enum('NEW_ORDER_EMAIL', name='outboxmessagetype'), nullable=False),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('status', sa.Enum('PENDING', 'PROCESSED', 'FAILED', name='outboxmessagestatus'), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.TIMESTAMP(), nullable=False),
+        sa.Column('available_at', sa.TIMESTAMP(), nullable=False),
+        sa.Column('processed_at', sa.TIMESTAMP(), nullable=True),
+        sa.Column('last_error', sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_outbox_messages_pending', 'outbox_messages', ['available_at'], unique=False,
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_messages_pending', table_name='outbox_messages')
+    op.drop_table('outbox_messages')
+    sa.Enum(name='outboxmessagestatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='outboxmessagetype').drop(op.get_bind(), checkfirst=True)
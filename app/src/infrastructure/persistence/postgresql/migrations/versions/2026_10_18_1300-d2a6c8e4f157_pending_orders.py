@@ -0,0 +1,30 @@
+"""pending orders
+
+Revision ID: d2a6c8e4f157
+Revises: b7d3e5a91c24
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a6c8e4f157'
+down_revision: Union[str, None] = 'b7d3e5a91c24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE orderstatus ADD VALUE IF NOT EXISTS 'PENDING' BEFORE 'CREATED'")
+    op.alter_column('orders', 'operation_id', existing_type=sa.Uuid(), nullable=True)
+
+
+def downgrade() -> None:
+    # Значение PENDING остается в типе orderstatus, удалить значение из enum в postgres нельзя
+    op.execute("UPDATE orders SET status = 'FAILED' WHERE status = 'PENDING'")
+    op.execute('DELETE FROM orders WHERE operation_id IS NULL')
+    op.alter_column('orders', 'operation_id', existing_type=sa.Uuid(), nullable=False)
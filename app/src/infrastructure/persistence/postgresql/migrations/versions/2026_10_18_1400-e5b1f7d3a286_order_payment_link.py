@@ -0,0 +1,25 @@
+"""order payment link
+
+Revision ID: e5b1f7d3a286
+Revises: d2a6c8e4f157
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b1f7d3a286'
+down_revision: Union[str, None] = 'd2a6c8e4f157'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('orders', sa.Column('payment_link', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('orders', 'payment_link')
@@ -0,0 +1,30 @@
+"""messages chat created_at index
+
+Revision ID: a3d9e1c7b482
+Revises: f8c2a4e6b319
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d9e1c7b482'
+down_revision: Union[str, None] = 'f8c2a4e6b319'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_messages_chat_id_created_at_id',
+        'messages',
+        ['chat_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_messages_chat_id_created_at_id', table_name='messages')
@@ -0,0 +1,32 @@
+"""catalog version
+
+Revision ID: b6e2f8a4c913
+Revises: a3d9e1c7b482
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e2f8a4c913'
+down_revision: Union[str, None] = 'a3d9e1c7b482'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'catalog_version',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.Column('updated_at', sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.execute('INSERT INTO catalog_version (id, version, updated_at) VALUES (1, 1, now())')
+
+
+def downgrade() -> None:
+    op.drop_table('catalog_version')
@@ -0,0 +1,25 @@
+"""outbox lease
+
+Revision ID: c4a7d2e9f158
+Revises: b6e2f8a4c913
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a7d2e9f158'
+down_revision: Union[str, None] = 'b6e2f8a4c913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('outbox_messages', sa.Column('locked_until', sa.TIMESTAMP(timezone=False), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('outbox_messages', 'locked_until')
@@ -1,8 +1,10 @@
 from .auth import RefreshSessionModel
 from .base import Base
 from .chat import ChatModel, MessageModel
+from .idempotency import IdempotencyKeyModel
 from .order import OrderItemModel, OrderModel
-from .product import CategoryModel, ProductModel
+from .outbox import OutboxMessageModel
+from .product import CatalogVersionModel, CategoryModel, ProductModel
 from .user import UserModel
 
 __all__ = [
@@ -12,8 +14,11 @@ __all__ = [
     'OrderItemModel',
     'ProductModel',
     'CategoryModel',
+    'CatalogVersionModel',
     'RefreshSessionModel',
     # "UserSessionModel",
     'ChatModel',
     'MessageModel',
+    'OutboxMessageModel',
+    'IdempotencyKeyModel',
 ]
@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import TIMESTAMP, ForeignKey
+from sqlalchemy import TIMESTAMP, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.domain.chats.entities import Chat, Message
 from src.infrastructure.persistence.postgresql.models.base import Base
@@ -19,6 +19,8 @@ class ChatModel(Base):
         back_populates='chat', order_by='MessageModel.created_at',
     )
 
+    __table_args__ = (Index('ix_chats_created_at_id', 'created_at', 'id'),)
+
     def __repr__(self) -> str:
         return f'ChatModel(id={self.id}, owner_id={self.owner_id}, title={self.title}, created_at={self.created_at}, updated_at={self.updated_at})'
 
@@ -48,6 +50,8 @@ class MessageModel(Base):
 
     chat: Mapped['ChatModel'] = relationship(back_populates='last_messages')
 
+    __table_args__ = (Index('ix_messages_chat_id_created_at_id', 'chat_id', text('created_at DESC'), text('id DESC')),)
+
     def __repr__(self) -> str:
         return f'MessageModel(id={self.id}, user_id={self.user_id}, chat_id={self.chat_id}, content={self.content}, created_at={self.created_at}, updated_at={self.updated_at})'
 
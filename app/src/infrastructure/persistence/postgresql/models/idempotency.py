@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import TIMESTAMP
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from src.application.common.idempotency import IdempotencyRecord
+from src.infrastructure.persistence.postgresql.models.base import Base
+
+
+class IdempotencyKeyModel(Base):
+    __tablename__ = 'idempotency_keys'
+
+    key: Mapped[str] = mapped_column(primary_key=True)
+    request_hash: Mapped[str] = mapped_column(nullable=False)
+    response: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=False), nullable=False, index=True)
+
+
+def map_to_idempotency_record(entity: IdempotencyKeyModel) -> IdempotencyRecord:
+    return IdempotencyRecord(
+        key=entity.key,
+        request_hash=entity.request_hash,
+        response=entity.response,
+        created_at=entity.created_at,
+    )
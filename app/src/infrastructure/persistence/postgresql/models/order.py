@@ -22,11 +22,12 @@ class OrderModel(Base):
     created_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=False), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=False), nullable=False)
     shipping_address: Mapped[str] = mapped_column(nullable=False)
-    operation_id: Mapped[UUID] = mapped_column(nullable=False)
+    operation_id: Mapped[UUID | None] = mapped_column(nullable=True)
     tracking_number: Mapped[str] = mapped_column(nullable=True)
     total_price: Mapped[int] = mapped_column(nullable=False)
     is_self_pickup: Mapped[bool] = mapped_column(nullable=False)
     status: Mapped[OrderStatus] = mapped_column(nullable=False)
+    payment_link: Mapped[str | None] = mapped_column(nullable=True)
 
     order_items: Mapped[list['OrderItemModel']] = relationship(back_populates='order')
 
@@ -43,6 +44,7 @@ def map_to_order(entity: OrderModel, with_relations: bool = False) -> Order:
         total_price=entity.total_price,
         status=entity.status,
         is_self_pickup=entity.is_self_pickup,
+        payment_link=entity.payment_link,
     )
     if with_relations:
         order.items = [
@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import TIMESTAMP, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from src.application.common.outbox import (
+    OutboxMessage,
+    OutboxMessageStatus,
+    OutboxMessageType,
+)
+from src.infrastructure.persistence.postgresql.models.base import Base
+
+
+class OutboxMessageModel(Base):
+    __tablename__ = 'outbox_messages'
+    __table_args__ = (
+        Index('ix_outbox_messages_pending', 'available_at', postgresql_where=text("status = 'PENDING'")),
+    )
+
+    id: Mapped[UUID] = mapped_column(primary_key=True)
+    type: Mapped[OutboxMessageType] = mapped_column(nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    status: Mapped[OutboxMessageStatus] = mapped_column(nullable=False)
+    attempts: Mapped[int] = mapped_column(nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=False), nullable=False)
+    available_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=False), nullable=False)
+    processed_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=False), nullable=True)
+    last_error: Mapped[str] = mapped_column(nullable=True)
+    locked_until: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=False), nullable=True)
+
+
+def map_to_outbox_message(entity: OutboxMessageModel) -> OutboxMessage:
+    return OutboxMessage(
+        id=entity.id,
+        type=entity.type,
+        payload=entity.payload,
+        status=entity.status,
+        attempts=entity.attempts,
+        created_at=entity.created_at,
+        available_at=entity.available_at,
+        processed_at=entity.processed_at,
+        last_error=entity.last_error,
+    )
@@ -1,8 +1,10 @@
+from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
 from fastapi import Request
-from sqlalchemy import ForeignKey
+from sqlalchemy import TIMESTAMP, BigInteger, Computed, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.application.common.utils import parse_price
 from src.domain.products.entities import (
@@ -17,6 +19,23 @@ from src.infrastructure.persistence.postgresql.models.base import Base
 if TYPE_CHECKING:
     pass
 
+PRODUCT_SEARCH_CONFIG = 'russian'
+PRODUCT_SEARCH_VECTOR = (
+    "setweight(to_tsvector('russian'::regconfig, coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('russian'::regconfig, coalesce(category, '')), 'B') || "
+    "setweight(to_tsvector('russian'::regconfig, coalesce(description, '')), 'C')"
+)
+
+
+class CatalogVersionModel(Base):
+    """Единственная строка с версией каталога, по ней строятся ETag и Last-Modified ответов каталога"""
+
+    __tablename__ = 'catalog_version'
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
+
 
 class CategoryModel(Base):
     __tablename__ = 'categories'
@@ -50,9 +69,28 @@ class ProductModel(Base):
     image: Mapped[str] = mapped_column(nullable=False, default='/images/not_found.jpg')
     status: Mapped[ProductStatus] = mapped_column(nullable=False)
     is_available: Mapped[bool] = mapped_column(nullable=False, default=True)
+    search_vector: Mapped[str] = mapped_column(TSVECTOR, Computed(PRODUCT_SEARCH_VECTOR, persisted=True))
 
     product_category: Mapped['CategoryModel'] = relationship()
 
+    __table_args__ = (
+        Index('ix_products_name_id', 'name', 'id'),
+        Index('ix_products_search_vector', 'search_vector', postgresql_using='gin'),
+        Index('ix_products_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+        Index(
+            'ix_products_category_trgm',
+            'category',
+            postgresql_using='gin',
+            postgresql_ops={'category': 'gin_trgm_ops'},
+        ),
+        Index(
+            'ix_products_description_trgm',
+            'description',
+            postgresql_using='gin',
+            postgresql_ops={'description': 'gin_trgm_ops'},
+        ),
+    )
+
     def __admin_repr__(self, request: Request) -> str:
         return f'{self.name}'
 
@@ -2,7 +2,7 @@ from datetime import datetime
 from uuid import UUID
 
 from fastapi import Request
-from sqlalchemy import TIMESTAMP, ForeignKey
+from sqlalchemy import TIMESTAMP, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.domain.users.entities import User, UserRole, UserSession
 from src.infrastructure.persistence.postgresql.models.base import Base
@@ -22,6 +22,8 @@ class UserModel(Base):
 
     sessions: Mapped[list['UserSessionModel']] = relationship(back_populates='user')
 
+    __table_args__ = (Index('ix_users_email_id', 'email', 'id'),)
+
     def __admin_repr__(self, request: Request) -> str:
         return f'{self.email}'
 
@@ -0,0 +1,21 @@
+import json
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.application.common.interfaces.invalidation import InvalidationTopic
+
+INVALIDATION_CHANNEL = 'cache_invalidation'
+
+
+def make_invalidation_payload(topic: InvalidationTopic, key: str | None = None) -> str:
+    return json.dumps({'topic': topic.value, 'key': key})
+
+
+async def notify_invalidation(session: AsyncSession, topic: InvalidationTopic, key: str | None = None) -> None:
+    """
+    Отправляет NOTIFY в рамках текущей транзакции сессии.
+    Postgres доставит уведомление только после коммита, при откате оно будет отброшено
+    """
+    query = select(func.pg_notify(INVALIDATION_CHANNEL, make_invalidation_payload(topic, key)))
+
+    await session.execute(query)
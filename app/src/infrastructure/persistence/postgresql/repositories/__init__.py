@@ -1,6 +1,8 @@
 from .chat import SqlalchemyChatRepository
+from .idempotency import SqlalchemyIdempotencyRepository
 from .message import SqlalchemyMessageRepository
 from .order import SqlalchemyOrderItemRepository, SqlalchemyOrderRepository
+from .outbox import SqlalchemyOutboxRepository
 from .product import SqlalchemyProductRepository
 from .refresh import SqlalchemyRefreshTokenRepository
 from .user import SqlalchemyUserRepository
@@ -13,4 +15,6 @@ __all__ = [
     'SqlalchemyRefreshTokenRepository',
     'SqlalchemyChatRepository',
     'SqlalchemyMessageRepository',
+    'SqlalchemyOutboxRepository',
+    'SqlalchemyIdempotencyRepository',
 ]
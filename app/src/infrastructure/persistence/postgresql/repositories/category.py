@@ -1,11 +1,16 @@
 from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.application.common.interfaces.invalidation import InvalidationTopic
 from src.domain.products.entities import Category
 from src.domain.products.repository import CategoryRepositoryInterface
 from src.infrastructure.persistence.postgresql.models.product import (
     CategoryModel,
     map_to_category,
 )
+from src.infrastructure.persistence.postgresql.notify import notify_invalidation
+from src.infrastructure.persistence.postgresql.repositories.product import (
+    bump_catalog_version,
+)
 
 
 class SqlalchemyCategoryRepository(CategoryRepositoryInterface):
@@ -17,6 +22,8 @@ class SqlalchemyCategoryRepository(CategoryRepositoryInterface):
     async def create(self, category: Category) -> None:
         query = insert(CategoryModel).values(name=category.name, is_available=category.is_available)
         await self.session.execute(query)
+        await notify_invalidation(self.session, InvalidationTopic.CATEGORY, category.name)
+        await bump_catalog_version(self.session)
         return None
 
     async def update(self, category: Category) -> None:
@@ -26,11 +33,15 @@ class SqlalchemyCategoryRepository(CategoryRepositoryInterface):
             .values(name=category.name, is_available=category.is_available)
         )
         await self.session.execute(query)
+        await notify_invalidation(self.session, InvalidationTopic.CATEGORY, category.name)
+        await bump_catalog_version(self.session)
         return None
 
     async def delete(self, category_name: str) -> None:
         query = delete(CategoryModel).where(CategoryModel.name == category_name)
         await self.session.execute(query)
+        await notify_invalidation(self.session, InvalidationTopic.CATEGORY, category_name)
+        await bump_catalog_version(self.session)
         return None
 
     async def get_by_name(self, category_name: str) -> Category | None:
@@ -1,7 +1,8 @@
 from uuid import UUID
 
-from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy import delete, func, insert, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.application.common.pagination import PageCursor
 from src.domain.chats.entities import Chat
 from src.domain.chats.repository import ChatPrimaryKey, ChatRepositoryInterface
 from src.infrastructure.persistence.postgresql.models.chat import (
@@ -65,7 +66,12 @@ class SqlalchemyChatRepository(ChatRepositoryInterface):
     ) -> Chat | None:
         if with_relations:
             chat_query = select(ChatModel).where(ChatModel.id == value)
-            messages_query = select(MessageModel).where(MessageModel.chat_id == value).limit(10)
+            messages_query = (
+                select(MessageModel)
+                .where(MessageModel.chat_id == value)
+                .order_by(MessageModel.created_at.desc(), MessageModel.id.desc())
+                .limit(10)
+            )
 
             chat_cursor = await self.session.execute(chat_query)
 
@@ -76,7 +82,8 @@ class SqlalchemyChatRepository(ChatRepositoryInterface):
 
             messages_cursor = await self.session.execute(messages_query)
 
-            messages = messages_cursor.scalars().all()
+            # Последние сообщения выбираются от новых к старым, а в чате показываются по порядку
+            messages = messages_cursor.scalars().all()[::-1]
 
             return map_to_chat_with_messages(
                 entity=chat_entitiy,
@@ -105,6 +112,7 @@ class SqlalchemyChatRepository(ChatRepositoryInterface):
         owner_id: UUID | None = None,
         offset: int = 0,
         limit: int = 100,
+        after: PageCursor | None = None,
     ) -> list[Chat]:
         query = select(ChatModel)
 
@@ -112,8 +120,10 @@ class SqlalchemyChatRepository(ChatRepositoryInterface):
             query = query.where(ChatModel.title.ilike(f'%{search}%'))
         if owner_id:
             query = query.where(ChatModel.owner_id == owner_id)
+        if after:
+            query = query.where(tuple_(ChatModel.created_at, ChatModel.id) > (after.datetime_key, after.id))
 
-        query = query.limit(limit).offset(offset)
+        query = query.order_by(ChatModel.created_at, ChatModel.id).limit(limit).offset(offset)
 
         cursor = await self.session.execute(query)
 
@@ -0,0 +1,65 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import and_, delete, null, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.application.common.idempotency import IdempotencyRecord
+from src.application.common.interfaces.idempotency import IdempotencyRepositoryInterface
+from src.infrastructure.persistence.postgresql.models.idempotency import (
+    IdempotencyKeyModel,
+    map_to_idempotency_record,
+)
+
+
+class SqlalchemyIdempotencyRepository(IdempotencyRepositoryInterface):
+    __slots__ = ('session',)
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def reserve(
+        self,
+        key: str,
+        request_hash: str,
+        expired_before: datetime,
+        in_progress_expired_before: datetime,
+    ) -> IdempotencyRecord | None:
+        values = insert(IdempotencyKeyModel).values(
+            key=key,
+            request_hash=request_hash,
+            response=null(),
+            created_at=datetime.now(),
+        )
+        query = values.on_conflict_do_update(
+            index_elements=[IdempotencyKeyModel.key],
+            set_={
+                'request_hash': values.excluded.request_hash,
+                'response': null(),
+                'created_at': values.excluded.created_at,
+            },
+            where=or_(
+                IdempotencyKeyModel.created_at < expired_before,
+                and_(
+                    IdempotencyKeyModel.response.is_(None),
+                    IdempotencyKeyModel.created_at < in_progress_expired_before,
+                ),
+            ),
+        ).returning(IdempotencyKeyModel.key)
+
+        reserved = await self.session.scalar(query)
+        if reserved is not None:
+            return None
+
+        cursor = await self.session.execute(select(IdempotencyKeyModel).where(IdempotencyKeyModel.key == key))
+        return map_to_idempotency_record(cursor.scalar_one())
+
+    async def complete(self, key: str, response: dict[str, Any]) -> None:
+        query = update(IdempotencyKeyModel).where(IdempotencyKeyModel.key == key).values(response=response)
+
+        await self.session.execute(query)
+
+    async def delete(self, key: str) -> None:
+        query = delete(IdempotencyKeyModel).where(IdempotencyKeyModel.key == key)
+
+        await self.session.execute(query)
@@ -1,7 +1,8 @@
 from uuid import UUID
 
-from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy import delete, func, insert, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.application.common.pagination import PageCursor
 from src.domain.chats.entities import Message
 from src.domain.chats.repository import MessagePrimaryKey, MessageRepositoryInterface
 from src.infrastructure.persistence.postgresql.models.chat import (
@@ -28,6 +29,23 @@ class SqlalchemyMessageRepository(MessageRepositoryInterface):
         await self.session.execute(query)
         return None
 
+    async def create_many(self, messages: list[Message]) -> None:
+        query = insert(MessageModel).values(
+            [
+                {
+                    'id': message.id,
+                    'user_id': message.user_id,
+                    'chat_id': message.chat_id,
+                    'content': message.content,
+                    'created_at': message.created_at,
+                    'updated_at': message.updated_at,
+                }
+                for message in messages
+            ],
+        )
+        await self.session.execute(query)
+        return None
+
     async def update(self, message: Message) -> None:
         query = (
             update(MessageModel)
@@ -53,21 +71,30 @@ class SqlalchemyMessageRepository(MessageRepositoryInterface):
     async def get_by_id(self, message_id: UUID) -> Message | None:
         return await self._get_by(key=MessagePrimaryKey.ID, value=message_id)
 
-    async def get_by_chat_id(self, chat_id: UUID, offset: int = 0, limit: int = 10) -> list[Message]:
-        query = select(MessageModel).where(MessageModel.chat_id == chat_id).limit(limit).offset(offset)
+    async def get_by_chat_id(self, chat_id: UUID, limit: int = 50, before: PageCursor | None = None) -> list[Message]:
+        # Порядок совпадает с индексом (chat_id, created_at DESC, id DESC),
+        # страница читается диапазоном индекса без сортировки
+        query = select(MessageModel).where(MessageModel.chat_id == chat_id)
+        if before:
+            query = query.where(tuple_(MessageModel.created_at, MessageModel.id) < (before.datetime_key, before.id))
+        query = query.order_by(MessageModel.created_at.desc(), MessageModel.id.desc()).limit(limit)
         cursor = await self.session.execute(query)
         entities = cursor.scalars().all()
         return [map_to_message(entity) for entity in entities]
 
     async def get_many(
-        self, chat_id: UUID | None = None, user_id: UUID | None = None, offset: int = 0, limit: int = 10,
+        self,
+        chat_id: UUID | None = None,
+        user_id: UUID | None = None,
+        offset: int = 0,
+        limit: int = 10,
     ) -> list[Message]:
         query = select(MessageModel)
         if chat_id:
             query = query.where(MessageModel.chat_id == chat_id)
         if user_id:
             query = query.where(MessageModel.user_id == user_id)
-        query = query.limit(limit).offset(offset)
+        query = query.order_by(MessageModel.created_at, MessageModel.id).limit(limit).offset(offset)
         cursor = await self.session.execute(query)
         entities = cursor.scalars().all()
         return [map_to_message(entity) for entity in entities]
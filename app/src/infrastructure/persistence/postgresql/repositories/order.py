@@ -1,7 +1,8 @@
-from datetime import date
+from datetime import date, datetime
+from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import CursorResult, delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 from src.domain.orders.entities import Order, OrderItem, OrderStatus
@@ -36,6 +37,7 @@ class SqlalchemyOrderRepository(OrderRepositoryInterface):
             total_price=order.total_price,
             is_self_pickup=order.is_self_pickup,
             status=order.status,
+            payment_link=order.payment_link,
         )
 
         await self.session.execute(query)
@@ -54,6 +56,8 @@ class SqlalchemyOrderRepository(OrderRepositoryInterface):
             update(OrderModel)
             .where(OrderModel.id == order.id)
             .values(
+                operation_id=order.operation_id,
+                payment_link=order.payment_link,
                 shipping_address=order.shipping_address,
                 tracking_number=order.tracking_number,
                 is_self_pickup=order.is_self_pickup,
@@ -155,6 +159,17 @@ class SqlalchemyOrderRepository(OrderRepositoryInterface):
 
         return [map_to_order(entity, with_relations=True) for entity in entities]
 
+    async def fail_pending(self, created_before: datetime) -> int:
+        query = (
+            update(OrderModel)
+            .where(OrderModel.status == OrderStatus.PENDING, OrderModel.created_at < created_before)
+            .values(status=OrderStatus.FAILED, updated_at=datetime.now())
+        )
+
+        cursor = cast(CursorResult[Any], await self.session.execute(query))
+
+        return cursor.rowcount
+
 
 class SqlalchemyOrderItemRepository(OrderItemRepositoryInterface):
     __slots__ = ["session"]
@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.application.common.interfaces.outbox import OutboxRepositoryInterface
+from src.application.common.outbox import OutboxMessage, OutboxMessageStatus
+from src.infrastructure.persistence.postgresql.models.outbox import (
+    OutboxMessageModel,
+    map_to_outbox_message,
+)
+
+
+class SqlalchemyOutboxRepository(OutboxRepositoryInterface):
+    __slots__ = ('session',)
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def add(self, message: OutboxMessage) -> None:
+        query = insert(OutboxMessageModel).values(
+            id=message.id,
+            type=message.type,
+            payload=message.payload,
+            status=message.status,
+            attempts=message.attempts,
+            created_at=message.created_at,
+            available_at=message.available_at,
+        )
+
+        await self.session.execute(query)
+
+    async def claim(self, limit: int, lease: timedelta) -> list[OutboxMessage]:
+        now = datetime.now()
+        claimable = (
+            select(OutboxMessageModel.id)
+            .where(
+                OutboxMessageModel.status == OutboxMessageStatus.PENDING,
+                OutboxMessageModel.available_at <= now,
+                or_(OutboxMessageModel.locked_until.is_(None), OutboxMessageModel.locked_until <= now),
+            )
+            .order_by(OutboxMessageModel.available_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        query = (
+            update(OutboxMessageModel)
+            .where(OutboxMessageModel.id.in_(claimable.scalar_subquery()))
+            .values(locked_until=now + lease)
+            .returning(OutboxMessageModel)
+            .execution_options(synchronize_session=False)
+        )
+
+        cursor = await self.session.execute(query)
+
+        entities = sorted(cursor.scalars().all(), key=lambda entity: entity.available_at)
+        return [map_to_outbox_message(entity) for entity in entities]
+
+    async def update(self, message: OutboxMessage) -> None:
+        query = (
+            update(OutboxMessageModel)
+            .where(OutboxMessageModel.id == message.id)
+            .values(
+                status=message.status,
+                attempts=message.attempts,
+                available_at=message.available_at,
+                processed_at=message.processed_at,
+                last_error=message.last_error,
+                locked_until=None,
+            )
+        )
+
+        await self.session.execute(query)
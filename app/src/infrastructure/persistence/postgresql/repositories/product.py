@@ -1,14 +1,121 @@
+from datetime import datetime, timezone
+from typing import Any, TypeVar
 from uuid import UUID
 
-from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.application.common.interfaces.invalidation import InvalidationTopic
+from src.application.common.pagination import PageCursor
 from src.application.products.filters import ProductFilters
-from src.domain.products.entities import Product
+from src.domain.products.entities import CatalogVersion, Product
 from src.domain.products.repository import ProductRepositoryInterface
 from src.infrastructure.persistence.postgresql.models.product import (
+    PRODUCT_SEARCH_CONFIG,
+    CatalogVersionModel,
     ProductModel,
     map_to_product,
 )
+from src.infrastructure.persistence.postgresql.notify import notify_invalidation
+
+TSelect = TypeVar('TSelect', bound=Select[Any])
+
+CATALOG_VERSION_ID = 1
+
+
+async def bump_catalog_version(session: AsyncSession) -> None:
+    """
+    Увеличивает версию каталога в рамках текущей транзакции.
+    Строка блокируется до коммита, поэтому изменения каталога получают версии в порядке коммитов
+    """
+    query = (
+        pg_insert(CatalogVersionModel)
+        .values(id=CATALOG_VERSION_ID, version=1, updated_at=func.clock_timestamp())
+        .on_conflict_do_update(
+            index_elements=[CatalogVersionModel.id],
+            set_={'version': CatalogVersionModel.version + 1, 'updated_at': func.clock_timestamp()},
+        )
+    )
+
+    await session.execute(query)
+
+
+def _search_condition(search: str) -> ColumnElement[bool]:
+    """
+    Полнотекстовое совпадение по `search_vector` или нечеткое (триграммное) совпадение по названию.
+    Оба условия обслуживаются GIN индексами
+    """
+    ts_query = func.websearch_to_tsquery(PRODUCT_SEARCH_CONFIG, search)
+    return or_(
+        ProductModel.search_vector.op('@@')(ts_query),
+        literal(search).op('<%')(ProductModel.name),
+    )
+
+
+def _search_rank(search: str) -> ColumnElement[float]:
+    ts_query = func.websearch_to_tsquery(PRODUCT_SEARCH_CONFIG, search)
+    return func.ts_rank_cd(ProductModel.search_vector, ts_query) + func.word_similarity(search, ProductModel.name)
+
+
+def _apply_filters(query: TSelect, filters: ProductFilters | None) -> TSelect:
+    """Общий набор условий фильтрации для выборки и подсчета товаров"""
+    if not filters:
+        return query
+
+    if filters.search:
+        query = query.where(_search_condition(filters.search))
+    if filters.name:
+        query = query.where(ProductModel.name.ilike(f"%{filters.name}%"))
+    if filters.category:
+        query = query.where(
+            ProductModel.category.ilike(f"%{filters.category}%"),
+        )
+    if filters.description:
+        query = query.where(
+            ProductModel.description.ilike(f"%{filters.description}%"),
+        )
+    if filters.price_from:
+        query = query.where(
+            ProductModel.retail_price >= filters.price_from,
+        )
+    if filters.price_to:
+        query = query.where(
+            ProductModel.retail_price <= filters.price_to,
+        )
+    if filters.units_of_measurement:
+        query = query.where(
+            ProductModel.units_of_measurement == filters.units_of_measurement,
+        )
+    if filters.is_available:
+        query = query.where(
+            ProductModel.is_available == filters.is_available,
+        )
+
+    return query
+
+
+def _order_by(query: TSelect, filters: ProductFilters | None, after: PageCursor | None = None) -> TSelect:
+    """
+    Поисковая выдача сортируется по релевантности и листается только по номеру страницы,
+    остальные выборки сортируются по паре (name, id), по которой выполняется переход к следующей странице
+    """
+    if filters and filters.search:
+        return query.order_by(_search_rank(filters.search).desc(), ProductModel.id)
+    if after:
+        query = query.where(tuple_(ProductModel.name, ProductModel.id) > (after.key, after.id))
+
+    return query.order_by(ProductModel.name, ProductModel.id)
 
 
 class SqlalchemyProductRepository(ProductRepositoryInterface):
@@ -46,6 +153,8 @@ class SqlalchemyProductRepository(ProductRepositoryInterface):
         )
 
         await self.session.execute(query)
+        await notify_invalidation(self.session, InvalidationTopic.PRODUCT, str(product.id))
+        await bump_catalog_version(self.session)
 
         return None
 
@@ -83,6 +192,8 @@ class SqlalchemyProductRepository(ProductRepositoryInterface):
         )
 
         await self.session.execute(query)
+        await notify_invalidation(self.session, InvalidationTopic.PRODUCT, str(product.id))
+        await bump_catalog_version(self.session)
 
         return None
 
@@ -90,6 +201,8 @@ class SqlalchemyProductRepository(ProductRepositoryInterface):
         query = delete(ProductModel).where(ProductModel.id == product_id)
 
         await self.session.execute(query)
+        await notify_invalidation(self.session, InvalidationTopic.PRODUCT, str(product_id))
+        await bump_catalog_version(self.session)
 
         return None
 
@@ -107,36 +220,9 @@ class SqlalchemyProductRepository(ProductRepositoryInterface):
         filters: ProductFilters | None = None,
         offset: int = 0,
         limit: int = 100,
+        after: PageCursor | None = None,
     ) -> list[Product]:
-        query = select(ProductModel)
-
-        if filters:
-            if filters.name:
-                query = query.where(ProductModel.name.ilike(f"%{filters.name}%"))
-            if filters.category:
-                query = query.where(
-                    ProductModel.category.ilike(f"%{filters.category}%"),
-                )
-            if filters.description:
-                query = query.where(
-                    ProductModel.description.ilike(f"%{filters.description}%"),
-                )
-            if filters.price_from:
-                query = query.where(
-                    ProductModel.retail_price >= filters.price_from,
-                )
-            if filters.price_to:
-                query = query.where(
-                    ProductModel.retail_price <= filters.price_to,
-                )
-            if filters.units_of_measurement:
-                query = query.where(
-                    ProductModel.units_of_measurement == filters.units_of_measurement,
-                )
-            if filters.is_available:
-                query = query.where(
-                    ProductModel.is_available == filters.is_available,
-                )
+        query = _order_by(_apply_filters(select(ProductModel), filters), filters, after)
 
         query = query.limit(limit).offset(offset)
 
@@ -150,35 +236,7 @@ class SqlalchemyProductRepository(ProductRepositoryInterface):
         self,
         filters: ProductFilters | None = None,
     ) -> int:
-        query = select(func.count()).select_from(ProductModel)
-
-        if filters:
-            if filters.name:
-                query = query.where(ProductModel.name.ilike(f"%{filters.name}%"))
-            if filters.category:
-                query = query.where(
-                    ProductModel.category.ilike(f"%{filters.category}%"),
-                )
-            if filters.description:
-                query = query.where(
-                    ProductModel.description.ilike(f"%{filters.description}%"),
-                )
-            if filters.price_from:
-                query = query.where(
-                    ProductModel.retail_price >= filters.price_from,
-                )
-            if filters.price_to:
-                query = query.where(
-                    ProductModel.retail_price <= filters.price_to,
-                )
-            if filters.units_of_measurement:
-                query = query.where(
-                    ProductModel.units_of_measurement == filters.units_of_measurement,
-                )
-            if filters.is_available:
-                query = query.where(
-                    ProductModel.is_available == filters.is_available,
-                )
+        query = _apply_filters(select(func.count()).select_from(ProductModel), filters)
 
         cursor = await self.session.execute(query)
 
@@ -186,6 +244,27 @@ class SqlalchemyProductRepository(ProductRepositoryInterface):
 
         return count if count else 0
 
+    async def get_many_with_count(
+        self,
+        filters: ProductFilters | None = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[Product], int]:
+        total = func.count().over().label("total")
+        query = _order_by(_apply_filters(select(ProductModel, total), filters), filters)
+
+        query = query.limit(limit).offset(offset)
+
+        cursor = await self.session.execute(query)
+
+        rows = cursor.all()
+
+        if not rows:
+            # За пределами последней страницы окно не возвращает строк, поэтому общее количество запрашивается отдельно
+            return [], (await self.count(filters=filters) if offset else 0)
+
+        return [map_to_product(row[0]) for row in rows], rows[0].total
+
     async def get_many_by_ids(
         self,
         product_ids: set[UUID],
@@ -208,3 +287,15 @@ class SqlalchemyProductRepository(ProductRepositoryInterface):
             [map_to_product(entity) for entity in entities],
             missing_entities,
         )
+
+    async def get_catalog_version(self) -> CatalogVersion:
+        query = select(CatalogVersionModel).where(CatalogVersionModel.id == CATALOG_VERSION_ID)
+
+        cursor = await self.session.execute(query)
+
+        entity = cursor.scalar_one_or_none()
+
+        if not entity:
+            return CatalogVersion(version=0, updated_at=datetime(1970, 1, 1, tzinfo=timezone.utc))
+
+        return CatalogVersion(version=entity.version, updated_at=entity.updated_at)
@@ -1,10 +1,13 @@
 from uuid import UUID
 
-from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy import delete, func, insert, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.application.common.interfaces.invalidation import InvalidationTopic
+from src.application.common.pagination import PageCursor
 from src.domain.users.entities import User
 from src.domain.users.repository import UserPrimaryKey, UserRepositoryInterface
 from src.infrastructure.persistence.postgresql.models.user import UserModel, map_to_user
+from src.infrastructure.persistence.postgresql.notify import notify_invalidation
 
 
 class SqlalchemyUserRepository(UserRepositoryInterface):
@@ -39,11 +42,13 @@ class SqlalchemyUserRepository(UserRepositoryInterface):
             )
         )
         await self.session.execute(query)
+        await notify_invalidation(self.session, InvalidationTopic.USER, str(user.id))
         return None
 
     async def delete(self, user_id: UUID) -> None:
         query = delete(UserModel).where(UserModel.id == user_id)
         await self.session.execute(query)
+        await notify_invalidation(self.session, InvalidationTopic.USER, str(user_id))
         return None
 
     async def _get_by(self, key: UserPrimaryKey, value: UUID | str) -> User | None:
@@ -67,11 +72,14 @@ class SqlalchemyUserRepository(UserRepositoryInterface):
         search: str | None = None,
         offset: int = 0,
         limit: int = 100,
+        after: PageCursor | None = None,
     ) -> list[User]:
         query = select(UserModel)
         if search:
             query = query.where(UserModel.email.ilike(f"%{search}%"))
-        query = query.limit(limit).offset(offset)
+        if after:
+            query = query.where(tuple_(UserModel.email, UserModel.id) > (after.key, after.id))
+        query = query.order_by(UserModel.email, UserModel.id).limit(limit).offset(offset)
         cursor = await self.session.execute(query)
         entities = cursor.scalars().all()
         return [map_to_user(entity) for entity in entities]
@@ -3,12 +3,14 @@ from uuid import UUID
 from sqlalchemy import delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
+from src.application.common.interfaces.invalidation import InvalidationTopic
 from src.domain.users.entities import UserSession
 from src.domain.users.repository import UserSessionRepositoryInterface
 from src.infrastructure.persistence.postgresql.models.user import (
     UserSessionModel,
     map_to_user_session,
 )
+from src.infrastructure.persistence.postgresql.notify import notify_invalidation
 
 
 class SqlalchemyUserSessionRepository(UserSessionRepositoryInterface):
@@ -32,11 +34,16 @@ class SqlalchemyUserSessionRepository(UserSessionRepositoryInterface):
         return None
 
     async def update(self, session: UserSession) -> None:
-        query = update(UserSessionModel).values(
-            expires_in=session.expires_in,
+        query = (
+            update(UserSessionModel)
+            .where(UserSessionModel.id == session.id)
+            .values(
+                expires_in=session.expires_in,
+            )
         )
 
         await self.session.execute(query)
+        await notify_invalidation(self.session, InvalidationTopic.USER_SESSION, str(session.id))
 
         return None
 
@@ -44,6 +51,7 @@ class SqlalchemyUserSessionRepository(UserSessionRepositoryInterface):
         query = delete(UserSessionModel).where(UserSessionModel.id == session_id)
 
         await self.session.execute(query)
+        await notify_invalidation(self.session, InvalidationTopic.USER_SESSION, str(session_id))
 
         return None
 
@@ -51,6 +59,7 @@ class SqlalchemyUserSessionRepository(UserSessionRepositoryInterface):
         query = delete(UserSessionModel).where(UserSessionModel.user_id == user_id)
 
         await self.session.execute(query)
+        await notify_invalidation(self.session, InvalidationTopic.USER, str(user_id))
 
         return None
 
@@ -1,8 +1,31 @@
+import os
 from dataclasses import dataclass
+from enum import Enum
 
 from helpers import get_env_var
 
 
+class AuthMode(str, Enum):
+    SESSION = 'session'
+    """Сессии хранятся в базе, в cookie передается идентификатор сессии"""
+    TOKEN = 'token'
+    """Короткоживущие access токены проверяются локально, refresh токены хранятся в базе"""
+
+
+class OrderCreationMode(str, Enum):
+    SYNC = 'sync'
+    """Ответ на создание заказа возвращается после получения ссылки на оплату от банка"""
+    ASYNC = 'async'
+    """Заказ принимается сразу, ссылка на оплату создается фоновыми обработчиками"""
+
+
+class WebsocketBroker(str, Enum):
+    LOCAL = 'local'
+    """Сообщения доставляются только соединениям текущего процесса"""
+    POSTGRES = 'postgres'
+    """Сообщения рассылаются всем процессам через Postgres NOTIFY"""
+
+
 @dataclass(frozen=True)
 class TochkaBankSettings:
     TOKEN: str
@@ -10,6 +33,18 @@ class TochkaBankSettings:
     ALGORITHM: str
     ACQUIRING_URL: str
     ACQUIRING_API_VERSION: str
+    HTTP_LIMIT: int
+    HTTP_LIMIT_PER_HOST: int
+    HTTP_KEEPALIVE_SECONDS: int
+    HTTP_DNS_CACHE_SECONDS: int
+    HTTP_CONNECT_TIMEOUT_SECONDS: float
+    HTTP_TIMEOUT_SECONDS: float
+    MAX_CONCURRENCY: int
+    ACQUIRE_TIMEOUT_SECONDS: float
+    RETRY_ATTEMPTS: int
+    RETRY_BACKOFF_SECONDS: float
+    BREAKER_FAILURE_THRESHOLD: int
+    BREAKER_RECOVERY_SECONDS: float
 
     @staticmethod
     def load_from_env() -> 'TochkaBankSettings':
@@ -19,6 +54,18 @@ class TochkaBankSettings:
             ALGORITHM=get_env_var('ACQUIRING_ALGORITHM', str, default='RS256'),
             ACQUIRING_URL=get_env_var('ACQUIRING_URL', str, default='https://enter.tochka.com/sandbox/v2'),
             ACQUIRING_API_VERSION=get_env_var('ACQUIRING_API_VERSION', str, default='v1.0'),
+            HTTP_LIMIT=get_env_var('ACQUIRING_HTTP_LIMIT', int, default=100),
+            HTTP_LIMIT_PER_HOST=get_env_var('ACQUIRING_HTTP_LIMIT_PER_HOST', int, default=20),
+            HTTP_KEEPALIVE_SECONDS=get_env_var('ACQUIRING_HTTP_KEEPALIVE_SECONDS', int, default=30),
+            HTTP_DNS_CACHE_SECONDS=get_env_var('ACQUIRING_HTTP_DNS_CACHE_SECONDS', int, default=300),
+            HTTP_CONNECT_TIMEOUT_SECONDS=get_env_var('ACQUIRING_HTTP_CONNECT_TIMEOUT_SECONDS', float, default=5.0),
+            HTTP_TIMEOUT_SECONDS=get_env_var('ACQUIRING_HTTP_TIMEOUT_SECONDS', float, default=15.0),
+            MAX_CONCURRENCY=get_env_var('ACQUIRING_MAX_CONCURRENCY', int, default=20),
+            ACQUIRE_TIMEOUT_SECONDS=get_env_var('ACQUIRING_ACQUIRE_TIMEOUT_SECONDS', float, default=1.0),
+            RETRY_ATTEMPTS=get_env_var('ACQUIRING_RETRY_ATTEMPTS', int, default=3),
+            RETRY_BACKOFF_SECONDS=get_env_var('ACQUIRING_RETRY_BACKOFF_SECONDS', float, default=0.2),
+            BREAKER_FAILURE_THRESHOLD=get_env_var('ACQUIRING_BREAKER_FAILURE_THRESHOLD', int, default=5),
+            BREAKER_RECOVERY_SECONDS=get_env_var('ACQUIRING_BREAKER_RECOVERY_SECONDS', float, default=30.0),
         )
 
 
@@ -40,6 +87,11 @@ class DatabaseSettings:
             self.POSTGRES_DB,
         )
 
+    @property
+    def DSN(self) -> str:
+        """Адрес для подключения напрямую через asyncpg"""
+        return self.DB_URL.replace('postgresql+asyncpg://', 'postgresql://', 1)
+
     @staticmethod
     def load_from_env() -> 'DatabaseSettings':
         return DatabaseSettings(
@@ -76,6 +128,91 @@ class JwtSettings:
         )
 
 
+@dataclass(frozen=True)
+class PasswordHasherSettings:
+    MAX_WORKERS: int
+    MAX_QUEUE_SIZE: int
+
+    @staticmethod
+    def load_from_env() -> 'PasswordHasherSettings':
+        return PasswordHasherSettings(
+            MAX_WORKERS=get_env_var('PASSWORD_HASHER_MAX_WORKERS', int, default=min(4, os.cpu_count() or 1)),
+            MAX_QUEUE_SIZE=get_env_var('PASSWORD_HASHER_MAX_QUEUE_SIZE', int, default=64),
+        )
+
+
+@dataclass(frozen=True)
+class OutboxSettings:
+    BATCH_SIZE: int
+    POLL_INTERVAL_SECONDS: float
+    MAX_ATTEMPTS: int
+    RETRY_BACKOFF_SECONDS: int
+    HANDLER_TIMEOUT_SECONDS: float
+    LEASE_SECONDS: int
+
+    @staticmethod
+    def load_from_env() -> 'OutboxSettings':
+        return OutboxSettings(
+            BATCH_SIZE=get_env_var('OUTBOX_BATCH_SIZE', int, default=50),
+            POLL_INTERVAL_SECONDS=get_env_var('OUTBOX_POLL_INTERVAL_SECONDS', float, default=1.0),
+            MAX_ATTEMPTS=get_env_var('OUTBOX_MAX_ATTEMPTS', int, default=5),
+            RETRY_BACKOFF_SECONDS=get_env_var('OUTBOX_RETRY_BACKOFF_SECONDS', int, default=10),
+            HANDLER_TIMEOUT_SECONDS=get_env_var('OUTBOX_HANDLER_TIMEOUT_SECONDS', float, default=90.0),
+            LEASE_SECONDS=get_env_var('OUTBOX_LEASE_SECONDS', int, default=300),
+        )
+
+
+@dataclass(frozen=True)
+class OrderSettings:
+    CREATION_MODE: OrderCreationMode
+    PAYMENT_WORKERS: int
+    PAYMENT_QUEUE_SIZE: int
+    PENDING_TIMEOUT_SECONDS: int
+    PENDING_SWEEP_INTERVAL_SECONDS: float
+    IDEMPOTENCY_KEY_TTL_SECONDS: int
+    IDEMPOTENCY_IN_FLIGHT_MAX_SIZE: int
+
+    @staticmethod
+    def load_from_env() -> 'OrderSettings':
+        return OrderSettings(
+            CREATION_MODE=get_env_var('ORDER_CREATION_MODE', OrderCreationMode, default=OrderCreationMode.SYNC),
+            PAYMENT_WORKERS=get_env_var('ORDER_PAYMENT_WORKERS', int, default=4),
+            PAYMENT_QUEUE_SIZE=get_env_var('ORDER_PAYMENT_QUEUE_SIZE', int, default=500),
+            PENDING_TIMEOUT_SECONDS=get_env_var('ORDER_PENDING_TIMEOUT_SECONDS', int, default=600),
+            PENDING_SWEEP_INTERVAL_SECONDS=get_env_var('ORDER_PENDING_SWEEP_INTERVAL_SECONDS', float, default=60.0),
+            IDEMPOTENCY_KEY_TTL_SECONDS=get_env_var('ORDER_IDEMPOTENCY_KEY_TTL_SECONDS', int, default=86400),
+            IDEMPOTENCY_IN_FLIGHT_MAX_SIZE=get_env_var('ORDER_IDEMPOTENCY_IN_FLIGHT_MAX_SIZE', int, default=10000),
+        )
+
+
+@dataclass(frozen=True)
+class WebsocketSettings:
+    BROKER: WebsocketBroker
+    SEND_QUEUE_SIZE: int
+    SEND_BUFFER_SIZE: int
+    SEND_TIMEOUT_SECONDS: float
+    PING_INTERVAL_SECONDS: float
+    IDLE_TIMEOUT_SECONDS: float
+    MESSAGE_BATCH_SIZE: int
+    MESSAGE_FLUSH_INTERVAL_SECONDS: float
+    MESSAGE_QUEUE_SIZE: int
+
+    @staticmethod
+    def load_from_env() -> 'WebsocketSettings':
+        return WebsocketSettings(
+            BROKER=get_env_var('WS_BROKER', WebsocketBroker, default=WebsocketBroker.POSTGRES),
+            SEND_QUEUE_SIZE=get_env_var('WS_SEND_QUEUE_SIZE', int, default=64),
+            SEND_BUFFER_SIZE=get_env_var('WS_SEND_BUFFER_SIZE', int, default=1024 * 1024),
+            SEND_TIMEOUT_SECONDS=get_env_var('WS_SEND_TIMEOUT_SECONDS', float, default=5.0),
+            PING_INTERVAL_SECONDS=get_env_var('WS_PING_INTERVAL_SECONDS', float, default=20.0),
+            # 0 отключает закрытие неактивных соединений, полуоткрытые соединения закрывает uvicorn по ping кадрам
+            IDLE_TIMEOUT_SECONDS=get_env_var('WS_IDLE_TIMEOUT_SECONDS', float, default=0.0),
+            MESSAGE_BATCH_SIZE=get_env_var('WS_MESSAGE_BATCH_SIZE', int, default=100),
+            MESSAGE_FLUSH_INTERVAL_SECONDS=get_env_var('WS_MESSAGE_FLUSH_INTERVAL_SECONDS', float, default=0.02),
+            MESSAGE_QUEUE_SIZE=get_env_var('WS_MESSAGE_QUEUE_SIZE', int, default=1000),
+        )
+
+
 @dataclass(frozen=True)
 class SmtpSettings:
     HOST: str
@@ -85,6 +222,14 @@ class SmtpSettings:
     FROM_EMAIL: str
     SENDER_NAME: str
     ADMINISTRATOR_EMAIL: str
+    POOL_SIZE: int
+    QUEUE_SIZE: int
+    BATCH_SIZE: int
+    MAX_ATTEMPTS: int
+    CONNECT_ATTEMPTS: int
+    TIMEOUT_SECONDS: int
+    DELIVER_TIMEOUT_SECONDS: int
+    IDLE_TIMEOUT_SECONDS: int
 
     @staticmethod
     def load_from_env() -> 'SmtpSettings':
@@ -96,6 +241,39 @@ class SmtpSettings:
             FROM_EMAIL=get_env_var('SMTP_EMAIL', str),
             SENDER_NAME=get_env_var('SMTP_SENDER_NAME', str),
             ADMINISTRATOR_EMAIL=get_env_var('SMTP_ADMINISTRATOR_EMAIL', str),
+            POOL_SIZE=get_env_var('SMTP_POOL_SIZE', int, default=2),
+            QUEUE_SIZE=get_env_var('SMTP_QUEUE_SIZE', int, default=1000),
+            BATCH_SIZE=get_env_var('SMTP_BATCH_SIZE', int, default=20),
+            MAX_ATTEMPTS=get_env_var('SMTP_MAX_ATTEMPTS', int, default=3),
+            CONNECT_ATTEMPTS=get_env_var('SMTP_CONNECT_ATTEMPTS', int, default=5),
+            TIMEOUT_SECONDS=get_env_var('SMTP_TIMEOUT_SECONDS', int, default=30),
+            DELIVER_TIMEOUT_SECONDS=get_env_var('SMTP_DELIVER_TIMEOUT_SECONDS', int, default=60),
+            IDLE_TIMEOUT_SECONDS=get_env_var('SMTP_IDLE_TIMEOUT_SECONDS', int, default=60),
+        )
+
+
+@dataclass(frozen=True)
+class CacheSettings:
+    PRODUCT_CACHE_TTL_SECONDS: int
+    PRODUCT_CACHE_MAX_SIZE: int
+    PRODUCT_PAGES_CACHE_MAX_SIZE: int
+    CATALOG_MAX_AGE_SECONDS: int
+    SESSION_CACHE_TTL_SECONDS: int
+    SESSION_CACHE_MAX_SIZE: int
+    ACCESS_TOKEN_CACHE_MAX_SIZE: int
+    ORDER_QUOTE_CACHE_MAX_SIZE: int
+
+    @staticmethod
+    def load_from_env() -> 'CacheSettings':
+        return CacheSettings(
+            PRODUCT_CACHE_TTL_SECONDS=get_env_var('PRODUCT_CACHE_TTL_SECONDS', int, default=300),
+            PRODUCT_CACHE_MAX_SIZE=get_env_var('PRODUCT_CACHE_MAX_SIZE', int, default=10000),
+            PRODUCT_PAGES_CACHE_MAX_SIZE=get_env_var('PRODUCT_PAGES_CACHE_MAX_SIZE', int, default=1000),
+            CATALOG_MAX_AGE_SECONDS=get_env_var('CATALOG_MAX_AGE_SECONDS', int, default=5),
+            SESSION_CACHE_TTL_SECONDS=get_env_var('SESSION_CACHE_TTL_SECONDS', int, default=60),
+            SESSION_CACHE_MAX_SIZE=get_env_var('SESSION_CACHE_MAX_SIZE', int, default=10000),
+            ACCESS_TOKEN_CACHE_MAX_SIZE=get_env_var('ACCESS_TOKEN_CACHE_MAX_SIZE', int, default=1024),
+            ORDER_QUOTE_CACHE_MAX_SIZE=get_env_var('ORDER_QUOTE_CACHE_MAX_SIZE', int, default=10000),
         )
 
 
@@ -103,10 +281,16 @@ class SmtpSettings:
 class Settings:
     db: DatabaseSettings
     jwt: JwtSettings
+    password_hasher: PasswordHasherSettings
     acquiring: TochkaBankSettings
     smtp: SmtpSettings
+    outbox: OutboxSettings
+    cache: CacheSettings
+    orders: OrderSettings
+    websockets: WebsocketSettings
 
     SESSION_MAX_AGE_DAYS: int
+    AUTH_MODE: AuthMode
 
     DOMAIN_URL: str
 
@@ -115,9 +299,15 @@ class Settings:
         return Settings(
             db=DatabaseSettings.load_from_env(),
             jwt=JwtSettings.load_from_env(),
+            password_hasher=PasswordHasherSettings.load_from_env(),
             acquiring=TochkaBankSettings.load_from_env(),
             smtp=SmtpSettings.load_from_env(),
+            outbox=OutboxSettings.load_from_env(),
+            cache=CacheSettings.load_from_env(),
+            orders=OrderSettings.load_from_env(),
+            websockets=WebsocketSettings.load_from_env(),
             SESSION_MAX_AGE_DAYS=get_env_var('SESSION_MAX_AGE_DAYS', int, default=30),
+            AUTH_MODE=get_env_var('AUTH_MODE', AuthMode, default=AuthMode.SESSION),
             DOMAIN_URL=get_env_var('DOMAIN_URL', str, default='https://localhost'),
         )
 
@@ -0,0 +1,98 @@
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any
+from uuid import UUID
+
+from src.application.chats.interface import (
+    WebsocketBrokerInterface,
+    WebsocketMessageHandler,
+)
+from src.infrastructure.persistence.postgresql.listener import (
+    MAX_NOTIFY_PAYLOAD_BYTES,
+    PostgresListener,
+)
+
+logger = logging.getLogger()
+
+WEBSOCKET_CHANNEL = 'websocket_messages'
+
+
+@dataclass
+class WebsocketBrokerStats:
+    published: int = 0
+    received: int = 0
+    local: int = 0
+    oversized: int = 0
+
+
+class LocalWebsocketBroker(WebsocketBrokerInterface):
+    """Доставляет сообщения только в текущем процессе, подходит для одного воркера"""
+
+    def __init__(self) -> None:
+        self._handlers: list[WebsocketMessageHandler] = []
+        self._stats = WebsocketBrokerStats()
+
+    def subscribe(self, handler: WebsocketMessageHandler) -> None:
+        self._handlers.append(handler)
+
+    async def publish(self, key: UUID, message: str) -> None:
+        self._stats.published += 1
+        self._dispatch(key, message)
+
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    def stats(self) -> dict[str, Any]:
+        return asdict(self._stats)
+
+    def _dispatch(self, key: UUID, message: str) -> None:
+        for handler in self._handlers:
+            try:
+                handler(key, message)
+            except Exception as exc:
+                logger.error('Websocket message handler failed', exc_info=exc)
+
+
+class PostgresWebsocketBroker(PostgresListener, LocalWebsocketBroker):
+    """
+    Рассылает сообщения через Postgres NOTIFY, каждый процесс доставляет их своим соединениям.
+    Сообщение, которое не помещается в NOTIFY, или отправленное без соединения доставляется только локально
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str = WEBSOCKET_CHANNEL,
+        min_backoff: float = 0.5,
+        max_backoff: float = 30,
+    ) -> None:
+        PostgresListener.__init__(self, dsn=dsn, channel=channel, min_backoff=min_backoff, max_backoff=max_backoff)
+        LocalWebsocketBroker.__init__(self)
+
+    async def publish(self, key: UUID, message: str) -> None:
+        payload = f'{key}:{message}'
+        if len(payload.encode()) > MAX_NOTIFY_PAYLOAD_BYTES:
+            self._stats.oversized += 1
+            logger.error('Websocket message is too large for NOTIFY, it is delivered locally', extra={'key': key})
+            self._dispatch(key, message)
+            return None
+
+        if not await self._notify(payload):
+            self._stats.local += 1
+            logger.warning('Websocket broker is not connected, message is delivered locally', extra={'key': key})
+            self._dispatch(key, message)
+            return None
+
+        self._stats.published += 1
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        key, _, message = payload.partition(':')
+        try:
+            parsed_key = UUID(key)
+        except ValueError:
+            logger.warning('Invalid websocket message', extra={'payload': payload[:100]})
+            return None
+
+        self._stats.received += 1
+        self._dispatch(parsed_key, message)
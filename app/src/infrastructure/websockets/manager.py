@@ -1,44 +1,267 @@
 import asyncio
 import logging
+import time
+from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
 
+import orjson
 from fastapi import WebSocket
-from src.application.chats.interface import WebsocketManagerInterface
+from src.application.chats.interface import (
+    WebsocketBrokerInterface,
+    WebsocketManagerInterface,
+)
+from src.infrastructure.websockets.broker import LocalWebsocketBroker
 
 logger = logging.getLogger()
 
+CLOSE_GOING_AWAY = 1001
+CLOSE_TRY_AGAIN_LATER = 1013
+
+PING_MESSAGE = '{"type":"ping"}'
+
+
+def dump_message(data: dict[str, Any]) -> str:
+    return orjson.dumps(data).decode()
+
+
+class WebsocketConnection:
+    """Соединение и его очередь исходящих сообщений, очередь разбирает отдельная задача"""
+
+    __slots__ = ('websocket', 'queue', 'writer', 'buffered', 'last_seen', 'reap_idle')
+
+    def __init__(self, websocket: WebSocket, queue_size: int, reap_idle: bool = True) -> None:
+        self.websocket = websocket
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self.writer: asyncio.Task[None] | None = None
+        self.buffered = 0
+        """Суммарная длина неотправленных сообщений"""
+        self.last_seen = time.monotonic()
+        self.reap_idle = reap_idle
+
+
+@dataclass
+class WebsocketStats:
+    sent: int = 0
+    evicted: int = 0
+    failed: int = 0
+    reaped: int = 0
+    pings: int = 0
+
 
 class WebsocketManager(WebsocketManagerInterface):
+    """
+    Рассылает сообщения соединениям, подключенным по ключу чата или заказа.
+    Сообщение сериализуется один раз и кладется в очередь каждого соединения без ожидания отправки.
+    Соединение с переполненной очередью или не успевшее отправить сообщение за `send_timeout` закрывается,
+    поэтому медленный клиент не задерживает рассылку остальным.
+    Рассылки идут через брокер, чтобы сообщение получили соединения всех воркеров.
+    Раз в `ping_interval` соединениям отправляется ping. Полуоткрытые TCP соединения обнаруживает uvicorn
+    по ping кадрам протокола (`--ws-ping-interval`/`--ws-ping-timeout`). Если задан `idle_timeout`,
+    соединения без входящих сообщений дольше него закрываются, тогда клиенты обязаны отвечать на ping
+    (например, `{"type":"pong"}`). Соединения, принятые с `reap_idle=False`, по неактивности не закрываются
+    """
 
-    async def accept_connection(self, websocket: WebSocket, key: UUID) -> None:
-        await websocket.accept()
-        if key not in self.connections_map:
-            self.connections_map[key] = set()
-        async with asyncio.Lock():
-            self.connections_map[key].add(websocket)
-            await websocket.send_json(
-                {
-                    "message": "Connected",
-                },
-            )
+    def __init__(
+        self,
+        broker: WebsocketBrokerInterface | None = None,
+        send_queue_size: int = 64,
+        send_buffer_size: int = 1024 * 1024,
+        send_timeout: float = 5,
+        ping_interval: float = 20,
+        idle_timeout: float = 0,
+    ) -> None:
+        self.broker = broker or LocalWebsocketBroker()
+        self.send_queue_size = send_queue_size
+        self.send_buffer_size = send_buffer_size
+        self.send_timeout = send_timeout
+        self.ping_interval = ping_interval
+        self.idle_timeout = idle_timeout
+        self._heartbeat: asyncio.Task[None] | None = None
+        self.connections_map: dict[UUID, dict[WebSocket, WebsocketConnection]] = {}
+        self._locks: dict[UUID, asyncio.Lock] = {}
+        self._closing: set[asyncio.Task[None]] = set()
+        self._stats = WebsocketStats()
+        self.broker.subscribe(self._deliver)
+
+    async def accept_connection(self, websocket: WebSocket, key: UUID, reap_idle: bool = True) -> None:
+        # Подключение ждет, пока для этого ключа выполняется disconnect_all
+        try:
+            async with self._lock(key):
+                await websocket.accept()
+                connection = WebsocketConnection(
+                    websocket=websocket,
+                    queue_size=self.send_queue_size,
+                    reap_idle=reap_idle,
+                )
+                connection.writer = asyncio.create_task(self._write(key, connection))
+                self.connections_map.setdefault(key, {})[websocket] = connection
+                self._enqueue(key, connection, dump_message({'message': 'Connected'}))
+        finally:
+            self._forget_lock(key)
 
     async def remove_connection(self, websocket: WebSocket, key: UUID) -> None:
-        async with asyncio.Lock():
-            self.connections_map[key].remove(websocket)
+        connection = self.connections_map.get(key, {}).get(websocket)
+        if connection is None or not self._discard(key, connection):
+            return None
+
+        # После удаления соединения в него можно писать напрямую, поэтому задача отправки должна завершиться
+        self._cancel_writer(connection)
+        if connection.writer is not None:
+            await asyncio.gather(connection.writer, return_exceptions=True)
+
+    def touch(self, websocket: WebSocket, key: UUID) -> None:
+        connection = self.connections_map.get(key, {}).get(websocket)
+        if connection is not None:
+            connection.last_seen = time.monotonic()
+
+    async def send(self, websocket: WebSocket, key: UUID, data: dict[str, Any]) -> None:
+        connection = self.connections_map.get(key, {}).get(websocket)
+        if connection is not None:
+            self._enqueue(key, connection, dump_message(data))
 
     async def send_all(self, key: UUID, data: dict[str, Any]) -> None:
-        if key not in self.connections_map:
-            return None
-        async with asyncio.Lock():
-            for websocket in self.connections_map[key]:
-                await websocket.send_json(data)
+        await self.broker.publish(key, dump_message(data))
 
     async def disconnect_all(self, key: UUID) -> None:
-        for websocket in self.connections_map[key]:
-            await websocket.send_json(
-                {
-                    "message": "Connection closed",
-                },
+        async with self._lock(key):
+            connections = self.connections_map.pop(key, {})
+            for connection in connections.values():
+                self._cancel_writer(connection)
+
+            message = dump_message({'message': 'Connection closed'})
+            await asyncio.gather(
+                *(self._close(connection.websocket, message=message) for connection in connections.values()),
             )
-            await websocket.close()
+        self._forget_lock(key)
+
+    async def start(self) -> None:
+        if self._heartbeat is None:
+            self._heartbeat = asyncio.create_task(self._run_heartbeat())
+
+    async def stop(self) -> None:
+        if self._heartbeat is None:
+            return None
+        self._heartbeat.cancel()
+        await asyncio.gather(self._heartbeat, return_exceptions=True)
+        self._heartbeat = None
+
+    def stats(self) -> dict[str, Any]:
+        connections = [
+            connection for connections in self.connections_map.values() for connection in connections.values()
+        ]
+        return {
+            'keys': len(self.connections_map),
+            'connections': len(connections),
+            'buffered_messages': sum(connection.queue.qsize() for connection in connections),
+            'buffered_size': sum(connection.buffered for connection in connections),
+            'sent': self._stats.sent,
+            'evicted': self._stats.evicted,
+            'failed': self._stats.failed,
+            'reaped': self._stats.reaped,
+            'pings': self._stats.pings,
+            'broker': self.broker.stats(),
+        }
+
+    def _deliver(self, key: UUID, message: str) -> None:
+        connections = self.connections_map.get(key)
+        if not connections:
+            return None
+
+        for connection in list(connections.values()):
+            self._enqueue(key, connection, message)
+
+    async def _run_heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            try:
+                self._check_connections()
+            except Exception as exc:
+                logger.error(f'Websocket heartbeat failed: {exc!r}')
+
+    def _check_connections(self) -> None:
+        now = time.monotonic()
+        for key, connections in list(self.connections_map.items()):
+            for connection in list(connections.values()):
+                idle = now - connection.last_seen > self.idle_timeout
+                if self.idle_timeout and connection.reap_idle and idle:
+                    self._stats.reaped += 1
+                    logger.info('Idle websocket is disconnected', extra={'key': key})
+                    self._evict(key, connection, code=CLOSE_GOING_AWAY)
+                else:
+                    self._stats.pings += 1
+                    self._enqueue(key, connection, PING_MESSAGE)
+
+    async def _write(self, key: UUID, connection: WebsocketConnection) -> None:
+        while True:
+            message = await connection.queue.get()
+            try:
+                await asyncio.wait_for(connection.websocket.send_text(message), timeout=self.send_timeout)
+            except Exception as exc:
+                self._stats.failed += 1
+                logger.warning(f'Websocket send failed: {exc!r}', extra={'key': key})
+                self._evict(key, connection)
+                return None
+            finally:
+                connection.buffered -= len(message)
+            self._stats.sent += 1
+
+    def _enqueue(self, key: UUID, connection: WebsocketConnection, message: str) -> None:
+        # Длина ограничивается вместе с числом сообщений: сообщение чата бывает в сотни раз длиннее ping
+        if connection.buffered + len(message) > self.send_buffer_size:
+            self._stats.evicted += 1
+            logger.warning('Websocket send buffer is full', extra={'key': key})
+            self._evict(key, connection)
+            return None
+        try:
+            connection.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self._stats.evicted += 1
+            logger.warning('Slow websocket consumer is disconnected', extra={'key': key})
+            self._evict(key, connection)
+            return None
+        connection.buffered += len(message)
+
+    def _evict(self, key: UUID, connection: WebsocketConnection, code: int = CLOSE_TRY_AGAIN_LATER) -> None:
+        if not self._discard(key, connection):
+            return None
+        self._cancel_writer(connection)
+        task = asyncio.create_task(self._close(connection.websocket, code=code))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def _discard(self, key: UUID, connection: WebsocketConnection) -> bool:
+        connections = self.connections_map.get(key)
+        if connections is None or connections.get(connection.websocket) is not connection:
+            return False
+
+        del connections[connection.websocket]
+        if not connections:
+            del self.connections_map[key]
+            self._forget_lock(key)
+        return True
+
+    @staticmethod
+    def _cancel_writer(connection: WebsocketConnection) -> None:
+        if connection.writer is not None and connection.writer is not asyncio.current_task():
+            connection.writer.cancel()
+
+    async def _close(self, websocket: WebSocket, code: int = 1000, message: str | None = None) -> None:
+        try:
+            async with asyncio.timeout(self.send_timeout):
+                if message is not None:
+                    await websocket.send_text(message)
+                await websocket.close(code=code)
+        except Exception as exc:
+            logger.debug(f'Websocket close failed: {exc!r}')
+
+    def _lock(self, key: UUID) -> asyncio.Lock:
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        return lock
+
+    def _forget_lock(self, key: UUID) -> None:
+        lock = self._locks.get(key)
+        if lock is not None and not lock.locked() and key not in self.connections_map:
+            del self._locks[key]
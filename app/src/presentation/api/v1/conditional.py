@@ -0,0 +1,57 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response
+from src.domain.products.entities import CatalogVersion
+from src.infrastructure.settings import settings
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == '*':
+        return True
+    # Слабое сравнение: префикс W/ не учитывается
+    candidates = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+    return etag.removeprefix('W/') in candidates
+
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return last_modified.replace(microsecond=0) <= since
+
+
+def catalog_conditional_get(
+    request: Request,
+    response: Response,
+    catalog_version: CatalogVersion,
+) -> Response | None:
+    """
+    Проставляет заголовки валидации по версии каталога из базы, поэтому они совпадают у всех воркеров.
+    Возвращает ответ 304, если у клиента актуальная версия, иначе `None`
+    """
+    etag = f'W/"{catalog_version.version}"'
+    last_modified = catalog_version.updated_at.astimezone(timezone.utc)
+    headers = {
+        'ETag': etag,
+        'Last-Modified': format_datetime(last_modified, usegmt=True),
+        'Cache-Control': f'public, max-age={settings.cache.CATALOG_MAX_AGE_SECONDS}',
+    }
+
+    if_none_match = request.headers.get('if-none-match')
+    if_modified_since = request.headers.get('if-modified-since')
+
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, etag)
+    elif if_modified_since is not None:
+        not_modified = _not_modified_since(if_modified_since, last_modified)
+    else:
+        not_modified = False
+
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+
+    return None
@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from .views import auth, categories, chats, orders, products, users
+from .views import auth, categories, chats, metrics, orders, products, users
 
 api_router = APIRouter()
 api_router.include_router(auth.router)
@@ -9,3 +9,4 @@ api_router.include_router(orders.router)
 api_router.include_router(products.router)
 api_router.include_router(chats.router)
 api_router.include_router(categories.router)
+api_router.include_router(metrics.router)
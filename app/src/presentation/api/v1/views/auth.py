@@ -8,13 +8,23 @@ from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import EmailStr
 from src.application.auth.commands import (
     LoginCommand,
+    LogoutWithJWTCommand,
     LogoutWithSessionCommand,
+    RefreshTokenCommand,
     RegisterCommand,
     ResetPasswordCommand,
 )
-from src.application.auth.exceptions import NotAuthorizedException
+from src.application.auth.dto import Token
+from src.application.auth.exceptions import (
+    NotAuthorizedException,
+    TokenExpiredException,
+    WrongTokenTypeException,
+)
 from src.application.auth.usecases import (
+    LoginWithJWTUseCase,
+    LogoutWithJWTUseCase,
     PasswordRecoveryUseCase,
+    RefreshTokenUseCase,
     RegisterUseCase,
     ResetPasswordUseCase,
 )
@@ -28,7 +38,12 @@ from src.domain.users.exceptions import (
     UserAlreadyExistsException,
     UserInvalidCredentialsException,
 )
-from src.presentation.dependencies.auth import get_current_session
+from src.infrastructure.settings import AuthMode, settings
+from src.presentation.dependencies.auth import (
+    get_access_token,
+    get_current_session,
+    get_refresh_token,
+)
 
 router = APIRouter(tags=['Auth'], prefix='/auth', route_class=DishkaRoute)
 
@@ -47,51 +62,59 @@ async def register(
     return APIResponse()
 
 
-# @router.post(
-#     "/login",
-#     summary="Аутентифицирует пользователя и устанавливает access и refresh токены",
-#     responses={
-#         200: {"model": APIResponse[UserOut]},
-#         400: {"model": UserInvalidCredentialsException},
-#     },
-# )
-# async def login(
-#     login_interactor: FromDishka[LoginWithJWTUseCase],
-#     request: Request,
-#     response: Response,
-#     credentials: Annotated[OAuth2PasswordRequestForm, Depends()],
-# ) -> APIResponse[UserOut]:
-#     user_agent = request.headers.get("user-agent")
-#     if not user_agent:
-#         user_agent = "none"
-#     command = LoginCommand(
-#         password=credentials.password,
-#         username=credentials.username,
-#         user_agent=user_agent,
-#     )
-#     user, token = await login_interactor.execute(command=command)
-#     response.set_cookie(
-#         "access_token",
-#         value=token.type + token.access_token,
-#         max_age=token.access_max_age,
-#         httponly=True,
-#         # secure=True,
-#     )
-#     response.set_cookie(
-#         "refresh_token",
-#         value=token.type + token.refresh_token,
-#         max_age=token.refresh_max_age,
-#         httponly=True,
-#         # secure=True,
-#     )
-#     return APIResponse(data=user)
+async def login_with_token(
+    login_interactor: FromDishka[LoginWithJWTUseCase],
+    request: Request,
+    response: Response,
+    credentials: Annotated[OAuth2PasswordRequestForm, Depends()],
+) -> APIResponse[UserOut]:
+    user_agent = request.headers.get('user-agent')
+    if not user_agent:
+        user_agent = 'none'
+
+    command = LoginCommand(
+        password=credentials.password,
+        username=credentials.username,
+        user_agent=user_agent,
+    )
+
+    user, token = await login_interactor.execute(command=command)
+
+    _set_token_cookies(response=response, token=token)
+
+    return APIResponse(data=user)
+
+
+async def refresh(
+    response: Response,
+    refresh_interactor: FromDishka[RefreshTokenUseCase],
+    refresh_token: Annotated[str, Depends(get_refresh_token)],
+) -> APIResponse[None]:
+    command = RefreshTokenCommand(refresh_token=refresh_token)
+
+    token = await refresh_interactor.execute(command=command)
+
+    _set_token_cookies(response=response, token=token)
+
+    return APIResponse()
+
+
+async def logout_with_token(
+    response: Response,
+    logout_interactor: FromDishka[LogoutWithJWTUseCase],
+    refresh_token: Annotated[str, Depends(get_refresh_token)],
+    access_token: Annotated[str | None, Depends(get_access_token)],
+) -> APIResponse[None]:
+    command = LogoutWithJWTCommand(refresh_token=refresh_token, access_token=access_token)
+
+    await logout_interactor.execute(command=command)
+
+    response.delete_cookie('access_token')
+    response.delete_cookie('refresh_token')
+
+    return APIResponse()
 
 
-@router.post(
-    '/login',
-    summary='Аутентифицирует пользователя с помощью сессии',
-    responses={200: {'model': APIResponse[UserOut]}, 400: {'model': UserInvalidCredentialsException}},
-)
 async def login(
     login_interactor: FromDishka[LoginWithSessionUseCase],
     request: Request,
@@ -121,72 +144,6 @@ async def login(
     return APIResponse(data=user)
 
 
-# @router.post(
-#     "/refresh",
-#     summary="Устанавливает новые access и refresh токены",
-#     responses={
-#         200: {"model": APIResponse[None]},
-#         400: {"model": WrongTokenTypeException},
-#         401: {"model": TokenExpiredException},
-#     },
-# )
-# async def refresh(
-#     response: Response,
-#     refresh_interactor: FromDishka[RefreshTokenUseCase],
-#     refresh_token: Annotated[str, Depends(get_refresh_token)],
-# ) -> APIResponse[None]:
-#     command = RefreshTokenCommand(refresh_token=refresh_token)
-
-#     token = await refresh_interactor.execute(command=command)
-
-#     response.set_cookie(
-#         "access_token",
-#         value=token.type + token.access_token,
-#         max_age=token.access_max_age,
-#         httponly=True,
-#         # secure=True,
-#     )
-
-#     response.set_cookie(
-#         "refresh_token",
-#         value=token.type + token.refresh_token,
-#         max_age=token.refresh_max_age,
-#         httponly=True,
-#         # samesite="none"
-#         # secure=True,
-#     )
-
-#     return APIResponse()
-
-
-# @router.post(
-#     "/logout",
-#     summary="Logout",
-#     responses={
-#         200: {"model": APIResponse[None]},
-#         401: {"model": NotAuthorizedException},
-#     },
-# )
-# async def logout(
-#     response: Response,
-#     logout_interactor: FromDishka[LogoutWithJWTUseCase],
-#     refresh_token: Annotated[str, Depends(get_refresh_token)],
-# ) -> APIResponse[None]:
-#     command = LogoutWithJWTCommand(refresh_token=refresh_token)
-#     await logout_interactor.execute(command=command)
-#     response.delete_cookie("access_token")
-#     response.delete_cookie("refresh_token")
-#     return APIResponse()
-
-
-@router.post(
-    '/logout',
-    summary='Logout',
-    responses={
-        200: {'model': APIResponse[None]},
-        401: {'model': NotAuthorizedException},
-    },
-)
 async def logout(
     response: Response,
     logout_interactor: FromDishka[LogoutWithSessionUseCase],
@@ -201,6 +158,66 @@ async def logout(
     return APIResponse()
 
 
+def _set_token_cookies(response: Response, token: Token) -> None:
+    response.set_cookie(
+        'access_token',
+        value=token.type + token.access_token,
+        max_age=token.access_max_age,
+        httponly=True,
+        # secure=True,
+    )
+    response.set_cookie(
+        'refresh_token',
+        value=token.type + token.refresh_token,
+        max_age=token.refresh_max_age,
+        httponly=True,
+        # secure=True,
+    )
+
+
+if settings.AUTH_MODE == AuthMode.TOKEN:
+    router.add_api_route(
+        '/login',
+        login_with_token,
+        methods=['POST'],
+        summary='Аутентифицирует пользователя и устанавливает access и refresh токены',
+        responses={200: {'model': APIResponse[UserOut]}, 400: {'model': UserInvalidCredentialsException}},
+    )
+    router.add_api_route(
+        '/refresh',
+        refresh,
+        methods=['POST'],
+        summary='Устанавливает новые access и refresh токены',
+        responses={
+            200: {'model': APIResponse[None]},
+            400: {'model': WrongTokenTypeException},
+            401: {'model': TokenExpiredException},
+        },
+    )
+    router.add_api_route(
+        '/logout',
+        logout_with_token,
+        methods=['POST'],
+        summary='Logout',
+        responses={200: {'model': APIResponse[None]}, 401: {'model': NotAuthorizedException}},
+    )
+else:
+    router.add_api_route(
+        '/login',
+        login,
+        methods=['POST'],
+        summary='Аутентифицирует пользователя с помощью сессии',
+        responses={200: {'model': APIResponse[UserOut]}, 400: {'model': UserInvalidCredentialsException}},
+    )
+    router.add_api_route(
+        '/logout',
+        logout,
+        methods=['POST'],
+        summary='Logout',
+        responses={200: {'model': APIResponse[None]}, 401: {'model': NotAuthorizedException}},
+    )
+
+
 @router.post(
     '/password-recovery/{email}',
     summary='Отправка письма для восстановления пароля через email',
@@ -228,7 +245,8 @@ async def reset_password(
     await reset_password_interactor.execute(command=command)
 
     response.delete_cookie('session_id')
-
     response.delete_cookie('session')
+    response.delete_cookie('access_token')
+    response.delete_cookie('refresh_token')
 
     return APIResponse()
@@ -1,12 +1,16 @@
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Request, Response, Security
 from src.application.common.response import APIResponse
 from src.application.products.commands import CreateCategoryCommand
 from src.application.products.usecases.create import CreateCategoryUseCase
 from src.application.products.usecases.delete import DeleteCategoryUseCase
-from src.application.products.usecases.get import GetCategoriesListUseCase
+from src.application.products.usecases.get import (
+    GetCatalogVersionUseCase,
+    GetCategoriesListUseCase,
+)
 from src.domain.products.entities import Category
 from src.domain.users.entities import UserRole
+from src.presentation.api.v1.conditional import catalog_conditional_get
 from src.presentation.dependencies.auth import get_current_user_data
 
 router = APIRouter(tags=['Categories'], prefix='/categories', route_class=DishkaRoute)
@@ -27,10 +31,17 @@ async def create_category(
 
 @router.get('', summary='Возвращает список категорий')
 async def get_categories(
+    request: Request,
+    response: Response,
     get_categories_list_interactor: FromDishka[GetCategoriesListUseCase],
+    get_catalog_version_interactor: FromDishka[GetCatalogVersionUseCase],
 ) -> APIResponse[list[Category]]:
-    response = await get_categories_list_interactor.execute()
-    return APIResponse(data=response)
+    catalog_version = await get_catalog_version_interactor.execute()
+    if not_modified := catalog_conditional_get(request, response, catalog_version):
+        return not_modified  # type: ignore
+
+    result = await get_categories_list_interactor.execute()
+    return APIResponse(data=result)
 
 
 @router.delete(
@@ -4,26 +4,47 @@ from uuid import UUID
 
 from dishka import AsyncContainer
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, Depends, Security, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, Query, Security, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
 from src.application.auth.dto import UserData
 from src.application.auth.exceptions import (
     NotAuthorizedException,
+    NotEnoughPermissionsException,
     TokenExpiredException,
 )
 from src.application.chats.commands import (
     CreateChatCommand,
     CreateMessageCommand,
+    GetChatMessagesCommand,
     GetChatsListCommand,
 )
-from src.application.chats.dto import ChatOut
-from src.application.chats.interface import WebsocketManagerInterface
+from src.application.chats.dto import ChatMessageJob, ChatMessagesOut, ChatOut
+from src.application.chats.frames import (
+    ReadFrame,
+    SendFrame,
+    TypingFrame,
+    make_error_frame,
+    make_read_frame,
+    make_typing_frame,
+    parse_chat_frame,
+)
+from src.application.chats.interface import (
+    ChatMessageQueueInterface,
+    WebsocketManagerInterface,
+)
 from src.application.chats.usecases.create import (
     CreateChatUseCase,
     CreateMessageUseCase,
 )
-from src.application.chats.usecases.get import GetChatsListUseCase, GetChatUseCase
+from src.application.chats.usecases.get import (
+    GetChatMessagesUseCase,
+    GetChatsListUseCase,
+    GetChatUseCase,
+)
 from src.application.common.pagination import ListPaginatedResponse, PaginationQuery
 from src.application.common.response import APIResponse
+from src.domain.chats.exceptions import ChatNotFoundException, MessageTooLongException
+from src.domain.common.exceptions.base import ApplicationException
 from src.domain.users.entities import UserRole
 from src.infrastructure.di.container import get_container
 from src.presentation.dependencies.auth import (
@@ -34,8 +55,8 @@ from src.presentation.dependencies.auth import (
 router = APIRouter(tags=['Chats'], prefix='/chats', route_class=DishkaRoute)
 
 
-def get_pagination(limit: int = 100, page: int = 0) -> PaginationQuery:
-    return PaginationQuery(page=page, limit=limit)
+def get_pagination(limit: int = 100, page: int = 0, cursor: str | None = None) -> PaginationQuery:
+    return PaginationQuery(page=page, limit=limit, cursor=cursor)
 
 
 def get_chats_list_command(
@@ -86,7 +107,32 @@ async def get_chat(
     return APIResponse(data=response)
 
 
-@router.post('/{chat_id}')
+@router.get(
+    '/{chat_id}/messages',
+    summary='Возвращает историю чата от новых сообщений к старым',
+    responses={403: {'model': NotEnoughPermissionsException}, 404: {'model': ChatNotFoundException}},
+)
+async def get_chat_messages(
+    chat_id: UUID,
+    get_chat_interactor: FromDishka[GetChatUseCase],
+    get_chat_messages_interactor: FromDishka[GetChatMessagesUseCase],
+    user_data: Annotated[UserData, Depends(get_current_user_data)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 50,
+    before: str | None = None,
+) -> APIResponse[ChatMessagesOut]:
+    # Историю читает владелец чата, менеджер или администратор
+    chat = await get_chat_interactor.execute(chat_id=chat_id)
+    if chat.owner_id != user_data.user_id and UserRole.MANAGER.value not in user_data.scopes:
+        raise NotEnoughPermissionsException
+
+    response = await get_chat_messages_interactor.execute(
+        command=GetChatMessagesCommand(chat_id=chat_id, limit=limit, before=before),
+    )
+
+    return APIResponse(data=response)
+
+
+@router.post('/{chat_id}', responses={400: {'model': MessageTooLongException}})
 async def create_message(
     command: CreateMessageCommand,
     chat_id: UUID,
@@ -104,6 +150,38 @@ async def create_message(
 logger = logging.getLogger()
 
 
+async def handle_chat_frame(
+    data: str,
+    websocket: WebSocket,
+    chat_id: UUID,
+    user_id: UUID,
+    websocket_manager: WebsocketManagerInterface,
+    message_queue: ChatMessageQueueInterface,
+) -> None:
+    try:
+        frame = parse_chat_frame(data)
+    except ValidationError:
+        await websocket_manager.send(websocket=websocket, key=chat_id, data=make_error_frame('Invalid frame'))
+        return None
+
+    if isinstance(frame, SendFrame):
+        try:
+            job = ChatMessageJob.create(
+                websocket=websocket,
+                client_id=frame.id,
+                chat_id=chat_id,
+                user_id=user_id,
+                content=frame.message,
+            )
+            message_queue.submit(job)
+        except ApplicationException as exc:
+            await websocket_manager.send(websocket=websocket, key=chat_id, data=make_error_frame(exc.message, frame.id))
+    elif isinstance(frame, TypingFrame):
+        await websocket_manager.send_all(key=chat_id, data=make_typing_frame(user_id))
+    elif isinstance(frame, ReadFrame):
+        await websocket_manager.send_all(key=chat_id, data=make_read_frame(user_id, frame.message_id))
+
+
 @router.websocket('/ws/{chat_id}')
 async def websocket_endpoint(
     websocket: WebSocket,
@@ -111,15 +189,30 @@ async def websocket_endpoint(
     container: Annotated[AsyncContainer, Depends(get_container)],
 ) -> None:
     websocket_manager = await container.get(WebsocketManagerInterface)
+    message_queue = await container.get(ChatMessageQueueInterface)
     await websocket_manager.accept_connection(websocket=websocket, key=chat_id)
 
     try:
-        await get_current_user_from_websocket(websocket=websocket, container=container)
+        # Пользователь и чат проверяются один раз при подключении, кадры дальше обрабатываются без запросов в базу
+        user_data = await get_current_user_from_websocket(websocket=websocket, container=container)
+        async with container() as request_container:
+            get_chat_interactor = await request_container.get(GetChatUseCase)
+            await get_chat_interactor.execute(chat_id=chat_id)
+
         while True:
-            await websocket.receive_text()
-    except (NotAuthorizedException, TokenExpiredException) as exc:
-        await websocket.send_json(data={'message': exc.message})
+            data = await websocket.receive_text()
+            websocket_manager.touch(websocket=websocket, key=chat_id)
+            await handle_chat_frame(
+                data=data,
+                websocket=websocket,
+                chat_id=chat_id,
+                user_id=user_data.user_id,
+                websocket_manager=websocket_manager,
+                message_queue=message_queue,
+            )
+    except (NotAuthorizedException, TokenExpiredException, ChatNotFoundException) as exc:
         await websocket_manager.remove_connection(websocket=websocket, key=chat_id)
+        await websocket.send_json(data={'message': exc.message})
         await websocket.close()
     except WebSocketDisconnect:
         await websocket_manager.remove_connection(websocket=websocket, key=chat_id)
@@ -0,0 +1,61 @@
+from typing import Any
+
+from dishka.integrations.fastapi import DishkaRoute, FromDishka
+from fastapi import APIRouter, Security
+from src.application.acquiring.interface import AcquiringGatewayInterface
+from src.application.auth.interface import SessionCacheInterface, TokenDenyListInterface
+from src.application.chats.interface import (
+    ChatMessageQueueInterface,
+    WebsocketManagerInterface,
+)
+from src.application.common.interfaces.idempotency import InFlightRequestsInterface
+from src.application.common.interfaces.outbox import OutboxDispatcherInterface
+from src.application.common.interfaces.password_hasher import PasswordHasherInterface
+from src.application.common.interfaces.smtp import SMTPServerInterface
+from src.application.common.response import APIResponse
+from src.application.orders.interface import (
+    OrderPaymentQueueInterface,
+    OrderQuoteCacheInterface,
+)
+from src.application.products.interface import ProductCacheInterface
+from src.domain.users.entities import UserRole
+from src.presentation.dependencies.auth import get_current_user_data
+
+router = APIRouter(tags=['Metrics'], prefix='/metrics', route_class=DishkaRoute)
+
+
+@router.get(
+    '',
+    summary='Возвращает внутренние метрики текущего процесса',
+    dependencies=[Security(get_current_user_data, scopes=[UserRole.ADMIN.value])],
+)
+async def get_metrics(
+    product_cache: FromDishka[ProductCacheInterface],
+    session_cache: FromDishka[SessionCacheInterface],
+    token_deny_list: FromDishka[TokenDenyListInterface],
+    password_hasher: FromDishka[PasswordHasherInterface],
+    smtp_server: FromDishka[SMTPServerInterface],
+    outbox_dispatcher: FromDishka[OutboxDispatcherInterface],
+    acquiring_gateway: FromDishka[AcquiringGatewayInterface],
+    order_payment_queue: FromDishka[OrderPaymentQueueInterface],
+    in_flight_requests: FromDishka[InFlightRequestsInterface],
+    order_quote_cache: FromDishka[OrderQuoteCacheInterface],
+    websocket_manager: FromDishka[WebsocketManagerInterface],
+    chat_message_queue: FromDishka[ChatMessageQueueInterface],
+) -> APIResponse[dict[str, Any]]:
+    return APIResponse(
+        data={
+            'product_cache': product_cache.stats(),
+            'session_cache': session_cache.stats(),
+            'token_deny_list': token_deny_list.stats(),
+            'password_hasher': password_hasher.stats(),
+            'smtp': smtp_server.stats(),
+            'outbox': outbox_dispatcher.stats(),
+            'acquiring': acquiring_gateway.stats(),
+            'order_payments': order_payment_queue.stats(),
+            'idempotency_in_flight': in_flight_requests.stats(),
+            'order_quotes': order_quote_cache.stats(),
+            'websockets': websocket_manager.stats(),
+            'chat_messages': chat_message_queue.stats(),
+        },
+    )
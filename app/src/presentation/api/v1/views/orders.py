@@ -1,26 +1,58 @@
+from typing import Annotated
 from uuid import UUID
 
+from dishka import AsyncContainer
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, Depends, Request, Security
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    Request,
+    Security,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.encoders import jsonable_encoder
+from src.application.chats.interface import WebsocketManagerInterface
 from src.application.common.response import APIResponse
 from src.application.orders.commands import (
     CreateOrderCommand,
     GetManyOrdersCommand,
+    QuoteOrderCommand,
     UpdateOrderCommand,
 )
-from src.application.orders.dto import CreateOrderOut, OrderOut
+from src.application.orders.dto import (
+    CreateOrderOut,
+    OrderOut,
+    OrderPaymentOut,
+    OrderQuoteOut,
+)
+from src.application.orders.exceptions import (
+    IdempotencyKeyReusedException,
+    IdempotentRequestInProgressException,
+    OrderPaymentQueueOverloadedException,
+)
 from src.application.orders.usecases import (
     CreateOrderUseCase,
+    EnqueueOrderUseCase,
     GetManyOrdersUseCase,
+    GetOrderPaymentUseCase,
     GetOrderUseCase,
+    IdempotentCreateOrderUseCase,
+    QuoteOrderUseCase,
     UpdateOrderByWebhookUseCase,
     UpdateOrderUseCase,
 )
+from src.domain.orders.entities import OrderStatus
 from src.domain.orders.exceptions import (
+    DuplicateOrderPositionsException,
     OrderItemIncorrectQuantityException,
     OrderNotFoundException,
 )
+from src.domain.products.exceptions import ManyProductsNotFoundException
 from src.domain.users.entities import UserRole
+from src.infrastructure.di.container import get_container
+from src.infrastructure.settings import OrderCreationMode, settings
 from src.presentation.dependencies.auth import get_current_user_data
 
 router = APIRouter(tags=['Orders'], prefix='/orders', route_class=DishkaRoute)
@@ -39,19 +71,131 @@ async def get_many_orders(
     return APIResponse(data=response)
 
 
-@router.post(
-    '',
-    summary='Создает новый заказ',
-    responses={200: {'model': APIResponse[CreateOrderOut]}, 400: {'model': OrderItemIncorrectQuantityException}},
-)
+IdempotencyKey = Annotated[str | None, Header(alias='Idempotency-Key', min_length=1, max_length=255)]
+
+
 async def create_order(
     create_orders_interactor: FromDishka[CreateOrderUseCase],
+    idempotent_interactor: FromDishka[IdempotentCreateOrderUseCase],
     command: CreateOrderCommand,
+    idempotency_key: IdempotencyKey = None,
 ) -> APIResponse[CreateOrderOut]:
-    response = await create_orders_interactor.execute(command=command)
+    if idempotency_key:
+        response = await idempotent_interactor.execute(
+            key=idempotency_key,
+            command=command,
+            create_order=create_orders_interactor.execute,
+        )
+    else:
+        response = await create_orders_interactor.execute(command=command)
+    return APIResponse(data=response)
+
+
+async def enqueue_order(
+    enqueue_order_interactor: FromDishka[EnqueueOrderUseCase],
+    idempotent_interactor: FromDishka[IdempotentCreateOrderUseCase],
+    command: CreateOrderCommand,
+    idempotency_key: IdempotencyKey = None,
+) -> APIResponse[CreateOrderOut]:
+    if idempotency_key:
+        response = await idempotent_interactor.execute(
+            key=idempotency_key,
+            command=command,
+            create_order=enqueue_order_interactor.execute,
+        )
+    else:
+        response = await enqueue_order_interactor.execute(command=command)
+    return APIResponse(data=response)
+
+
+if settings.orders.CREATION_MODE == OrderCreationMode.ASYNC:
+    router.add_api_route(
+        '',
+        enqueue_order,
+        methods=['POST'],
+        status_code=202,
+        summary='Принимает новый заказ, ссылка на оплату создается в фоне',
+        responses={
+            202: {'model': APIResponse[CreateOrderOut]},
+            400: {'model': OrderItemIncorrectQuantityException},
+            409: {'model': IdempotentRequestInProgressException},
+            422: {'model': IdempotencyKeyReusedException},
+            503: {'model': OrderPaymentQueueOverloadedException},
+        },
+    )
+else:
+    router.add_api_route(
+        '',
+        create_order,
+        methods=['POST'],
+        summary='Создает новый заказ',
+        responses={
+            200: {'model': APIResponse[CreateOrderOut]},
+            400: {'model': OrderItemIncorrectQuantityException},
+            409: {'model': IdempotentRequestInProgressException},
+            422: {'model': IdempotencyKeyReusedException},
+        },
+    )
+
+
+@router.post(
+    '/quote',
+    summary='Рассчитывает стоимость корзины без создания заказа',
+    responses={
+        200: {'model': APIResponse[OrderQuoteOut]},
+        400: {'model': DuplicateOrderPositionsException},
+        404: {'model': ManyProductsNotFoundException},
+    },
+)
+async def quote_order(
+    quote_order_interactor: FromDishka[QuoteOrderUseCase],
+    command: QuoteOrderCommand,
+) -> APIResponse[OrderQuoteOut]:
+    response = await quote_order_interactor.execute(command=command)
     return APIResponse(data=response)
 
 
+@router.get(
+    '/{order_id}/payment',
+    summary='Возвращает статус создания платежа и ссылку на оплату',
+    responses={200: {'model': APIResponse[OrderPaymentOut]}, 404: {'model': OrderNotFoundException}},
+)
+async def get_order_payment(
+    order_id: UUID,
+    get_order_payment_interactor: FromDishka[GetOrderPaymentUseCase],
+) -> APIResponse[OrderPaymentOut]:
+    response = await get_order_payment_interactor.execute(order_id=order_id)
+    return APIResponse(data=response)
+
+
+@router.websocket('/ws/{order_id}')
+async def order_payment_websocket(
+    websocket: WebSocket,
+    order_id: UUID,
+    container: Annotated[AsyncContainer, Depends(get_container)],
+) -> None:
+    websocket_manager = await container.get(WebsocketManagerInterface)
+    # Страница оплаты только слушает статус заказа и не отвечает на ping
+    await websocket_manager.accept_connection(websocket=websocket, key=order_id, reap_idle=False)
+
+    try:
+        # Платеж мог быть создан до подписки, поэтому текущее состояние отправляется сразу
+        async with container() as request_container:
+            get_order_payment_interactor = await request_container.get(GetOrderPaymentUseCase)
+            payment = await get_order_payment_interactor.execute(order_id=order_id)
+        if payment.status != OrderStatus.PENDING:
+            await websocket_manager.send(websocket=websocket, key=order_id, data=jsonable_encoder(payment))
+        while True:
+            await websocket.receive_text()
+            websocket_manager.touch(websocket=websocket, key=order_id)
+    except OrderNotFoundException as exc:
+        await websocket_manager.remove_connection(websocket=websocket, key=order_id)
+        await websocket.send_json(data={'message': exc.message})
+        await websocket.close()
+    except WebSocketDisconnect:
+        await websocket_manager.remove_connection(websocket=websocket, key=order_id)
+
+
 @router.get(
     '/{order_id}',
     summary='Возвращает данные о заказе',
@@ -1,7 +1,7 @@
 from uuid import UUID, uuid4
 
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, Depends, Form, Security, UploadFile
+from fastapi import APIRouter, Depends, Form, Request, Response, Security, UploadFile
 from src.application.common.pagination import ListPaginatedResponse, PaginationQuery
 from src.application.common.response import APIResponse
 from src.application.products.commands import (
@@ -15,22 +15,25 @@ from src.application.products.usecases import (
     GetManyProductsUseCase,
     GetProductUseCase,
 )
+from src.application.products.usecases.get import GetCatalogVersionUseCase
 from src.application.products.usecases.update import UpdateProductUseCase
 from src.domain.common.exceptions.base import ApplicationException
 from src.domain.products.entities import ProductStatus, UnitsOfMesaurement
 from src.domain.products.exceptions import ProductNotFoundException
 from src.domain.users.entities import UserRole
 from src.infrastructure.utils.common import StorageBackend
+from src.presentation.api.v1.conditional import catalog_conditional_get
 from src.presentation.dependencies.auth import get_current_user_data
 
 router = APIRouter(tags=['Products'], prefix='/products', route_class=DishkaRoute)
 
 
-def get_pagination(limit: int = 100, page: int = 0) -> PaginationQuery:
-    return PaginationQuery(page=page, limit=limit)
+def get_pagination(limit: int = 100, page: int = 0, cursor: str | None = None) -> PaginationQuery:
+    return PaginationQuery(page=page, limit=limit, cursor=cursor)
 
 
 def get_products_list_command(
+    search: str | None = None,
     name: str | None = None,
     category: str | None = None,
     collection: str | None = None,
@@ -49,16 +52,28 @@ def get_products_list_command(
         price_to=price_to,
         units_of_measurement=units_of_measurement,
         pagination=pagination,
+        search=search,
     )
 
 
-@router.get('', summary='Возвращает список товаров')
+@router.get(
+    '',
+    summary='Возвращает список товаров',
+    description='При передаче `search` выполняется полнотекстовый поиск, результаты сортируются по релевантности',
+)
 async def get_many_products(
+    request: Request,
+    response: Response,
     get_products_list_interactor: FromDishka[GetManyProductsUseCase],
+    get_catalog_version_interactor: FromDishka[GetCatalogVersionUseCase],
     command: GetManyProductsCommand = Depends(get_products_list_command),
 ) -> APIResponse[ListPaginatedResponse[ProductOut]]:
-    response = await get_products_list_interactor.execute(command=command)
-    return APIResponse(data=response)
+    catalog_version = await get_catalog_version_interactor.execute()
+    if not_modified := catalog_conditional_get(request, response, catalog_version):
+        return not_modified  # type: ignore
+
+    result = await get_products_list_interactor.execute(command=command)
+    return APIResponse(data=result)
 
 
 @router.post(
@@ -126,11 +141,20 @@ async def create_product(
     responses={200: {'model': APIResponse[ProductOut]}, 404: {'model': ProductNotFoundException}},
 )
 async def get_product(
+    request: Request,
+    response: Response,
     product_id: UUID,
     get_product_interactor: FromDishka[GetProductUseCase],
+    get_catalog_version_interactor: FromDishka[GetCatalogVersionUseCase],
 ) -> APIResponse[ProductOut]:
-    response = await get_product_interactor.execute(product_id=product_id)
-    return APIResponse(data=response)
+    # Удаленный товар должен вернуть 404, а не 304 по версии каталога
+    result = await get_product_interactor.execute(product_id=product_id)
+
+    catalog_version = await get_catalog_version_interactor.execute()
+    if not_modified := catalog_conditional_get(request, response, catalog_version):
+        return not_modified  # type: ignore
+
+    return APIResponse(data=result)
 
 
 @router.patch(
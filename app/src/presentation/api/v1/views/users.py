@@ -17,8 +17,8 @@ from src.presentation.dependencies.auth import get_current_user_data
 router = APIRouter(tags=['Users'], prefix='/users', route_class=DishkaRoute)
 
 
-def get_pagination(limit: int = 10, page: int = 0) -> PaginationQuery:
-    return PaginationQuery(page=page, limit=limit)
+def get_pagination(limit: int = 10, page: int = 0, cursor: str | None = None) -> PaginationQuery:
+    return PaginationQuery(page=page, limit=limit, cursor=cursor)
 
 
 def get_users_list_command(
@@ -17,10 +17,11 @@ from src.application.common.interfaces.identity_provider import (
     IdentityProviderInterface,
 )
 from src.infrastructure.di.container import get_container
+from src.infrastructure.settings import AuthMode, settings
 
 logger = logging.getLogger()
 
-AUTH_COOKIE = 'session_id'
+AUTH_COOKIE = 'access_token' if settings.AUTH_MODE == AuthMode.TOKEN else 'session_id'
 
 
 class OAuth2PasswordBearerWithCookie(OAuth2):
@@ -72,6 +73,13 @@ async def get_refresh_token(request: Request) -> str:
     return _get_authorization_data(value=refresh_token)
 
 
+async def get_access_token(request: Request) -> str | None:
+    access_token: str | None = request.cookies.get('access_token')
+    if not access_token:
+        return None
+    return _get_authorization_data(value=access_token)
+
+
 async def get_current_session(request: Request) -> UUID:
     authorization: str | None = request.cookies.get(AUTH_COOKIE)
     return UUID(authorization)
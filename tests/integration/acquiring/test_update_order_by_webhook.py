@@ -3,6 +3,7 @@ from uuid import UUID
 import pytest
 from dishka import AsyncContainer
 from httpx import AsyncClient
+from src.application.common.interfaces.outbox import OutboxDispatcherInterface
 from src.application.common.interfaces.transaction import ICommiter
 from src.domain.orders.entities import Order, OrderStatus
 from src.domain.orders.repository import OrderRepositoryInterface
@@ -46,3 +47,9 @@ class TestOrders:
 
             assert order_data
             assert order_data.status == OrderStatus.APPROVED
+
+            outbox_dispatcher = await container.get(OutboxDispatcherInterface)
+
+            assert await outbox_dispatcher.dispatch_batch() == 1
+            assert await outbox_dispatcher.dispatch_batch() == 0
+            assert outbox_dispatcher.stats()['processed'] == 1
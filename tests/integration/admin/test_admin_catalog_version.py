@@ -0,0 +1,25 @@
+import pytest
+from admin.views import mixins
+from admin.views.mixins import ProductCacheInvalidationMixin
+from dishka import AsyncContainer
+from httpx import AsyncClient
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+class TestAdminCatalogVersion:
+    async def test_admin_edit_changes_etag(
+        self,
+        client: AsyncClient,
+        container: AsyncContainer,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(mixins, "get_container", lambda: container)
+        response = await client.get("/categories")
+        etag = response.headers["etag"]
+
+        await ProductCacheInvalidationMixin().after_edit(request=None, obj=None)  # type: ignore[arg-type]
+
+        response = await client.get("/categories", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
@@ -0,0 +1,75 @@
+from uuid import UUID, uuid4
+
+import pytest
+from dishka import AsyncContainer
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.application.common.interfaces.transaction import ICommiter
+from src.domain.chats.entities import Chat
+from src.domain.chats.repository import ChatRepositoryInterface
+from src.domain.users.entities import User, UserRole
+from src.domain.users.repository import UserRepositoryInterface
+from src.infrastructure.persistence.postgresql.models.user import UserModel
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+class TestChatMessagesAccess:
+    async def _login(self, client: AsyncClient, container: AsyncContainer, email: str, role: UserRole) -> UUID:
+        response = await client.post("/auth/register", json={"email": email, "password": "1234qwe"})
+        assert response.status_code == 201
+
+        async with container() as di_container:
+            user_repository = await di_container.get(UserRepositoryInterface)
+            session = await di_container.get(AsyncSession)
+            user: User | None = await user_repository.get_by_email(email)
+            assert user
+            await session.execute(update(UserModel).where(UserModel.id == user.id).values(role=role))
+            await session.commit()
+
+        response = await client.post("/auth/login", data={"username": email, "password": "1234qwe"})
+        assert response.status_code == 200
+        return user.id
+
+    async def _create_chat(self, container: AsyncContainer, owner_id: UUID) -> UUID:
+        async with container() as di_container:
+            chat_repository = await di_container.get(ChatRepositoryInterface)
+            commiter = await di_container.get(ICommiter)
+            chat = Chat.create(owner_id=owner_id, title="test_chat")
+            await chat_repository.create(chat)
+            await commiter.commit()
+        return chat.id
+
+    @pytest.mark.usefixtures("clean_users_table")
+    async def test_owner_reads_history(self, client: AsyncClient, container: AsyncContainer) -> None:
+        owner_id = await self._login(client, container, "chat_owner@test.com", UserRole.USER)
+        chat_id = await self._create_chat(container, owner_id)
+
+        response = await client.get(f"/chats/{chat_id}/messages")
+        assert response.status_code == 200
+
+    @pytest.mark.usefixtures("clean_users_table")
+    async def test_other_user_cannot_read_history(self, client: AsyncClient, container: AsyncContainer) -> None:
+        owner_id = await self._login(client, container, "chat_owner@test.com", UserRole.USER)
+        chat_id = await self._create_chat(container, owner_id)
+        await self._login(client, container, "chat_other@test.com", UserRole.USER)
+
+        response = await client.get(f"/chats/{chat_id}/messages")
+        assert response.status_code == 403
+
+    @pytest.mark.usefixtures("clean_users_table")
+    async def test_manager_reads_history(self, client: AsyncClient, container: AsyncContainer) -> None:
+        owner_id = await self._login(client, container, "chat_owner@test.com", UserRole.USER)
+        chat_id = await self._create_chat(container, owner_id)
+        await self._login(client, container, "chat_manager@test.com", UserRole.MANAGER)
+
+        response = await client.get(f"/chats/{chat_id}/messages")
+        assert response.status_code == 200
+
+    @pytest.mark.usefixtures("clean_users_table")
+    async def test_unknown_chat_returns_404(self, client: AsyncClient, container: AsyncContainer) -> None:
+        await self._login(client, container, "chat_owner@test.com", UserRole.USER)
+
+        response = await client.get(f"/chats/{uuid4()}/messages")
+        assert response.status_code == 404
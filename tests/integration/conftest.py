@@ -13,11 +13,21 @@ from fastapi.responses import ORJSONResponse
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
-from src.application.chats.interface import WebsocketManagerInterface
+from src.application.chats.interface import (
+    ChatMessageQueueInterface,
+    WebsocketBrokerInterface,
+    WebsocketManagerInterface,
+)
 from src.application.common.email.types import SenderName
-from src.application.common.interfaces.smtp import SyncSMTPServerInterface
+from src.application.common.interfaces.outbox import OutboxDispatcherInterface
+from src.application.common.interfaces.smtp import SMTPServerInterface
+from src.application.common.outbox import OutboxMessageType
 from src.application.common.response import ErrorAPIResponse
+from src.application.orders.interface import OrderPaymentQueueInterface
+from src.application.orders.usecases import SendNewOrderEmailUseCase
 from src.domain.common.exceptions.base import ApplicationException
+from src.infrastructure.chats import ChatMessageBatcher
+from src.infrastructure.di.cache import CacheProvider
 from src.infrastructure.di.database import (
     DatabaseAdaptersProvider,
     DatabaseConfigurationProvider,
@@ -25,18 +35,25 @@ from src.infrastructure.di.database import (
 from src.infrastructure.di.gateways import GatewayProvider
 from src.infrastructure.di.security import SecurityProvider
 from src.infrastructure.di.usecases import UseCasesProvider
+from src.infrastructure.integrations.http import (
+    HttpClientMetrics,
+    create_client_session,
+)
+from src.infrastructure.orders import OrderPaymentWorkerPool
+from src.infrastructure.outbox import OutboxDispatcher
 from src.infrastructure.persistence.postgresql.database import (
     get_async_engine,
     get_async_sessionmaker,
 )
 from src.infrastructure.persistence.postgresql.models import Base
 from src.infrastructure.settings import settings
+from src.infrastructure.websockets.broker import LocalWebsocketBroker
 from src.infrastructure.websockets.manager import WebsocketManager
 from src.presentation.api.v1.router import api_router as api_router_v1
 from starlette.types import ExceptionHandler
 from testcontainers.postgres import PostgresContainer
 
-from tests.integration.mocks.smtp_server import MockSyncSMTPServer
+from tests.integration.mocks.smtp_server import MockSMTPServer
 
 _Message = typing.Dict[str, typing.Any]
 _Receive = typing.Callable[[], typing.Awaitable[_Message]]
@@ -75,6 +92,7 @@ async def setup_db(postgres_url: str) -> AsyncGenerator[None, None]:
     engine = get_async_engine(postgres_url)
     print('URL: ', postgres_url)
     async with engine.begin() as conn:
+        await conn.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
         await conn.run_sync(Base.metadata.create_all)
     yield
     await engine.dispose()
@@ -97,21 +115,53 @@ async def container(postgres_url: str) -> AsyncGenerator[AsyncContainer, None]:
             return get_async_sessionmaker(engine)
 
         @provide(scope=Scope.APP)
-        def smtp_server(self) -> SyncSMTPServerInterface:
-            return MockSyncSMTPServer()
+        def smtp_server(self) -> SMTPServerInterface:
+            return MockSMTPServer()
+
+        @provide(scope=Scope.APP)
+        def outbox_dispatcher(self, container: AsyncContainer) -> OutboxDispatcherInterface:
+            return OutboxDispatcher(
+                container=container,
+                handlers={OutboxMessageType.NEW_ORDER_EMAIL: SendNewOrderEmailUseCase},
+            )
+
+        @provide(scope=Scope.APP)
+        def http_client_metrics(self) -> HttpClientMetrics:
+            return HttpClientMetrics()
 
         @provide(scope=Scope.APP)
         async def acquiring_session(
             self,
+            metrics: HttpClientMetrics,
         ) -> AsyncGenerator[aiohttp.ClientSession, None]:
             headers = {'Authorization': f'Bearer {settings.acquiring.TOKEN}'}
-            acquiring_session = aiohttp.ClientSession(headers=headers)
+            acquiring_session = create_client_session(metrics=metrics, headers=headers)
             yield acquiring_session
             await acquiring_session.close()
 
         @provide(scope=Scope.APP)
-        def websocker_manager(self) -> WebsocketManagerInterface:
-            return WebsocketManager()
+        def order_payment_queue(
+            self,
+            container: AsyncContainer,
+            websocket_manager: WebsocketManagerInterface,
+        ) -> OrderPaymentQueueInterface:
+            return OrderPaymentWorkerPool(container=container, websocket_manager=websocket_manager)
+
+        @provide(scope=Scope.APP)
+        def chat_message_queue(
+            self,
+            container: AsyncContainer,
+            websocket_manager: WebsocketManagerInterface,
+        ) -> ChatMessageQueueInterface:
+            return ChatMessageBatcher(container=container, websocket_manager=websocket_manager)
+
+        @provide(scope=Scope.APP)
+        def websocket_broker(self) -> WebsocketBrokerInterface:
+            return LocalWebsocketBroker()
+
+        @provide(scope=Scope.APP)
+        def websocker_manager(self, websocket_broker: WebsocketBrokerInterface) -> WebsocketManagerInterface:
+            return WebsocketManager(broker=websocket_broker)
 
         @provide(scope=Scope.APP)
         def sender_name(self) -> SenderName:
@@ -125,6 +175,7 @@ async def container(postgres_url: str) -> AsyncGenerator[AsyncContainer, None]:
             DatabaseAdaptersProvider(),
             UseCasesProvider(),
             GatewayProvider(),
+            CacheProvider(),
         )
 
     container = get_container()
@@ -2,11 +2,12 @@ from email.header import Header
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.utils import formataddr
+from typing import Any
 
-from src.application.common.interfaces.smtp import SyncSMTPServerInterface
+from src.application.common.interfaces.smtp import SMTPServerInterface
 
 
-class MockSyncSMTPServer(SyncSMTPServerInterface):
+class MockSMTPServer(SMTPServerInterface):
 
     def create_message(
         self,
@@ -31,9 +32,17 @@ class MockSyncSMTPServer(SyncSMTPServerInterface):
 
         return message
 
-    def _send(self, message: MIMEMultipart) -> None:
+    async def send_email(self, message: MIMEMultipart) -> None:
         return None
 
-    async def send_email(self, message: MIMEMultipart) -> None:
-        self._send(message)
+    async def deliver(self, message: MIMEMultipart) -> None:
+        return None
+
+    async def start(self) -> None:
         return None
+
+    async def stop(self) -> None:
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        return {}
@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta
+
+import pytest
+from dishka import AsyncContainer
+from src.application.common.interfaces.idempotency import IdempotencyRepositoryInterface
+
+pytestmark = pytest.mark.asyncio(loop_scope='session')
+
+
+class TestIdempotencyRepository:
+    async def test_reserve_key(self, container: AsyncContainer) -> None:
+        async with container() as di_container:
+            idempotency_repository = await di_container.get(IdempotencyRepositoryInterface)
+            expired_before = datetime.now() - timedelta(days=1)
+            lease_expired_before = datetime.now() - timedelta(minutes=10)
+
+            assert await idempotency_repository.reserve('reserve', 'hash', expired_before, lease_expired_before) is None
+            record = await idempotency_repository.reserve('reserve', 'hash', expired_before, lease_expired_before)
+            assert record
+            assert record.request_hash == 'hash'
+            assert record.response is None
+
+            await idempotency_repository.complete('reserve', {'id': 'order_id'})
+            record = await idempotency_repository.reserve('reserve', 'other_hash', expired_before, lease_expired_before)
+            assert record
+            assert record.request_hash == 'hash'
+            assert record.response == {'id': 'order_id'}
+
+    async def test_expired_key_is_reserved_again(self, container: AsyncContainer) -> None:
+        async with container() as di_container:
+            idempotency_repository = await di_container.get(IdempotencyRepositoryInterface)
+
+            assert await idempotency_repository.reserve('expired', 'hash', datetime.now(), datetime.now()) is None
+            assert await idempotency_repository.reserve('expired', 'other_hash', datetime.now(), datetime.now()) is None
+
+            await idempotency_repository.delete('expired')
+            assert await idempotency_repository.reserve('expired', 'hash', datetime.now(), datetime.now()) is None
+
+    async def test_in_progress_key_is_reserved_after_lease(self, container: AsyncContainer) -> None:
+        async with container() as di_container:
+            idempotency_repository = await di_container.get(IdempotencyRepositoryInterface)
+            expired_before = datetime.now() - timedelta(days=1)
+
+            assert await idempotency_repository.reserve('in_progress', 'hash', expired_before, datetime.now()) is None
+            # Прерванный запрос без ответа не блокирует ключ до конца TTL
+            assert await idempotency_repository.reserve('in_progress', 'hash', expired_before, datetime.now()) is None
+
+            await idempotency_repository.complete('in_progress', {'id': 'order_id'})
+            record = await idempotency_repository.reserve('in_progress', 'hash', expired_before, datetime.now())
+            assert record
+            assert record.response == {'id': 'order_id'}
@@ -0,0 +1,63 @@
+import pytest
+from dishka import AsyncContainer
+from src.application.common.pagination import PageCursor
+from src.domain.chats.entities import Chat, Message
+from src.domain.chats.repository import (
+    ChatRepositoryInterface,
+    MessageRepositoryInterface,
+)
+from src.domain.users.entities import User
+from src.domain.users.repository import UserRepositoryInterface
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+class TestMessageRepository:
+    async def test_create_many_messages(self, container: AsyncContainer) -> None:
+        async with container() as di_container:
+            user_repository = await di_container.get(UserRepositoryInterface)
+            chat_repository = await di_container.get(ChatRepositoryInterface)
+            message_repository = await di_container.get(MessageRepositoryInterface)
+
+            user = User.create(email="chat@test.com", hashed_password="test")
+            chat = Chat.create(owner_id=user.id, title="test_chat")
+            await user_repository.create(user)
+            await chat_repository.create(chat)
+
+            messages = [
+                Message.create(user_id=user.id, chat_id=chat.id, content=f"message {index}") for index in range(3)
+            ]
+            await message_repository.create_many(messages)
+
+            saved = await message_repository.get_by_chat_id(chat_id=chat.id)
+            assert {message.id for message in saved} == {message.id for message in messages}
+
+    async def test_get_by_chat_id_pages_backwards(self, container: AsyncContainer) -> None:
+        async with container() as di_container:
+            user_repository = await di_container.get(UserRepositoryInterface)
+            chat_repository = await di_container.get(ChatRepositoryInterface)
+            message_repository = await di_container.get(MessageRepositoryInterface)
+
+            user = User.create(email="history@test.com", hashed_password="test")
+            chat = Chat.create(owner_id=user.id, title="history_chat")
+            await user_repository.create(user)
+            await chat_repository.create(chat)
+
+            messages = [
+                Message.create(user_id=user.id, chat_id=chat.id, content=f"message {index}") for index in range(5)
+            ]
+            await message_repository.create_many(messages)
+
+            pages = []
+            before = None
+            while page := await message_repository.get_by_chat_id(chat_id=chat.id, limit=2, before=before):
+                pages.append(page)
+                before = PageCursor(key=page[-1].created_at.isoformat(), id=page[-1].id)
+
+            expected = sorted(messages, key=lambda message: (message.created_at, message.id), reverse=True)
+            assert [len(page) for page in pages] == [2, 2, 1]
+            assert [message.id for page in pages for message in page] == [message.id for message in expected]
+
+            chat_with_messages = await chat_repository.get_by_id(chat_id=chat.id)
+            assert chat_with_messages is not None
+            assert [message.id for message in chat_with_messages.messages] == [message.id for message in expected[::-1]]
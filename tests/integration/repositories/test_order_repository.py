@@ -78,6 +78,27 @@ class TestOrderRepository:
             assert order_data
             assert order_data.status == OrderStatus.PROCESSING
 
+    async def test_attach_payment_to_pending_order(self, container: AsyncContainer) -> None:
+        async with container() as di_container:
+            order_repository = await di_container.get(OrderRepositoryInterface)
+            order = Order.create(
+                customer_email='test@test.com',
+                operation_id=None,
+                shipping_address='test_address',
+                total_price=1234,
+                is_self_pickup=False,
+                status=OrderStatus.PENDING,
+            )
+            await order_repository.create(order)
+            operation_id = uuid4()
+            order.attach_payment(operation_id=operation_id, payment_link='https://test.com/pay')
+            await order_repository.update(order)
+            order_data = await order_repository.get_by_operation_id(operation_id)
+            assert order_data
+            assert order_data.id == order.id
+            assert order_data.payment_link == 'https://test.com/pay'
+            assert order_data.status == OrderStatus.CREATED
+
     async def test_get_order_by_id(self, container: AsyncContainer) -> None:
         async with container() as di_container:
             order_repository = await di_container.get(OrderRepositoryInterface)
@@ -1,5 +1,6 @@
 import pytest
 from dishka import AsyncContainer
+from src.application.common.pagination import PageCursor
 from src.application.products.filters import ProductFilters
 from src.domain.products.entities import (
     Category,
@@ -142,3 +143,86 @@ class TestProductRepository:
             count = await product_repository.count(filters=filters)
 
             assert count == 1
+
+    async def test_search_products(self, container: AsyncContainer) -> None:
+        async with container() as di_container:
+
+            product_repository = await di_container.get(ProductRepositoryInterface)
+            category_repository = await di_container.get(CategoryRepositoryInterface)
+
+            for name, category, sku in (("Цемент М500", "вяжущие", "sku_1"), ("Песок речной", "сыпучие", "sku_2")):
+                await category_repository.create(Category.create(name=category))
+                await product_repository.create(
+                    Product.create(
+                        name=name,
+                        description="Строительные материалы",
+                        category=category,
+                        sku=sku,
+                        retail_price=ProductPrice(100),
+                    ),
+                )
+
+            # "цемента" matches "Цемент" thanks to russian stemming
+            filters = ProductFilters(search="цемента")
+
+            products = await product_repository.get_many(filters=filters)
+
+            assert [product.sku for product in products] == ["sku_1"]
+
+            count = await product_repository.count(filters=filters)
+
+            assert count == 1
+
+    async def test_get_many_with_count(self, container: AsyncContainer) -> None:
+        async with container() as di_container:
+
+            product_repository = await di_container.get(ProductRepositoryInterface)
+            category_repository = await di_container.get(CategoryRepositoryInterface)
+
+            await category_repository.create(Category.create(name="test_category"))
+            for i in range(3):
+                await product_repository.create(
+                    Product.create(
+                        name=f"test_product{i}",
+                        description="test_description",
+                        category="test_category",
+                        sku=f"test_sku{i}",
+                        retail_price=ProductPrice(100),
+                    ),
+                )
+
+            products, total = await product_repository.get_many_with_count(offset=0, limit=2)
+
+            assert len(products) == 2
+            assert total == 3
+
+            products, total = await product_repository.get_many_with_count(offset=10, limit=2)
+
+            assert products == []
+            assert total == 3
+
+    async def test_get_many_after_cursor(self, container: AsyncContainer) -> None:
+        async with container() as di_container:
+
+            product_repository = await di_container.get(ProductRepositoryInterface)
+            category_repository = await di_container.get(CategoryRepositoryInterface)
+
+            await category_repository.create(Category.create(name="test_category"))
+            for i in range(5):
+                await product_repository.create(
+                    Product.create(
+                        name=f"test_product{i}",
+                        description="test_description",
+                        category="test_category",
+                        sku=f"test_sku{i}",
+                        retail_price=ProductPrice(100),
+                    ),
+                )
+
+            first_page = await product_repository.get_many(limit=2)
+            last = first_page[-1]
+
+            second_page = await product_repository.get_many(limit=2, after=PageCursor(key=last.name, id=last.id))
+
+            assert [product.name for product in first_page] == ["test_product0", "test_product1"]
+            assert [product.name for product in second_page] == ["test_product2", "test_product3"]
@@ -0,0 +1,36 @@
+"""
+Замер пропускной способности проверки access токенов.
+
+Запуск из директории `app`:
+    PYTHONPATH=. python ../tests/load_testing/jwt_benchmark.py
+"""
+
+import timeit
+
+import jwt
+from src.domain.users.entities import User
+from src.infrastructure.authentication.jwt_processor import JWTProcessor
+from src.infrastructure.settings import settings
+
+ITERATIONS = 2000
+
+
+def main() -> None:
+    jwt_processor = JWTProcessor(token_cache_size=0)
+    cached_jwt_processor = JWTProcessor(token_cache_size=1024)
+    public_key_pem = settings.jwt.PUBLIC_KEY.replace('\\n', '\n')
+    token = jwt_processor.create_access_token(user=User.create(email='test@test.com', hashed_password='password'))
+
+    cases = {
+        'pem string': lambda: jwt.decode(jwt=token, key=public_key_pem, algorithms=[settings.jwt.ALGORITHM]),
+        'loaded key': lambda: jwt_processor.validate_access_token(token),
+        'loaded key + cache': lambda: cached_jwt_processor.validate_access_token(token),
+    }
+
+    for name, case in cases.items():
+        seconds = timeit.timeit(case, number=ITERATIONS)
+        print(f'{name:>20}: {ITERATIONS / seconds:>10.0f} ops/s, {seconds / ITERATIONS * 1e6:>8.1f} us/op')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Сравнение расчета цен корзины через `PriceTable` и через поштучный расчет заказа.
+
+Запуск из директории `app` (нужен установленный pytest-benchmark):
+    python -m pytest ../tests/load_testing/test_pricing_benchmark.py -c ../pytest.ini --rootdir ..
+"""
+
+import random
+
+import pytest
+from src.application.orders.calculation import (
+    calculate_order_total_price,
+    calculate_order_total_weight,
+)
+from src.application.orders.dto import ProductInOrder
+from src.application.orders.pricing import Cart, PriceTable, price_cart
+from src.application.orders.utils import create_product_in_payment_list
+from src.application.products.dto import PaymentMethod
+from src.domain.products.entities import Product
+from src.domain.products.value_objects import ProductPrice
+
+pytest.importorskip('pytest_benchmark')
+
+CART_SIZES = [1, 10, 100, 1000, 10000]
+
+
+def create_products(count: int) -> list[Product]:
+    rng = random.Random(count)
+    return [
+        Product.create(
+            name=f'product_{index}',
+            sku=f'sku_{index}',
+            category='test_category',
+            description='test_description',
+            retail_price=ProductPrice(rng.randint(1000, 10000)),
+            weight=rng.randint(1, 5000),
+            wholesale_price=ProductPrice(rng.randint(500, 1000)),
+            d1_delivery_price=ProductPrice(rng.randint(500, 1000)),
+            d1_self_pickup_price=ProductPrice(rng.randint(500, 1000)),
+        )
+        for index in range(count)
+    ]
+
+
+def price_order(products: list[Product], order_products: list[ProductInOrder]) -> int:
+    order_weight = calculate_order_total_weight(products=products, order_products=order_products)
+    products_in_payment = create_product_in_payment_list(
+        products=products,
+        order_products=order_products,
+        products_count=len(products),
+        order_weight=order_weight,
+        is_self_pickup=False,
+        payment_method=PaymentMethod.FULL_PREPAYMENT,
+    )
+    return calculate_order_total_price(products_in_payment).value
+
+
+@pytest.mark.parametrize('cart_size', CART_SIZES)
+def test_price_order(benchmark, cart_size: int) -> None:  # type: ignore[no-untyped-def]
+    products = create_products(cart_size)
+    order_products = [ProductInOrder(id=product.id, quantity=10) for product in products]
+
+    benchmark(price_order, products, order_products)
+
+
+@pytest.mark.parametrize('cart_size', CART_SIZES)
+def test_price_cart(benchmark, cart_size: int) -> None:  # type: ignore[no-untyped-def]
+    products = create_products(cart_size)
+    table = PriceTable.from_products(products)
+    cart = Cart.create(range(cart_size), [10] * cart_size, is_self_pickup=False)
+    order_products = [ProductInOrder(id=product.id, quantity=10) for product in products]
+
+    prices = benchmark(price_cart, table, cart)
+
+    assert prices.total_price == price_order(products, order_products)
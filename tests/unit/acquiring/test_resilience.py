@@ -0,0 +1,100 @@
+import asyncio
+from typing import Any
+
+import pytest
+from src.application.acquiring.interface import AcquiringGatewayInterface
+from src.infrastructure.integrations.acquiring.exceptions import (
+    AcquiringUnavailableException,
+    CreatePaymentOperationWithReceiptException,
+)
+from src.infrastructure.integrations.acquiring.resilience import (
+    CircuitBreaker,
+    CircuitState,
+    ResilientAcquiringGateway,
+)
+
+
+class FakeAcquiringGateway(AcquiringGatewayInterface):
+    def __init__(self, *errors: Exception | None, delay: float = 0) -> None:
+        self.errors = list(errors)
+        self.delay = delay
+        self.calls = 0
+
+    async def create_payment_operation_with_receipt(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        error = self.errors.pop(0) if self.errors else None
+        if error is not None:
+            raise error
+        return {'Data': {'operationId': 'operation_id'}}
+
+    def stats(self) -> dict[str, Any]:
+        return {}
+
+
+def create_gateway(fake: FakeAcquiringGateway, **kwargs: Any) -> ResilientAcquiringGateway:
+    kwargs.setdefault('breaker', CircuitBreaker(failure_threshold=2, recovery_timeout=0.05))
+    return ResilientAcquiringGateway(gateway=fake, retry_backoff=0, **kwargs)
+
+
+async def pay(gateway: ResilientAcquiringGateway) -> dict[str, Any]:
+    return await gateway.create_payment_operation_with_receipt(client_email='test@test.com', items=(), total_price=1)
+
+
+async def test_retryable_error_is_retried() -> None:
+    fake = FakeAcquiringGateway(AcquiringUnavailableException(retryable=True))
+    gateway = create_gateway(fake)
+
+    assert await pay(gateway) == {'Data': {'operationId': 'operation_id'}}
+    assert fake.calls == 2
+    assert gateway.stats()['retries'] == 1
+
+
+async def test_not_retryable_error_is_not_retried() -> None:
+    fake = FakeAcquiringGateway(AcquiringUnavailableException())
+    gateway = create_gateway(fake)
+
+    with pytest.raises(AcquiringUnavailableException):
+        await pay(gateway)
+    assert fake.calls == 1
+
+
+async def test_breaker_opens_and_recovers() -> None:
+    fake = FakeAcquiringGateway(AcquiringUnavailableException(), AcquiringUnavailableException())
+    gateway = create_gateway(fake)
+
+    for _ in range(2):
+        with pytest.raises(AcquiringUnavailableException):
+            await pay(gateway)
+    assert gateway.breaker.state == CircuitState.OPEN
+
+    with pytest.raises(AcquiringUnavailableException):
+        await pay(gateway)
+    assert fake.calls == 2
+    assert gateway.stats()['rejected_by_breaker'] == 1
+
+    await asyncio.sleep(0.05)
+    await pay(gateway)
+    assert gateway.breaker.state == CircuitState.CLOSED  # type: ignore[comparison-overlap]
+
+
+async def test_client_error_does_not_open_breaker() -> None:
+    fake = FakeAcquiringGateway(*(CreatePaymentOperationWithReceiptException() for _ in range(3)))
+    gateway = create_gateway(fake)
+
+    for _ in range(3):
+        with pytest.raises(CreatePaymentOperationWithReceiptException):
+            await pay(gateway)
+    assert gateway.breaker.state == CircuitState.CLOSED
+    assert fake.calls == 3
+
+
+async def test_limiter_rejects_excess_calls() -> None:
+    fake = FakeAcquiringGateway(delay=0.1)
+    gateway = create_gateway(fake, max_concurrency=1, acquire_timeout=0.01)
+
+    results = await asyncio.gather(pay(gateway), pay(gateway), return_exceptions=True)
+
+    assert sum(isinstance(result, AcquiringUnavailableException) for result in results) == 1
+    assert gateway.stats()['rejected_by_limiter'] == 1
+    assert gateway.breaker.state == CircuitState.CLOSED
@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta
+
+from src.application.common.interfaces.invalidation import InvalidationTopic
+from src.infrastructure.cache.bus import PostgresInvalidationBus
+from src.infrastructure.cache.deny_list import MemoryTokenDenyList
+from src.infrastructure.persistence.postgresql.notify import make_invalidation_payload
+
+
+async def test_revoked_token_is_denied() -> None:
+    deny_list = MemoryTokenDenyList(invalidation_bus=PostgresInvalidationBus(dsn='postgresql://localhost/test'))
+
+    await deny_list.revoke('revoked', expires_at=datetime.now() + timedelta(minutes=5))
+
+    assert deny_list.is_revoked('revoked')
+    assert not deny_list.is_revoked('other')
+
+
+async def test_expired_token_is_not_stored() -> None:
+    deny_list = MemoryTokenDenyList(invalidation_bus=PostgresInvalidationBus(dsn='postgresql://localhost/test'))
+
+    await deny_list.revoke('expired', expires_at=datetime.now() - timedelta(seconds=1))
+
+    assert not deny_list.is_revoked('expired')
+    assert deny_list.stats()['size'] == 0
+
+
+def test_revocation_from_other_process_is_applied() -> None:
+    bus = PostgresInvalidationBus(dsn='postgresql://localhost/test')
+    deny_list = MemoryTokenDenyList(invalidation_bus=bus)
+    expires_at = int((datetime.now() + timedelta(minutes=5)).timestamp())
+
+    bus._on_notification(
+        None, 1, bus.channel, make_invalidation_payload(InvalidationTopic.ACCESS_TOKEN, f'remote:{expires_at}'),
+    )
+    bus._dispatch_all()
+
+    assert deny_list.is_revoked('remote')
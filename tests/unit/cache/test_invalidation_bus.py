@@ -0,0 +1,39 @@
+from src.application.common.interfaces.invalidation import InvalidationTopic
+from src.infrastructure.cache.bus import PostgresInvalidationBus
+from src.infrastructure.persistence.postgresql.notify import make_invalidation_payload
+
+
+def test_notification_is_dispatched_to_topic_subscribers() -> None:
+    bus = PostgresInvalidationBus(dsn='postgresql://localhost/test')
+    products: list[str | None] = []
+    sessions: list[str | None] = []
+    bus.subscribe(InvalidationTopic.PRODUCT, products.append)
+    bus.subscribe(InvalidationTopic.USER_SESSION, sessions.append)
+
+    bus._on_notification(None, 1, bus.channel, make_invalidation_payload(InvalidationTopic.PRODUCT, 'key'))
+    bus._on_notification(None, 1, bus.channel, 'not a json')
+    bus._on_notification(None, 1, bus.channel, '{"topic": "unknown"}')
+
+    assert products == ['key']
+    assert sessions == []
+
+
+def test_reconnect_flushes_all_subscribers() -> None:
+    bus = PostgresInvalidationBus(dsn='postgresql://localhost/test')
+    events: list[str | None] = []
+    bus.subscribe(InvalidationTopic.PRODUCT, events.append)
+    bus.subscribe(InvalidationTopic.USER, events.append)
+
+    bus._dispatch_all()
+
+    assert events == [None, None]
+
+
+async def test_publish_without_connection_dispatches_locally() -> None:
+    bus = PostgresInvalidationBus(dsn='postgresql://localhost/test')
+    events: list[str | None] = []
+    bus.subscribe(InvalidationTopic.CATEGORY, events.append)
+
+    await bus.publish(InvalidationTopic.CATEGORY, 'test_category')
+
+    assert events == ['test_category']
@@ -0,0 +1,37 @@
+import time
+
+from src.infrastructure.cache.memory import MemoryCache
+
+
+def test_lru_eviction() -> None:
+    cache: MemoryCache[str, int] = MemoryCache(maxsize=2)
+
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+    assert cache.stats.evictions == 1
+
+
+def test_ttl_expiration() -> None:
+    cache: MemoryCache[str, int] = MemoryCache(ttl=0.01)
+
+    cache.set('a', 1)
+    time.sleep(0.02)
+
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_stats() -> None:
+    cache: MemoryCache[str, int] = MemoryCache()
+
+    cache.set('a', 1)
+    cache.get('a')
+    cache.get('b')
+
+    assert cache.stats.as_dict() == {'hits': 1, 'misses': 1, 'evictions': 0}
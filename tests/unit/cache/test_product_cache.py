@@ -0,0 +1,141 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+from src.application.common.pagination import PageCursor
+from src.application.products.filters import ProductFilters
+from src.domain.products.entities import CatalogVersion, Product
+from src.domain.products.repository import ProductRepositoryInterface
+from src.domain.products.value_objects import ProductPrice
+from src.infrastructure.cache.product import CachedProductRepository, ProductCache
+
+
+class FakeProductRepository(ProductRepositoryInterface):
+    def __init__(self, products: list[Product]) -> None:
+        self.products = {product.id: product for product in products}
+        self.calls = 0
+
+    async def create(self, product: Product) -> None:
+        self.products[product.id] = product
+
+    async def update(self, product: Product) -> None:
+        self.products[product.id] = product
+
+    async def delete(self, product_id: UUID) -> None:
+        self.products.pop(product_id, None)
+
+    async def get_by_id(self, product_id: UUID) -> Product | None:
+        self.calls += 1
+        return self.products.get(product_id)
+
+    async def get_many(
+        self,
+        filters: ProductFilters | None = None,
+        offset: int = 0,
+        limit: int = 100,
+        after: PageCursor | None = None,
+    ) -> list[Product]:
+        self.calls += 1
+        return list(self.products.values())[offset:offset + limit]
+
+    async def count(self, filters: ProductFilters | None = None) -> int:
+        self.calls += 1
+        return len(self.products)
+
+    async def get_many_with_count(
+        self,
+        filters: ProductFilters | None = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[Product], int]:
+        self.calls += 1
+        return list(self.products.values())[offset:offset + limit], len(self.products)
+
+    async def get_many_by_ids(self, product_ids: set[UUID]) -> tuple[list[Product], set[UUID]]:
+        self.calls += 1
+        found = [self.products[product_id] for product_id in product_ids if product_id in self.products]
+        return found, product_ids - self.products.keys()
+
+    async def get_catalog_version(self) -> CatalogVersion:
+        self.calls += 1
+        return CatalogVersion(version=self.calls, updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+
+def create_product(name: str = 'test_product') -> Product:
+    return Product.create(
+        name=name,
+        sku=name,
+        category='test_category',
+        description='test_description',
+        retail_price=ProductPrice(100),
+    )
+
+
+async def test_get_by_id_is_cached() -> None:
+    product = create_product()
+    repository = FakeProductRepository([product])
+    cache = ProductCache()
+
+    first = await CachedProductRepository(repository, cache).get_by_id(product.id)
+    second = await CachedProductRepository(repository, cache).get_by_id(product.id)
+
+    assert first == second == product
+    assert first is not second
+    assert repository.calls == 1
+    assert cache.stats()['products']['hits'] == 1
+
+
+async def test_invalidate_drops_pages() -> None:
+    repository = FakeProductRepository([create_product()])
+    cache = ProductCache()
+    filters = ProductFilters(name='test')
+
+    await CachedProductRepository(repository, cache).get_many_with_count(filters=filters)
+    await CachedProductRepository(repository, cache).get_many_with_count(filters=filters)
+
+    assert repository.calls == 1
+
+    version = cache.version
+    cache.invalidate()
+    _, total = await CachedProductRepository(repository, cache).get_many_with_count(filters=filters)
+
+    assert cache.version != version
+    assert total == 1
+    assert repository.calls == 2
+
+
+async def test_get_many_by_ids_fetches_only_missing() -> None:
+    cached, fresh = create_product('cached'), create_product('fresh')
+    repository = FakeProductRepository([cached, fresh])
+    cache = ProductCache()
+
+    await CachedProductRepository(repository, cache).get_by_id(cached.id)
+    products, missing = await CachedProductRepository(repository, cache).get_many_by_ids({cached.id, fresh.id})
+
+    assert {product.id for product in products} == {cached.id, fresh.id}
+    assert missing == set()
+    assert repository.calls == 2
+
+
+async def test_writes_bypass_cache() -> None:
+    repository = FakeProductRepository([])
+    cache = ProductCache()
+    cached_repository = CachedProductRepository(repository, cache)
+    product = create_product()
+
+    await cached_repository.create(product)
+    await cached_repository.get_by_id(product.id)
+
+    assert len(cache.products) == 0
+
+
+async def test_catalog_version_is_reloaded_after_invalidation() -> None:
+    repository = FakeProductRepository([])
+    cache = ProductCache()
+
+    first = await CachedProductRepository(repository, cache).get_catalog_version()
+    second = await CachedProductRepository(repository, cache).get_catalog_version()
+    cache.invalidate()
+    third = await CachedProductRepository(repository, cache).get_catalog_version()
+
+    assert first == second
+    assert third.version == 2
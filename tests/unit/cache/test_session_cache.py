@@ -0,0 +1,56 @@
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from src.application.auth.dto import UserData
+from src.domain.users.entities import UserRole
+from src.infrastructure.cache.session import SessionCache
+
+
+def create_user_data() -> UserData:
+    return UserData(
+        user_id=uuid4(),
+        email='test@test.com',
+        mobile_phone=None,
+        first_name=None,
+        last_name=None,
+        is_verified=True,
+        role=UserRole.USER,
+        scopes='user',
+    )
+
+
+def test_invalidate_user_drops_all_sessions() -> None:
+    cache = SessionCache()
+    user_data, other_user_data = create_user_data(), create_user_data()
+    expires_at = datetime.now() + timedelta(days=1)
+    sessions = [uuid4(), uuid4()]
+    other_session = uuid4()
+
+    for session_id in sessions:
+        cache.set(session_id, user_data, expires_at=expires_at)
+    cache.set(other_session, other_user_data, expires_at=expires_at)
+
+    cache.invalidate_user(user_data.user_id)
+
+    assert all(cache.get(session_id) is None for session_id in sessions)
+    assert cache.get(other_session) == other_user_data
+
+
+def test_expired_session_is_not_cached() -> None:
+    cache = SessionCache()
+    session_id = uuid4()
+
+    cache.set(session_id, create_user_data(), expires_at=datetime.now() - timedelta(seconds=1))
+
+    assert cache.get(session_id) is None
+
+
+def test_ttl_is_bounded_by_session_expiration() -> None:
+    cache = SessionCache(ttl=3600)
+    session_id = uuid4()
+
+    cache.set(session_id, create_user_data(), expires_at=datetime.now() + timedelta(milliseconds=10))
+    time.sleep(0.02)
+
+    assert cache.get(session_id) is None
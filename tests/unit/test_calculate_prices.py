@@ -1,6 +1,7 @@
 import pytest
 from src.application.common.utils import parse_price
 from src.application.orders.calculation import calculate_order_product_price
+from src.application.orders.pricing import PriceTable, select_price_columns
 from src.application.products.dto import PaymentMethod
 from src.domain.products.entities import Product, ProductStatus
 from src.domain.products.value_objects import ProductPrice
@@ -28,7 +29,7 @@ def create_product(
     )
 
 
-@pytest.mark.parametrize(
+price_cases = pytest.mark.parametrize(
     'product, payment_method, is_self_pickup, order_weight, products_count, expected',
     [
         # 1. Рынок: вес <= 20 тонн, ожидаемая цена по умолчанию
@@ -104,6 +105,9 @@ def create_product(
         ),
     ],
 )
+
+
+@price_cases
 def test_calculate_product_price(
     product: Product,
     payment_method: PaymentMethod,
@@ -121,3 +125,22 @@ def test_calculate_product_price(
     )
 
     assert price == expected
+
+
+@price_cases
+def test_price_table_matches_product_price(
+    product: Product,
+    payment_method: PaymentMethod,
+    is_self_pickup: bool,
+    order_weight: int,
+    products_count: int,
+    expected: int,
+) -> None:
+    columns = select_price_columns(
+        payment_method=payment_method,
+        is_self_pickup=is_self_pickup,
+        order_weight=order_weight,
+        products_count=products_count,
+    )
+
+    assert PriceTable.from_products([product]).resolve(columns)[0] == expected
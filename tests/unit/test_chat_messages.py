@@ -0,0 +1,158 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from dishka import Provider, Scope, make_async_container, provide
+from pydantic import ValidationError
+from src.application.chats.commands import GetChatMessagesCommand
+from src.application.chats.dto import ChatMessageJob
+from src.application.chats.exceptions import ChatMessageQueueOverloadedException
+from src.application.chats.frames import ChatFrameType, SendFrame, parse_chat_frame
+from src.application.chats.usecases.create import CreateMessagesUseCase
+from src.application.chats.usecases.get import GetChatMessagesUseCase
+from src.application.common.exceptions import InvalidCursorException
+from src.application.common.pagination import PageCursor
+from src.domain.chats.entities import Message
+from src.infrastructure.chats import ChatMessageBatcher
+
+
+class FakeWebsocketManager:
+    def __init__(self) -> None:
+        self.sent: list[tuple[Any, dict[str, Any]]] = []
+        self.broadcasts: dict[UUID, list[dict[str, Any]]] = {}
+
+    async def send(self, websocket: Any, key: UUID, data: dict[str, Any]) -> None:
+        self.sent.append((websocket, data))
+
+    async def send_all(self, key: UUID, data: dict[str, Any]) -> None:
+        self.broadcasts.setdefault(key, []).append(data)
+
+
+class FakeCreateMessagesUseCase:
+    def __init__(self, batches: list[list[Message]], invalid: set[UUID]) -> None:
+        self.batches = batches
+        self.invalid = invalid
+
+    async def execute(self, messages: list[Message]) -> None:
+        if any(message.id in self.invalid for message in messages):
+            raise ValueError('invalid message')
+        self.batches.append(messages)
+
+
+def create_batcher(
+    invalid: set[UUID] | None = None,
+    queue_size: int = 100,
+) -> tuple[ChatMessageBatcher, FakeWebsocketManager, list[list[Message]]]:
+    batches: list[list[Message]] = []
+
+    class FakeUseCasesProvider(Provider):
+        scope = Scope.REQUEST
+
+        @provide
+        def create_messages(self) -> CreateMessagesUseCase:
+            return FakeCreateMessagesUseCase(batches, invalid or set())  # type: ignore[return-value]
+
+    websocket_manager = FakeWebsocketManager()
+    batcher = ChatMessageBatcher(
+        container=make_async_container(FakeUseCasesProvider()),
+        websocket_manager=websocket_manager,  # type: ignore[arg-type]
+        flush_interval=0.01,
+        queue_size=queue_size,
+    )
+    return batcher, websocket_manager, batches
+
+
+def create_job(chat_id: UUID, client_id: str) -> ChatMessageJob:
+    return ChatMessageJob.create(
+        websocket=client_id,  # type: ignore[arg-type]
+        client_id=client_id,
+        chat_id=chat_id,
+        user_id=uuid4(),
+        content=f'message {client_id}',
+    )
+
+
+async def test_messages_are_saved_in_one_batch() -> None:
+    batcher, websocket_manager, batches = create_batcher()
+    chat_id = uuid4()
+    jobs = [create_job(chat_id, str(index)) for index in range(3)]
+
+    await batcher.start()
+    for job in jobs:
+        batcher.submit(job)
+    await batcher.stop()
+
+    assert batches == [[job.message for job in jobs]]
+    assert [data['type'] for _, data in websocket_manager.sent] == [ChatFrameType.ACK.value] * 3
+    assert [data['id'] for data in websocket_manager.broadcasts[chat_id]] == [str(job.message.id) for job in jobs]
+    assert batcher.stats()['batches'] == 1
+
+
+async def test_failed_batch_is_saved_one_by_one() -> None:
+    chat_id = uuid4()
+    jobs = [create_job(chat_id, str(index)) for index in range(3)]
+    batcher, websocket_manager, batches = create_batcher(invalid={jobs[1].message.id})
+
+    await batcher.start()
+    for job in jobs:
+        batcher.submit(job)
+    await batcher.stop()
+
+    assert batches == [[jobs[0].message], [jobs[2].message]]
+    assert {websocket: data['type'] for websocket, data in websocket_manager.sent} == {
+        '0': ChatFrameType.ACK.value,
+        '1': ChatFrameType.ERROR.value,
+        '2': ChatFrameType.ACK.value,
+    }
+    assert batcher.stats()['saved'] == 2
+    assert batcher.stats()['failed'] == 1
+
+
+def test_parse_chat_frame() -> None:
+    frame = parse_chat_frame('{"type": "send", "id": "1", "message": "test"}')
+
+    assert frame == SendFrame(type=ChatFrameType.SEND, id='1', message='test')
+    with pytest.raises(ValidationError):
+        parse_chat_frame('{"type": "send", "message": "test"}')
+    with pytest.raises(ValidationError):
+        parse_chat_frame('not a json')
+
+
+def test_full_queue_rejects_message() -> None:
+    batcher, _, _ = create_batcher(queue_size=1)
+
+    batcher.submit(create_job(uuid4(), '0'))
+    with pytest.raises(ChatMessageQueueOverloadedException):
+        batcher.submit(create_job(uuid4(), '1'))
+    assert batcher.stats()['rejected'] == 1
+
+
+class FakeMessageRepository:
+    def __init__(self, messages: list[Message]) -> None:
+        self.messages = sorted(messages, key=lambda message: (message.created_at, message.id), reverse=True)
+
+    async def get_by_chat_id(self, chat_id: UUID, limit: int = 50, before: PageCursor | None = None) -> list[Message]:
+        messages = [message for message in self.messages if message.chat_id == chat_id]
+        if before:
+            messages = [
+                message for message in messages if (message.created_at, message.id) < (before.datetime_key, before.id)
+            ]
+        return messages[:limit]
+
+
+async def test_chat_messages_are_paged_by_cursor() -> None:
+    chat_id = uuid4()
+    messages = [Message.create(user_id=uuid4(), chat_id=chat_id, content=str(index)) for index in range(5)]
+    for index, message in enumerate(messages):
+        message.created_at = datetime(2024, 1, 1, minute=index)
+    usecase = GetChatMessagesUseCase(message_repository=FakeMessageRepository(messages))  # type: ignore[arg-type]
+
+    pages = [await usecase.execute(GetChatMessagesCommand(chat_id=chat_id, limit=2))]
+    while pages[-1].next_cursor:
+        command = GetChatMessagesCommand(chat_id=chat_id, limit=2, before=pages[-1].next_cursor)
+        pages.append(await usecase.execute(command))
+
+    assert [message.content for page in pages for message in page.items] == ['4', '3', '2', '1', '0']
+    with pytest.raises(InvalidCursorException):
+        await usecase.execute(GetChatMessagesCommand(chat_id=chat_id, before='invalid'))
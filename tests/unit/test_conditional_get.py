@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi import Request, Response
+from src.domain.products.entities import CatalogVersion
+from src.presentation.api.v1.conditional import catalog_conditional_get
+
+CATALOG_VERSION = CatalogVersion(version=7, updated_at=datetime(2024, 10, 20, 12, 0, 0, 500, tzinfo=timezone.utc))
+
+
+def make_request(**headers: str) -> Request:
+    raw_headers = [(key.replace('_', '-').encode(), value.encode()) for key, value in headers.items()]
+    return Request({'type': 'http', 'method': 'GET', 'path': '/products', 'headers': raw_headers})
+
+
+def test_fresh_request_sets_validators() -> None:
+    response = Response()
+
+    assert catalog_conditional_get(make_request(), response, CATALOG_VERSION) is None
+    assert response.headers['etag'] == 'W/"7"'
+    assert response.headers['last-modified'] == 'Sun, 20 Oct 2024 12:00:00 GMT'
+    assert response.headers['cache-control'].startswith('public')
+
+
+def test_matching_etag_returns_304() -> None:
+    request = make_request(if_none_match='"other", "7"')
+
+    not_modified = catalog_conditional_get(request, Response(), CATALOG_VERSION)
+
+    assert not_modified is not None
+    assert not_modified.status_code == 304
+
+
+def test_stale_etag_ignores_if_modified_since() -> None:
+    request = make_request(if_none_match='W/"6"', if_modified_since='Mon, 21 Oct 2024 00:00:00 GMT')
+
+    assert catalog_conditional_get(request, Response(), CATALOG_VERSION) is None
+
+
+def test_if_modified_since() -> None:
+    fresh = make_request(if_modified_since='Sun, 20 Oct 2024 12:00:00 GMT')
+    stale = make_request(if_modified_since='Sun, 20 Oct 2024 11:59:59 GMT')
+
+    assert catalog_conditional_get(fresh, Response(), CATALOG_VERSION) is not None
+    assert catalog_conditional_get(stale, Response(), CATALOG_VERSION) is None
+
+
+def test_validators_use_utc() -> None:
+    response = Response()
+    catalog_version = CatalogVersion(
+        version=7,
+        updated_at=CATALOG_VERSION.updated_at.astimezone(timezone(timedelta(hours=3))),
+    )
+
+    catalog_conditional_get(make_request(), response, catalog_version)
+
+    assert response.headers['last-modified'] == 'Sun, 20 Oct 2024 12:00:00 GMT'
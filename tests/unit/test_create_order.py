@@ -0,0 +1,136 @@
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from src.application.orders.commands import CreateOrderCommand
+from src.application.orders.dto import ProductInOrder
+from src.application.orders.exceptions import OrderPaymentQueueOverloadedException
+from src.application.orders.usecases import (
+    CreateOrderPaymentUseCase,
+    CreateOrderUseCase,
+    EnqueueOrderUseCase,
+    PlaceOrderUseCase,
+)
+from src.domain.orders.entities import Order, OrderItem, OrderStatus
+from src.domain.products.entities import Product
+from src.domain.products.value_objects import ProductPrice
+from src.infrastructure.integrations.acquiring.exceptions import (
+    AcquiringUnavailableException,
+)
+
+
+class FakeStorage:
+    def __init__(self, products: list[Product]) -> None:
+        self.products = products
+        self.orders: dict[UUID, Order] = {}
+        self.committed: dict[UUID, OrderStatus] = {}
+        self.events: list[str] = []
+
+    async def get_many_by_ids(self, product_ids: set[UUID]) -> tuple[list[Product], set[UUID]]:
+        return [product for product in self.products if product.id in product_ids], set()
+
+    async def create(self, order: Order) -> None:
+        self.orders[order.id] = Order(**{**order.__dict__, 'items': []})
+
+    async def update(self, order: Order) -> None:
+        self.orders[order.id] = Order(**{**order.__dict__, 'items': []})
+
+    async def create_many(self, order_items: list[OrderItem]) -> None: ...
+
+    async def commit(self) -> None:
+        self.events.append('commit')
+        self.committed = {order_id: order.status for order_id, order in self.orders.items()}
+
+
+class FakeAcquiringGateway:
+    def __init__(self, storage: FakeStorage, error: Exception | None = None) -> None:
+        self.storage = storage
+        self.error = error
+
+    async def create_payment_operation_with_receipt(self, **kwargs: Any) -> dict[str, Any]:
+        self.storage.events.append('payment')
+        if self.error:
+            raise self.error
+        return {'operationId': uuid4(), 'paymentLink': 'https://pay.test'}
+
+
+def create_place_order(storage: FakeStorage) -> PlaceOrderUseCase:
+    return PlaceOrderUseCase(
+        order_repository=storage,  # type: ignore[arg-type]
+        order_item_repository=storage,  # type: ignore[arg-type]
+        product_repository=storage,  # type: ignore[arg-type]
+        commiter=storage,  # type: ignore[arg-type]
+    )
+
+
+def create_usecase(error: Exception | None = None) -> tuple[CreateOrderUseCase, FakeStorage, CreateOrderCommand]:
+    product = Product.create(
+        name='test_product',
+        sku='test_sku',
+        category='test_category',
+        description='test_description',
+        retail_price=ProductPrice(1000),
+        weight=10,
+    )
+    storage = FakeStorage(products=[product])
+    usecase = CreateOrderUseCase(
+        place_order=create_place_order(storage),
+        create_order_payment=CreateOrderPaymentUseCase(
+            order_repository=storage,  # type: ignore[arg-type]
+            acquiring_gateway=FakeAcquiringGateway(storage, error),  # type: ignore[arg-type]
+            commiter=storage,  # type: ignore[arg-type]
+        ),
+    )
+    command = CreateOrderCommand(
+        customer_email='test@test.com',
+        shipping_address='test_address',
+        is_self_pickup=False,
+        items=[ProductInOrder(id=product.id, quantity=1)],
+    )
+    return usecase, storage, command
+
+
+async def test_pending_order_is_committed_before_payment() -> None:
+    usecase, storage, command = create_usecase()
+
+    result = await usecase.execute(command)
+
+    assert storage.events == ['commit', 'payment', 'commit']
+    assert storage.committed[result.id] == OrderStatus.CREATED
+    assert storage.orders[result.id].operation_id == result.operation_id
+    assert result.payment_link == 'https://pay.test'
+    assert storage.orders[result.id].payment_link == 'https://pay.test'
+
+
+async def test_order_is_failed_when_payment_is_not_created() -> None:
+    usecase, storage, command = create_usecase(error=AcquiringUnavailableException())
+
+    with pytest.raises(AcquiringUnavailableException):
+        await usecase.execute(command)
+
+    assert storage.events == ['commit', 'payment', 'commit']
+    [order] = storage.orders.values()
+    assert order.operation_id is None
+    assert storage.committed[order.id] == OrderStatus.FAILED
+
+
+class FullPaymentQueue:
+    def submit(self, job: Any) -> None:
+        raise OrderPaymentQueueOverloadedException
+
+
+async def test_enqueued_order_is_failed_when_queue_is_full() -> None:
+    _, storage, command = create_usecase()
+    usecase = EnqueueOrderUseCase(
+        place_order=create_place_order(storage),
+        payment_queue=FullPaymentQueue(),  # type: ignore[arg-type]
+        order_repository=storage,  # type: ignore[arg-type]
+        commiter=storage,  # type: ignore[arg-type]
+    )
+
+    with pytest.raises(OrderPaymentQueueOverloadedException):
+        await usecase.execute(command)
+
+    assert 'payment' not in storage.events
+    [order] = storage.orders.values()
+    assert storage.committed[order.id] == OrderStatus.FAILED
@@ -0,0 +1,36 @@
+from uuid import uuid4
+
+from jinja2 import Template
+from src.application.common.email.utils import (
+    TEMPLATES_PATH,
+    environment,
+    get_new_order_template,
+    get_reset_password_template,
+    preload_templates,
+)
+from src.domain.orders.entities import Order
+
+
+def render_from_source(name: str, **context: object) -> str:
+    return str(Template((TEMPLATES_PATH / name).read_text()).render(**context))
+
+
+async def test_templates_render_as_before() -> None:
+    order = Order.create(
+        customer_email='test@test.com',
+        operation_id=uuid4(),
+        shipping_address='test_address',
+        total_price=1234,
+        is_self_pickup=False,
+    )
+
+    assert await get_new_order_template(order) == render_from_source('new_order.html', order=order)
+    assert await get_reset_password_template('https://localhost/reset') == render_from_source(
+        'password_recovery.html', reset_link='https://localhost/reset',
+    )
+
+
+def test_templates_are_compiled_once() -> None:
+    preload_templates()
+
+    assert environment.get_template('new_order.html') is environment.get_template('new_order.html')
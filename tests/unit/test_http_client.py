@@ -0,0 +1,28 @@
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from src.infrastructure.integrations.http import (
+    HttpClientMetrics,
+    create_client_session,
+)
+
+
+async def ping(request: web.Request) -> web.Response:
+    return web.json_response({'Data': 'pong'})
+
+
+async def test_connections_are_reused() -> None:
+    app = web.Application()
+    app.router.add_get('/ping', ping)
+    metrics = HttpClientMetrics()
+
+    async with TestServer(app) as server:
+        session = create_client_session(metrics=metrics)
+        for _ in range(3):
+            async with session.get(server.make_url('/ping')) as response:
+                assert await response.json() == {'Data': 'pong'}
+        await session.close()
+
+    stats = metrics.stats.as_dict()
+    assert stats['requests'] == 3
+    assert stats['connections_created'] == 1
+    assert stats['connections_reused'] == 2
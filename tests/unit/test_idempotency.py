@@ -0,0 +1,173 @@
+import asyncio
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from src.application.acquiring.exceptions import PaymentOutcomeUnknownException
+from src.application.common.idempotency import (
+    UNKNOWN_OUTCOME_RESPONSE,
+    IdempotencyRecord,
+    hash_request,
+)
+from src.application.orders.commands import CreateOrderCommand
+from src.application.orders.dto import CreateOrderOut, ProductInOrder
+from src.application.orders.exceptions import (
+    IdempotencyKeyReusedException,
+    IdempotentRequestOutcomeUnknownException,
+)
+from src.application.orders.usecases import IdempotentCreateOrderUseCase
+from src.domain.orders.entities import OrderStatus
+from src.infrastructure.cache.in_flight import MemoryInFlightRequests
+from src.infrastructure.settings import settings
+
+
+class FakeIdempotencyRepository:
+    def __init__(self) -> None:
+        self.records: dict[str, IdempotencyRecord] = {}
+
+    async def reserve(
+        self,
+        key: str,
+        request_hash: str,
+        expired_before: datetime,
+        in_progress_expired_before: datetime,
+    ) -> IdempotencyRecord | None:
+        record = self.records.get(key)
+        if record is not None and record.created_at >= expired_before:
+            if record.response is not None or record.created_at >= in_progress_expired_before:
+                return record
+        self.records[key] = IdempotencyRecord(
+            key=key, request_hash=request_hash, response=None, created_at=datetime.now(),
+        )
+        return None
+
+    async def complete(self, key: str, response: dict[str, Any]) -> None:
+        self.records[key].response = response
+
+    async def delete(self, key: str) -> None:
+        self.records.pop(key, None)
+
+    async def commit(self) -> None: ...
+
+    async def rollback(self) -> None: ...
+
+
+class FakeCreateOrder:
+    def __init__(self, delay: float = 0, error: Exception | None = None) -> None:
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self, command: CreateOrderCommand) -> CreateOrderOut:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return CreateOrderOut(
+            id=uuid4(),
+            customer_email=command.customer_email,
+            created_at=datetime.now(),
+            payment_link='https://pay.test',
+            shipping_address=command.shipping_address,
+            operation_id=uuid4(),
+            total_price=10,
+            status=OrderStatus.CREATED,
+        )
+
+
+def create_usecase() -> tuple[IdempotentCreateOrderUseCase, FakeIdempotencyRepository]:
+    repository = FakeIdempotencyRepository()
+    usecase = IdempotentCreateOrderUseCase(
+        idempotency_repository=repository,  # type: ignore[arg-type]
+        in_flight_requests=MemoryInFlightRequests(),
+        commiter=repository,  # type: ignore[arg-type]
+    )
+    return usecase, repository
+
+
+def create_command(shipping_address: str = 'test_address') -> CreateOrderCommand:
+    return CreateOrderCommand(
+        customer_email='test@test.com',
+        shipping_address=shipping_address,
+        is_self_pickup=False,
+        items=[ProductInOrder(id=uuid4(), quantity=1)],
+    )
+
+
+async def test_retry_returns_stored_response() -> None:
+    usecase, _ = create_usecase()
+    create_order = FakeCreateOrder()
+    command = create_command()
+
+    first = await usecase.execute(key='key', command=command, create_order=create_order)
+    second = await usecase.execute(key='key', command=command, create_order=create_order)
+
+    assert create_order.calls == 1
+    assert second == first
+
+
+async def test_concurrent_retries_share_one_execution() -> None:
+    usecase, _ = create_usecase()
+    create_order = FakeCreateOrder(delay=0.05)
+    command = create_command()
+
+    results = await asyncio.gather(
+        *(usecase.execute(key='key', command=command, create_order=create_order) for _ in range(3)),
+    )
+
+    assert create_order.calls == 1
+    assert results[0] == results[1] == results[2]
+    assert usecase.in_flight_requests.stats()['size'] == 0
+
+
+async def test_key_reused_with_another_request() -> None:
+    usecase, _ = create_usecase()
+    create_order = FakeCreateOrder()
+
+    await usecase.execute(key='key', command=create_command(), create_order=create_order)
+    with pytest.raises(IdempotencyKeyReusedException):
+        await usecase.execute(key='key', command=create_command('other_address'), create_order=create_order)
+
+
+async def test_failed_request_releases_key() -> None:
+    usecase, repository = create_usecase()
+    command = create_command()
+
+    with pytest.raises(ValueError):
+        await usecase.execute(key='key', command=command, create_order=FakeCreateOrder(error=ValueError()))
+    assert 'key' not in repository.records
+
+    await usecase.execute(key='key', command=command, create_order=FakeCreateOrder())
+    assert repository.records['key'].response is not None
+
+
+async def test_interrupted_request_releases_key_after_lease() -> None:
+    usecase, repository = create_usecase()
+    command = create_command()
+    repository.records['key'] = IdempotencyRecord(
+        key='key',
+        request_hash=hash_request(asdict(command)),
+        response=None,
+        # Моложе TTL ключа, но старше времени ожидания оплаты
+        created_at=datetime.now() - timedelta(seconds=settings.orders.PENDING_TIMEOUT_SECONDS + 1),
+    )
+
+    await usecase.execute(key='key', command=command, create_order=FakeCreateOrder())
+
+    assert repository.records['key'].response is not None
+
+
+async def test_unknown_payment_outcome_keeps_key() -> None:
+    usecase, repository = create_usecase()
+    command = create_command()
+    create_order = FakeCreateOrder(error=PaymentOutcomeUnknownException())
+
+    with pytest.raises(PaymentOutcomeUnknownException):
+        await usecase.execute(key='key', command=command, create_order=create_order)
+    with pytest.raises(IdempotentRequestOutcomeUnknownException):
+        await usecase.execute(key='key', command=command, create_order=create_order)
+
+    assert create_order.calls == 1
+    assert repository.records['key'].response == UNKNOWN_OUTCOME_RESPONSE
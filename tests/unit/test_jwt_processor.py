@@ -0,0 +1,42 @@
+import pytest
+from src.application.auth.exceptions import WrongTokenTypeException
+from src.domain.users.entities import User
+from src.infrastructure.authentication.jwt_processor import JWTProcessor
+
+
+def create_user() -> User:
+    return User.create(email='test@test.com', hashed_password='hashed_password')
+
+
+def test_access_token_round_trip() -> None:
+    jwt_processor = JWTProcessor(token_cache_size=0)
+    user = create_user()
+
+    token_data = jwt_processor.validate_access_token(jwt_processor.create_access_token(user=user))
+
+    assert token_data.user_id == user.id
+    assert token_data.role == user.role
+    assert jwt_processor.token_cache is None
+
+
+def test_verified_token_is_cached() -> None:
+    jwt_processor = JWTProcessor(token_cache_size=16)
+    token = jwt_processor.create_access_token(user=create_user())
+
+    first = jwt_processor.validate_access_token(token)
+    second = jwt_processor.validate_access_token(token)
+
+    assert first == second
+    assert jwt_processor.token_cache is not None
+    assert jwt_processor.token_cache.stats.hits == 1
+
+
+def test_rejected_token_is_not_cached() -> None:
+    jwt_processor = JWTProcessor(token_cache_size=16)
+    refresh_token = jwt_processor.create_refresh_token(user_id=create_user().id)
+
+    with pytest.raises(WrongTokenTypeException):
+        jwt_processor.validate_access_token(refresh_token)
+
+    assert jwt_processor.token_cache is not None
+    assert len(jwt_processor.token_cache) == 0
@@ -0,0 +1,112 @@
+import asyncio
+from datetime import timedelta
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from dishka import Provider, Scope, make_async_container, provide
+from src.application.orders.dto import OrderPaymentJob
+from src.application.orders.exceptions import OrderPaymentQueueOverloadedException
+from src.application.orders.usecases import (
+    CreateOrderPaymentUseCase,
+    FailStalePendingOrdersUseCase,
+)
+from src.domain.orders.entities import Order, OrderStatus
+from src.infrastructure.orders import OrderPaymentWorkerPool
+
+
+class FakeWebsocketManager:
+    def __init__(self) -> None:
+        self.sent: dict[UUID, list[dict[str, Any]]] = {}
+
+    async def send_all(self, key: UUID, data: dict[str, Any]) -> None:
+        self.sent.setdefault(key, []).append(data)
+
+
+class FakeCreateOrderPaymentUseCase:
+    def __init__(self, delay: float = 0) -> None:
+        self.delay = delay
+
+    async def execute(self, job: OrderPaymentJob) -> Order:
+        await asyncio.sleep(self.delay)
+        job.order.attach_payment(operation_id=uuid4(), payment_link='https://pay.test')
+        return job.order
+
+
+class FakeFailStalePendingOrdersUseCase:
+    async def execute(self, timeout: timedelta) -> int:
+        return 2
+
+
+def create_pool(
+    delay: float = 0,
+    queue_size: int = 10,
+    sweep_interval: float = 60,
+) -> tuple[OrderPaymentWorkerPool, FakeWebsocketManager]:
+    class FakeUseCasesProvider(Provider):
+        scope = Scope.REQUEST
+
+        @provide
+        def create_order_payment(self) -> CreateOrderPaymentUseCase:
+            return FakeCreateOrderPaymentUseCase(delay)  # type: ignore[return-value]
+
+        @provide
+        def fail_stale_pending_orders(self) -> FailStalePendingOrdersUseCase:
+            return FakeFailStalePendingOrdersUseCase()  # type: ignore[return-value]
+
+    websocket_manager = FakeWebsocketManager()
+    pool = OrderPaymentWorkerPool(
+        container=make_async_container(FakeUseCasesProvider()),
+        websocket_manager=websocket_manager,  # type: ignore[arg-type]
+        workers=1,
+        queue_size=queue_size,
+        sweep_interval=sweep_interval,
+    )
+    return pool, websocket_manager
+
+
+def create_job() -> OrderPaymentJob:
+    order = Order.create(
+        customer_email='test@test.com',
+        operation_id=None,
+        shipping_address='test_address',
+        total_price=1000,
+        is_self_pickup=False,
+        status=OrderStatus.PENDING,
+    )
+    return OrderPaymentJob(order=order, items=(), total_price=10)
+
+
+async def test_payment_link_is_sent_to_subscribers() -> None:
+    pool, websocket_manager = create_pool()
+    job = create_job()
+
+    await pool.start()
+    pool.submit(job)
+    await pool.stop()
+
+    [message] = websocket_manager.sent[job.order.id]
+    assert message['status'] == OrderStatus.CREATED.value
+    assert message['payment_link'] == 'https://pay.test'
+    assert pool.stats()['created'] == 1
+    assert pool.stats()['recovered'] == 2
+
+
+async def test_full_queue_rejects_order() -> None:
+    pool, _ = create_pool(delay=1, queue_size=1)
+
+    pool.submit(create_job())
+    with pytest.raises(OrderPaymentQueueOverloadedException):
+        pool.submit(create_job())
+    assert pool.stats()['rejected'] == 1
+
+
+async def test_stale_pending_orders_are_failed_periodically() -> None:
+    pool, _ = create_pool(sweep_interval=0.01)
+
+    await pool.start()
+    await asyncio.sleep(0.1)
+    await pool.stop()
+
+    # Проверка при запуске и хотя бы одна периодическая
+    assert pool.stats()['recovered'] >= 4
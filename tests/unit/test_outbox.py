@@ -0,0 +1,132 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator
+
+from src.application.common.interfaces.outbox import (
+    OutboxHandlerInterface,
+    OutboxRepositoryInterface,
+)
+from src.application.common.interfaces.transaction import ICommiter
+from src.application.common.outbox import (
+    OutboxMessage,
+    OutboxMessageStatus,
+    OutboxMessageType,
+)
+from src.infrastructure.outbox.dispatcher import OutboxDispatcher
+
+
+def create_message() -> OutboxMessage:
+    return OutboxMessage.create(type=OutboxMessageType.NEW_ORDER_EMAIL, payload={'order_id': 'test'})
+
+
+def test_failed_message_is_retried_with_exponential_backoff() -> None:
+    message = create_message()
+    backoff = timedelta(seconds=10)
+
+    message.mark_failed(error='error', max_attempts=3, backoff=backoff)
+    first_retry_at = message.available_at
+    message.mark_failed(error='error', max_attempts=3, backoff=backoff)
+
+    assert message.status == OutboxMessageStatus.PENDING
+    assert first_retry_at > datetime.now() + backoff / 2
+    assert message.available_at - first_retry_at > backoff
+
+
+def test_message_fails_after_max_attempts() -> None:
+    message = create_message()
+
+    for _ in range(3):
+        message.mark_failed(error='error', max_attempts=3, backoff=timedelta(seconds=1))
+
+    assert message.status == OutboxMessageStatus.FAILED
+    assert message.attempts == 3
+    assert message.last_error == 'error'
+
+
+class FakeOutboxRepository(OutboxRepositoryInterface):
+    def __init__(self, events: list[str], messages: list[OutboxMessage]) -> None:
+        self.events = events
+        self.messages = messages
+
+    async def add(self, message: OutboxMessage) -> None:
+        self.messages.append(message)
+
+    async def claim(self, limit: int, lease: timedelta) -> list[OutboxMessage]:
+        self.events.append('claim')
+        claimed, self.messages = self.messages[:limit], self.messages[limit:]
+        return claimed
+
+    async def update(self, message: OutboxMessage) -> None:
+        self.events.append(f'update:{message.status.value}')
+
+
+class FakeCommiter(ICommiter):
+    def __init__(self, events: list[str]) -> None:
+        self.events = events
+
+    async def commit(self) -> None:
+        self.events.append('commit')
+
+    async def rollback(self) -> None:
+        self.events.append('rollback')
+
+    async def close(self) -> None: ...
+
+
+class FakeContainer:
+    def __init__(self, dependencies: dict[type, Any]) -> None:
+        self.dependencies = dependencies
+
+    @asynccontextmanager
+    async def __call__(self) -> AsyncIterator['FakeContainer']:
+        yield self
+
+    async def get(self, dependency_type: type) -> Any:
+        return self.dependencies[dependency_type]
+
+
+class SlowHandler(OutboxHandlerInterface):
+    def __init__(self, events: list[str], delay: float) -> None:
+        self.events = events
+        self.delay = delay
+
+    async def execute(self, payload: dict[str, Any]) -> None:
+        self.events.append('handler')
+        await asyncio.sleep(self.delay)
+
+
+def create_dispatcher(events: list[str], handler_delay: float, handler_timeout: float) -> OutboxDispatcher:
+    repository = FakeOutboxRepository(events=events, messages=[create_message()])
+    container = FakeContainer(
+        {
+            OutboxRepositoryInterface: repository,
+            ICommiter: FakeCommiter(events=events),
+            SlowHandler: SlowHandler(events=events, delay=handler_delay),
+        },
+    )
+    return OutboxDispatcher(
+        container=container,  # type: ignore
+        handlers={OutboxMessageType.NEW_ORDER_EMAIL: SlowHandler},
+        handler_timeout=handler_timeout,
+    )
+
+
+async def test_dispatcher_commits_claim_before_handler() -> None:
+    events: list[str] = []
+    dispatcher = create_dispatcher(events=events, handler_delay=0, handler_timeout=1)
+
+    assert await dispatcher.dispatch_batch() == 1
+
+    assert events == ['claim', 'commit', 'handler', 'update:processed', 'commit']
+    assert dispatcher.stats()['processed'] == 1
+
+
+async def test_dispatcher_retries_message_on_handler_timeout() -> None:
+    events: list[str] = []
+    dispatcher = create_dispatcher(events=events, handler_delay=1, handler_timeout=0.01)
+
+    await dispatcher.dispatch_batch()
+
+    assert events == ['claim', 'commit', 'handler', 'update:pending', 'commit']
+    assert dispatcher.stats()['retried'] == 1
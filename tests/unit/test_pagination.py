@@ -0,0 +1,74 @@
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from src.application.common.exceptions import (
+    InvalidCursorException,
+    SearchCursorNotSupportedException,
+)
+from src.application.common.pagination import (
+    PageCursor,
+    PaginationQuery,
+    decode_cursor,
+    encode_cursor,
+    next_cursor,
+)
+from src.application.products.commands import GetManyProductsCommand
+from src.application.products.usecases.get import GetManyProductsUseCase
+
+
+def test_cursor_roundtrip() -> None:
+    cursor = PageCursor(key='Цемент М500', id=uuid4())
+
+    assert decode_cursor(encode_cursor(cursor)) == cursor
+
+
+@pytest.mark.parametrize('value', ['not a cursor', 'e30', encode_cursor(PageCursor(key='x', id=uuid4()))[:-4]])
+def test_invalid_cursor(value: str) -> None:
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(value)
+
+
+def test_invalid_datetime_key() -> None:
+    with pytest.raises(InvalidCursorException):
+        PageCursor(key='not a date', id=uuid4()).datetime_key
+
+
+def test_cursor_mode_ignores_page() -> None:
+    cursor = PageCursor(key=datetime(2024, 1, 1).isoformat(), id=uuid4())
+    pagination = PaginationQuery(page=5, limit=10, cursor=encode_cursor(cursor))
+
+    assert pagination.offset == 0
+    assert pagination.after == cursor
+    assert pagination.after.datetime_key == datetime(2024, 1, 1)
+
+
+def test_next_cursor() -> None:
+    items = [SimpleNamespace(id=uuid4(), name=f'product_{i}') for i in range(3)]
+
+    assert next_cursor(items, limit=5, key=lambda item: item.name) is None
+
+    cursor = next_cursor(items, limit=3, key=lambda item: item.name)
+
+    assert cursor
+    assert decode_cursor(cursor) == PageCursor(key='product_2', id=items[-1].id)
+
+
+async def test_search_does_not_accept_cursor() -> None:
+    usecase = GetManyProductsUseCase(product_repository=None)  # type: ignore[arg-type]
+    cursor = encode_cursor(PageCursor(key='product', id=uuid4()))
+    command = GetManyProductsCommand(
+        name=None,
+        category=None,
+        description=None,
+        collection=None,
+        price_from=None,
+        price_to=None,
+        units_of_measurement=None,
+        pagination=PaginationQuery(page=0, limit=10, cursor=cursor),
+        search='цемент',
+    )
+
+    with pytest.raises(SearchCursorNotSupportedException):
+        await usecase.execute(command)
@@ -0,0 +1,30 @@
+import asyncio
+
+from src.application.auth.exceptions import AuthServiceOverloadedException
+from src.infrastructure.authentication.password_hasher import PasswordHasher
+
+
+async def test_hash_and_verify() -> None:
+    password_hasher = PasswordHasher(max_workers=1)
+
+    hashed_password = await password_hasher.hash('password')
+
+    assert await password_hasher.verify('password', hashed_password)
+    assert not await password_hasher.verify('wrong_password', hashed_password)
+    assert password_hasher.stats()['completed'] == 3
+    password_hasher.shutdown()
+
+
+async def test_rejects_when_queue_is_full() -> None:
+    password_hasher = PasswordHasher(max_workers=1, max_queue_size=0)
+
+    results = await asyncio.gather(
+        password_hasher.hash('password'),
+        password_hasher.hash('password'),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], str)
+    assert isinstance(results[1], AuthServiceOverloadedException)
+    assert password_hasher.stats()['rejected'] == 1
+    password_hasher.shutdown()
@@ -0,0 +1,120 @@
+import random
+from uuid import uuid4
+
+import pytest
+from src.application.orders.calculation import (
+    calculate_order_total_price,
+    calculate_order_total_weight,
+)
+from src.application.orders.dto import ProductInOrder
+from src.application.orders.pricing import Cart, PriceTable, price_cart, price_carts
+from src.application.orders.utils import (
+    create_product_in_payment_list,
+    price_order_products,
+)
+from src.application.products.dto import PaymentMethod
+from src.domain.products.entities import Product
+from src.domain.products.value_objects import ProductPrice
+
+
+def create_products(count: int, rng: random.Random) -> list[Product]:
+    def price() -> ProductPrice | None:
+        return ProductPrice(rng.randint(1, 10000)) if rng.random() < 0.6 else None
+
+    return [
+        Product.create(
+            name=f'product_{index}',
+            sku=f'sku_{index}',
+            category='test_category',
+            description='test_description',
+            retail_price=ProductPrice(rng.randint(1, 10000)),
+            weight=rng.choice([None, 0, 25, 50, 1000, 30000]),
+            wholesale_price=price(),
+            d1_delivery_price=price(),
+            d1_self_pickup_price=price(),
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_cart_prices_match_order_calculation(seed: int) -> None:
+    rng = random.Random(seed)
+    products = create_products(50, rng)
+    table = PriceTable.from_products(products)
+
+    for _ in range(50):
+        indexes = rng.sample(range(len(products)), rng.choice([1, 1, 2, 5, 20]))
+        quantities = [rng.randint(1, 30) for _ in indexes]
+        is_self_pickup = rng.random() < 0.5
+        payment_method = rng.choice(list(PaymentMethod))
+        cart_products = [products[index] for index in indexes]
+        order_products = [
+            ProductInOrder(id=product.id, quantity=quantity) for product, quantity in zip(cart_products, quantities)
+        ]
+
+        order_weight = calculate_order_total_weight(products=cart_products, order_products=order_products)
+        products_in_payment = create_product_in_payment_list(
+            products=cart_products,
+            order_products=order_products,
+            products_count=len(cart_products),
+            order_weight=order_weight,
+            is_self_pickup=is_self_pickup,
+            payment_method=payment_method,
+        )
+        prices = price_cart(table, Cart.create(indexes, quantities, is_self_pickup, payment_method))
+
+        assert prices.weight == order_weight
+        assert list(prices.amounts) == [product.amount for product in products_in_payment]
+        assert prices.total_price == calculate_order_total_price(products_in_payment).value
+
+
+def test_price_many_carts() -> None:
+    product = Product.create(
+        name='test_product',
+        sku='test_sku',
+        category='test_category',
+        description='test_description',
+        retail_price=ProductPrice(1000),
+        weight=25000,
+        wholesale_price=ProductPrice(800),
+        d1_delivery_price=ProductPrice(900),
+    )
+    table = PriceTable.from_products([product, Product(**{**product.__dict__, 'id': uuid4(), 'weight': 10})])
+
+    retail, wholesale, delivery = price_carts(
+        table,
+        [
+            Cart.create([1], [1], is_self_pickup=False),
+            Cart.create([0], [2], is_self_pickup=False),
+            Cart.create([0, 1], [1, 1], is_self_pickup=False),
+        ],
+    )
+
+    assert retail.total_price == 1000
+    assert wholesale.total_price == 1600
+    assert list(delivery.amounts) == [900, 900]
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_order_products_are_priced_by_price_table(seed: int) -> None:
+    rng = random.Random(seed)
+    products = create_products(10, rng)
+    order_products = [ProductInOrder(id=product.id, quantity=rng.randint(1, 30)) for product in products]
+    order_weight = calculate_order_total_weight(products=products, order_products=order_products)
+
+    for is_self_pickup in (True, False):
+        for payment_method in PaymentMethod:
+            assert price_order_products(
+                products=products,
+                order_products=order_products,
+                is_self_pickup=is_self_pickup,
+                payment_method=payment_method,
+            ) == create_product_in_payment_list(
+                products=products,
+                order_products=order_products,
+                products_count=len(products),
+                order_weight=order_weight,
+                is_self_pickup=is_self_pickup,
+                payment_method=payment_method,
+            )
@@ -0,0 +1,87 @@
+from uuid import UUID, uuid4
+
+import pytest
+from src.application.orders.commands import QuoteOrderCommand
+from src.application.orders.dto import ProductInOrder
+from src.application.orders.usecases import QuoteOrderUseCase
+from src.domain.products.entities import Product
+from src.domain.products.exceptions import ManyProductsNotFoundException
+from src.domain.products.value_objects import ProductPrice
+from src.infrastructure.cache.quote import OrderQuoteCache
+
+
+class FakeProductRepository:
+    def __init__(self, products: list[Product]) -> None:
+        self.products = products
+        self.calls = 0
+
+    async def get_many_by_ids(self, product_ids: set[UUID]) -> tuple[list[Product], set[UUID]]:
+        self.calls += 1
+        # Порядок товаров не совпадает с порядком позиций, как и у репозитория
+        products = [product for product in reversed(self.products) if product.id in product_ids]
+        return products, product_ids - {product.id for product in products}
+
+
+class FakeProductCache:
+    version = '1'
+
+
+def create_product(retail_price: int) -> Product:
+    return Product.create(
+        name=f'product_{retail_price}',
+        sku=f'sku_{retail_price}',
+        category='test_category',
+        description='test_description',
+        retail_price=ProductPrice(retail_price),
+        weight=10,
+    )
+
+
+def create_usecase() -> tuple[QuoteOrderUseCase, FakeProductRepository, FakeProductCache]:
+    repository = FakeProductRepository([create_product(1000), create_product(2500)])
+    product_cache = FakeProductCache()
+    usecase = QuoteOrderUseCase(
+        product_repository=repository,  # type: ignore[arg-type]
+        product_cache=product_cache,  # type: ignore[arg-type]
+        quote_cache=OrderQuoteCache(),
+    )
+    return usecase, repository, product_cache
+
+
+async def test_quote_matches_items() -> None:
+    usecase, repository, _ = create_usecase()
+    first, second = repository.products
+    command = QuoteOrderCommand(
+        is_self_pickup=False,
+        items=[ProductInOrder(id=first.id, quantity=1), ProductInOrder(id=second.id, quantity=3)],
+    )
+
+    quote = await usecase.execute(command)
+
+    assert [item.product_id for item in quote.items] == [first.id, second.id]
+    assert [item.total_price for item in quote.items] == [10, 75]
+    assert quote.total_price == 85
+
+
+async def test_quote_is_memoized_per_catalog_version() -> None:
+    usecase, repository, product_cache = create_usecase()
+    command = QuoteOrderCommand(is_self_pickup=False, items=[ProductInOrder(id=repository.products[0].id, quantity=2)])
+
+    first = await usecase.execute(command)
+    assert await usecase.execute(command) is first
+    assert repository.calls == 1
+
+    other = QuoteOrderCommand(is_self_pickup=True, items=command.items)
+    await usecase.execute(other)
+    assert repository.calls == 2
+
+    product_cache.version = '2'
+    assert (await usecase.execute(command)).catalog_version == '2'
+    assert repository.calls == 3
+
+
+async def test_quote_missing_product() -> None:
+    usecase, _, _ = create_usecase()
+
+    with pytest.raises(ManyProductsNotFoundException):
+        await usecase.execute(QuoteOrderCommand(is_self_pickup=False, items=[ProductInOrder(id=uuid4(), quantity=1)]))
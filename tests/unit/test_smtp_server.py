@@ -0,0 +1,127 @@
+import asyncio
+from email.mime.multipart import MIMEMultipart
+from typing import Any
+
+import aiosmtplib
+import pytest
+from src.domain.common.exceptions.base import ApplicationException
+from src.infrastructure.integrations.smtp.server import PooledSMTPServer
+
+
+class FakeSMTPClient:
+    def __init__(self, fail_times: int = 0) -> None:
+        self.is_connected = True
+        self.fail_times = fail_times
+        self.sent: list[MIMEMultipart] = []
+
+    async def send_message(self, message: MIMEMultipart) -> None:
+        if self.fail_times:
+            self.fail_times -= 1
+            self.is_connected = False
+            raise aiosmtplib.SMTPServerDisconnected('Connection lost')
+        self.sent.append(message)
+
+    async def quit(self) -> None:
+        self.is_connected = False
+
+    def close(self) -> None:
+        self.is_connected = False
+
+
+def create_server(clients: list[FakeSMTPClient], **kwargs: Any) -> PooledSMTPServer:
+    server = PooledSMTPServer(
+        host='localhost',
+        port=465,
+        username='test@test.com',
+        password='password',
+        from_address='test@test.com',
+        pool_size=1,
+        **kwargs,
+    )
+
+    async def connect() -> FakeSMTPClient:
+        client = clients.pop(0)
+        server._stats.connects += 1
+        return client
+
+    server._connect = connect  # type: ignore[method-assign, assignment]
+    return server
+
+
+def create_message(server: PooledSMTPServer, to_address: str) -> MIMEMultipart:
+    return server.create_message(content='test', sender_name='test', to_address=to_address, subject='test')
+
+
+async def test_queued_emails_are_sent_in_batches_over_one_connection() -> None:
+    client = FakeSMTPClient()
+    server = create_server([client], batch_size=10)
+    for i in range(5):
+        await server.send_email(create_message(server, f'user{i}@test.com'))
+
+    await server.start()
+    await server.stop()
+
+    assert [message['To'] for message in client.sent] == [f'user{i}@test.com' for i in range(5)]
+    assert server.stats()['connects'] == 1
+    assert server.stats()['batches'] == 1
+    assert server.stats()['sent'] == 5
+
+
+async def test_email_is_retried_after_disconnect() -> None:
+    first_client, second_client = FakeSMTPClient(fail_times=1), FakeSMTPClient()
+    server = create_server([first_client, second_client], min_backoff=0.01)
+
+    await server.start()
+    await server.send_email(create_message(server, 'user@test.com'))
+    await server.stop()
+
+    assert len(second_client.sent) == 1
+    assert server.stats()['retried'] == 1
+    assert server.stats()['failed'] == 0
+
+
+async def test_email_is_dropped_when_queue_is_full() -> None:
+    server = create_server([], queue_size=1)
+
+    await server.send_email(create_message(server, 'first@test.com'))
+    await server.send_email(create_message(server, 'second@test.com'))
+
+    assert server.stats()['queued'] == 1
+    assert server.stats()['dropped'] == 1
+
+
+async def test_unreachable_server_fails_batch_and_queue() -> None:
+    server = PooledSMTPServer(
+        host='127.0.0.1',
+        port=1,
+        username='test@test.com',
+        password='password',
+        from_address='test@test.com',
+        pool_size=1,
+        batch_size=1,
+        connect_attempts=2,
+        min_backoff=0.01,
+    )
+    first = asyncio.ensure_future(server.deliver(create_message(server, 'first@test.com')))
+    second = asyncio.ensure_future(server.deliver(create_message(server, 'second@test.com')))
+
+    await server.start()
+    results = await asyncio.wait_for(asyncio.gather(first, second, return_exceptions=True), timeout=5)
+    await server.stop()
+
+    assert all(isinstance(result, OSError) for result in results)
+    assert server.stats()['connect_errors'] == 2
+    assert server.stats()['failed'] == 2
+
+
+async def test_deliver_timeout_cancels_email() -> None:
+    client = FakeSMTPClient()
+    server = create_server([client], deliver_timeout=0.01)
+
+    with pytest.raises(ApplicationException):
+        await server.deliver(create_message(server, 'user@test.com'))
+    await server.start()
+    await server.stop()
+
+    assert client.sent == []
+    assert server.stats()['timed_out'] == 1
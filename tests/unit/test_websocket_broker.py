@@ -0,0 +1,78 @@
+from typing import Any
+from uuid import UUID, uuid4
+
+import asyncpg
+import pytest
+from src.application.chats.frames import make_message_frame
+from src.domain.chats.entities import MESSAGE_MAX_LENGTH, Message
+from src.domain.chats.exceptions import MessageTooLongException
+from src.infrastructure.persistence.postgresql.listener import MAX_NOTIFY_PAYLOAD_BYTES
+from src.infrastructure.websockets.broker import PostgresWebsocketBroker
+from src.infrastructure.websockets.manager import dump_message
+
+
+def create_broker() -> tuple[PostgresWebsocketBroker, list[tuple[UUID, str]]]:
+    broker = PostgresWebsocketBroker(dsn='postgresql://localhost/test')
+    messages: list[tuple[UUID, str]] = []
+    broker.subscribe(lambda key, message: messages.append((key, message)))
+    return broker, messages
+
+
+def test_notification_is_delivered_to_subscribers() -> None:
+    broker, messages = create_broker()
+    key = uuid4()
+
+    broker._on_notification(None, 1, broker.channel, f'{key}:{{"message":"a:b"}}')
+    broker._on_notification(None, 1, broker.channel, 'not a key:{}')
+
+    assert messages == [(key, '{"message":"a:b"}')]
+    assert broker.stats()['received'] == 1
+
+
+async def test_publish_without_connection_delivers_locally() -> None:
+    broker, messages = create_broker()
+    key = uuid4()
+
+    await broker.publish(key, '{}')
+
+    assert messages == [(key, '{}')]
+    assert broker.stats()['local'] == 1
+
+
+async def test_oversized_message_is_delivered_locally() -> None:
+    broker, messages = create_broker()
+    key = uuid4()
+    message = 'x' * MAX_NOTIFY_PAYLOAD_BYTES
+
+    await broker.publish(key, message)
+
+    assert messages == [(key, message)]
+    assert broker.stats()['oversized'] == 1
+
+
+def test_longest_chat_message_fits_notify() -> None:
+    message = Message.create(user_id=uuid4(), chat_id=uuid4(), content='\x00' * MESSAGE_MAX_LENGTH)
+    payload = f'{message.chat_id}:{dump_message(make_message_frame(message))}'
+
+    assert len(payload.encode()) <= MAX_NOTIFY_PAYLOAD_BYTES
+    with pytest.raises(MessageTooLongException):
+        Message.create(user_id=uuid4(), chat_id=uuid4(), content='x' * (MESSAGE_MAX_LENGTH + 1))
+
+
+class BrokenConnection:
+    def is_closed(self) -> bool:
+        return False
+
+    async def execute(self, query: str, *args: Any) -> None:
+        raise asyncpg.InterfaceError('connection is closed')
+
+
+async def test_publish_with_broken_connection_delivers_locally() -> None:
+    broker, messages = create_broker()
+    broker._connection = BrokenConnection()
+    key = uuid4()
+
+    await broker.publish(key, '{}')
+
+    assert messages == [(key, '{}')]
+    assert broker.stats()['local'] == 1
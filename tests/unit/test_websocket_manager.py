@@ -0,0 +1,172 @@
+import asyncio
+from uuid import uuid4
+
+from src.infrastructure.websockets.manager import (
+    CLOSE_GOING_AWAY,
+    CLOSE_TRY_AGAIN_LATER,
+    PING_MESSAGE,
+    WebsocketManager,
+)
+
+
+class FakeWebsocket:
+    def __init__(self, delay: float = 0) -> None:
+        self.delay = delay
+        self.messages: list[str] = []
+        self.close_code: int | None = None
+
+    async def accept(self) -> None: ...
+
+    async def send_text(self, data: str) -> None:
+        await asyncio.sleep(self.delay)
+        self.messages.append(data)
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_code = code
+
+
+async def test_slow_consumer_does_not_delay_others() -> None:
+    manager = WebsocketManager(send_queue_size=10, send_timeout=5)
+    key = uuid4()
+    fast, slow = FakeWebsocket(), FakeWebsocket(delay=10)
+    await manager.accept_connection(fast, key)  # type: ignore[arg-type]
+    await manager.accept_connection(slow, key)  # type: ignore[arg-type]
+
+    await asyncio.wait_for(manager.send_all(key, {'message': 'test'}), timeout=1)
+    await asyncio.sleep(0.01)
+
+    assert fast.messages == ['{"message":"Connected"}', '{"message":"test"}']
+    assert slow.messages == []
+    await manager.remove_connection(slow, key)  # type: ignore[arg-type]
+    await manager.remove_connection(fast, key)  # type: ignore[arg-type]
+
+
+async def test_slow_consumer_is_evicted() -> None:
+    manager = WebsocketManager(send_queue_size=2, send_timeout=5)
+    key = uuid4()
+    fast, slow = FakeWebsocket(), FakeWebsocket(delay=10)
+    await manager.accept_connection(fast, key)  # type: ignore[arg-type]
+    await manager.accept_connection(slow, key)  # type: ignore[arg-type]
+
+    for index in range(5):
+        await manager.send_all(key, {'index': index})
+        await asyncio.sleep(0.001)
+    await asyncio.sleep(0.01)
+
+    assert slow.close_code == CLOSE_TRY_AGAIN_LATER
+    assert len(fast.messages) == 6
+    assert manager.stats()['connections'] == 1
+    assert manager.stats()['evicted'] == 1
+    await manager.remove_connection(fast, key)  # type: ignore[arg-type]
+
+
+async def test_send_timeout_evicts_connection() -> None:
+    manager = WebsocketManager(send_timeout=0.01)
+    key = uuid4()
+    websocket = FakeWebsocket(delay=1)
+    await manager.accept_connection(websocket, key)  # type: ignore[arg-type]
+
+    # Под нагрузкой таймаут и закрытие могут занять больше нескольких циклов событий
+    for _ in range(100):
+        if websocket.close_code is not None:
+            break
+        await asyncio.sleep(0.01)
+
+    assert websocket.close_code == CLOSE_TRY_AGAIN_LATER
+    assert manager.stats()['failed'] == 1
+    assert key not in manager.connections_map
+
+
+async def test_removed_connections_are_forgotten() -> None:
+    manager = WebsocketManager()
+    key = uuid4()
+    websocket = FakeWebsocket()
+    await manager.accept_connection(websocket, key)  # type: ignore[arg-type]
+
+    await manager.remove_connection(websocket, key)  # type: ignore[arg-type]
+    await manager.remove_connection(websocket, key)  # type: ignore[arg-type]
+    await manager.send_all(key, {'message': 'test'})
+
+    assert manager.connections_map == {}
+    assert manager.stats()['keys'] == 0
+
+
+async def test_disconnect_all() -> None:
+    manager = WebsocketManager()
+    key = uuid4()
+    websockets = [FakeWebsocket(), FakeWebsocket()]
+    for websocket in websockets:
+        await manager.accept_connection(websocket, key)  # type: ignore[arg-type]
+
+    await manager.disconnect_all(key)
+
+    assert all(websocket.close_code == 1000 for websocket in websockets)
+    assert all(websocket.messages[-1] == '{"message":"Connection closed"}' for websocket in websockets)
+    assert manager.connections_map == {}
+
+
+async def test_idle_connection_is_reaped() -> None:
+    manager = WebsocketManager(ping_interval=0.01, idle_timeout=0.03)
+    key = uuid4()
+    idle, active = FakeWebsocket(), FakeWebsocket()
+    await manager.accept_connection(idle, key)  # type: ignore[arg-type]
+    await manager.accept_connection(active, key)  # type: ignore[arg-type]
+
+    await manager.start()
+    for _ in range(10):
+        await asyncio.sleep(0.01)
+        manager.touch(active, key)  # type: ignore[arg-type]
+    await manager.stop()
+
+    assert idle.close_code == CLOSE_GOING_AWAY
+    assert PING_MESSAGE in idle.messages
+    assert PING_MESSAGE in active.messages
+    assert active.close_code is None
+    assert manager.stats()['reaped'] == 1
+    assert manager.stats()['connections'] == 1
+    await manager.remove_connection(active, key)  # type: ignore[arg-type]
+
+
+async def test_idle_connections_are_not_reaped_by_default() -> None:
+    manager = WebsocketManager(ping_interval=0.01)
+    key = uuid4()
+    websocket = FakeWebsocket()
+    await manager.accept_connection(websocket, key)  # type: ignore[arg-type]
+
+    await manager.start()
+    await asyncio.sleep(0.05)
+    await manager.stop()
+
+    assert websocket.close_code is None
+    assert PING_MESSAGE in websocket.messages
+    assert manager.stats()['reaped'] == 0
+    await manager.remove_connection(websocket, key)  # type: ignore[arg-type]
+
+
+async def test_listen_only_connection_is_not_reaped() -> None:
+    manager = WebsocketManager(ping_interval=0.01, idle_timeout=0.02)
+    key = uuid4()
+    websocket = FakeWebsocket()
+    await manager.accept_connection(websocket, key, reap_idle=False)  # type: ignore[arg-type]
+
+    await manager.start()
+    await asyncio.sleep(0.05)
+    await manager.stop()
+
+    assert websocket.close_code is None
+    assert manager.stats()['reaped'] == 0
+    await manager.remove_connection(websocket, key)  # type: ignore[arg-type]
+
+
+async def test_send_buffer_size_evicts_connection() -> None:
+    manager = WebsocketManager(send_buffer_size=100)
+    key = uuid4()
+    websocket = FakeWebsocket(delay=10)
+    await manager.accept_connection(websocket, key)  # type: ignore[arg-type]
+
+    await manager.send_all(key, {'message': 'x' * 100})
+    await asyncio.sleep(0.01)
+
+    assert websocket.close_code == CLOSE_TRY_AGAIN_LATER
+    assert manager.stats()['evicted'] == 1
+    assert manager.connections_map == {}